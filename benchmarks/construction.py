@@ -0,0 +1,49 @@
+"""Benchmark: model construction time for large populations.
+
+Run with ``python benchmarks/construction.py``. Both backends build their
+population in bulk (``BaseModel.spawn_agents`` for the agent backend, plain
+array draws for the array backend). The budget for one million citizens is
+``BUDGET_SECONDS`` per backend; the agent backend takes about 2 s on a
+current laptop core, the array backend well under 0.1 s.
+"""
+
+from __future__ import annotations
+
+import time
+
+from social_sim.models.basic_economy import EconomyParams
+from social_sim.models.distributions import Distribution
+from social_sim.models.factory import create_economy_model
+
+SIZES = [10_000, 100_000, 1_000_000]
+BUDGET_SECONDS = {"agent": 8.0, "array": 0.5}
+
+
+def time_construction(num_agents: int, backend: str) -> float:
+    """Return the wall-clock seconds to build one model."""
+    params = EconomyParams(
+        num_agents=num_agents,
+        seed=42,
+        backend=backend,
+        wealth_distribution=Distribution(kind="lognormal", mu=2.0, sigma=1.0),
+    )
+    start = time.perf_counter()
+    create_economy_model(params)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print(f"{'backend':>8} {'agents':>10} {'seconds':>10} {'us/agent':>10}")
+    for backend in BUDGET_SECONDS:
+        for num_agents in SIZES:
+            seconds = time_construction(num_agents, backend)
+            print(
+                f"{backend:>8} {num_agents:>10} {seconds:>10.3f}"
+                f" {seconds / num_agents * 1e6:>10.2f}"
+            )
+        if seconds > BUDGET_SECONDS[backend]:
+            print(f"  over budget: {BUDGET_SECONDS[backend]:.1f} s at {SIZES[-1]} agents")
+
+
+if __name__ == "__main__":
+    main()
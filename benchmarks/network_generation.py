@@ -0,0 +1,34 @@
+"""Benchmark: trade-network generation at national scale.
+
+Run with ``python benchmarks/network_generation.py``. Every generator builds
+its CSR arrays with whole-array operations; at one million nodes and mean
+degree 4 each takes well under a second and holds about 40 MB.
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from social_sim.models.network import NetworkParams
+
+NUM_NODES = 1_000_000
+KINDS = ["erdos_renyi", "small_world", "scale_free"]
+
+
+def main() -> None:
+    print(f"{'network':>12} {'seconds':>8} {'edges':>10} {'max deg':>8} {'MB':>6}")
+    for kind in KINDS:
+        rng = np.random.default_rng(42)
+        start = time.perf_counter()
+        graph = NetworkParams(kind=kind, mean_degree=4).build(NUM_NODES, rng)
+        seconds = time.perf_counter() - start
+        print(
+            f"{kind:>12} {seconds:>8.2f} {graph.num_edges:>10}"
+            f" {int(graph.degrees().max()):>8} {graph.nbytes / 1e6:>6.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
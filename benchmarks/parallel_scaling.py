@@ -0,0 +1,50 @@
+"""Benchmark: parallel backend step time as a function of worker count.
+
+Run with ``python benchmarks/parallel_scaling.py``. Each configuration steps
+a population of ``NUM_AGENTS`` with income, tax and UBI enabled; per-step
+time should fall roughly in proportion to the workers, up to the number of
+physical cores. Collection is manual so the timing is the step alone.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+from social_sim.core.model import CollectionPolicy
+from social_sim.models.basic_economy import EconomyParams, IncomeParams, TaxParams
+from social_sim.models.parallel_economy import ParallelEconomyModel
+
+NUM_AGENTS = 4_000_000
+STEPS = 5
+
+
+def time_step(workers: int) -> float:
+    """Return the mean wall-clock seconds per model step."""
+    params = EconomyParams(
+        num_agents=NUM_AGENTS,
+        seed=42,
+        backend="parallel",
+        workers=workers,
+        income=IncomeParams(enabled=True),
+        tax=TaxParams(enabled=True, ubi_enabled=True),
+    )
+    with ParallelEconomyModel(params) as model:
+        model.collection = CollectionPolicy(mode="manual")
+        model.step()
+        start = time.perf_counter()
+        model.run(steps=STEPS)
+        return (time.perf_counter() - start) / STEPS
+
+
+def main() -> None:
+    cores = os.cpu_count() or 1
+    print(f"{'workers':>8} {'ms/step':>10}")
+    workers = 1
+    while workers <= cores:
+        print(f"{workers:>8} {time_step(workers) * 1e3:>10.1f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
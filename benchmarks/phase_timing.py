@@ -0,0 +1,51 @@
+"""Benchmark: time spent in each step phase of the economy models.
+
+Run with ``python benchmarks/phase_timing.py``. Every policy phase is
+enabled and a ``PhaseTimings`` hook on the model's pipeline totals the time
+per phase, for both the agent and the array backend.
+"""
+
+from __future__ import annotations
+
+from social_sim.core.pipeline import PhaseTimings
+from social_sim.models.basic_economy import (
+    DisasterParams,
+    EconomyParams,
+    EducationParams,
+    IncomeParams,
+    TaxParams,
+)
+from social_sim.models.factory import create_economy_model
+
+NUM_AGENTS = 10_000
+STEPS = 10
+
+
+def time_phases(backend: str) -> dict[str, float]:
+    """Return the mean milliseconds per step of each enabled phase."""
+    params = EconomyParams(
+        num_agents=NUM_AGENTS,
+        seed=42,
+        backend=backend,
+        income=IncomeParams(enabled=True),
+        tax=TaxParams(enabled=True, ubi_enabled=True),
+        disaster=DisasterParams(enabled=True),
+        education=EducationParams(enabled=True),
+    )
+    model = create_economy_model(params)
+    model.collection.mode = "manual"
+    timings = PhaseTimings()
+    model.pipeline.on_phase = timings
+    model.run(steps=STEPS)
+    return {name: seconds * 1e3 for name, seconds in timings.mean_seconds().items()}
+
+
+def main() -> None:
+    for backend in ("agent", "array"):
+        print(f"{backend} backend, {NUM_AGENTS} agents")
+        for name, ms in time_phases(backend).items():
+            print(f"  {name:>18} {ms:>10.3f} ms/step")
+
+
+if __name__ == "__main__":
+    main()
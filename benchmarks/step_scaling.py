@@ -0,0 +1,33 @@
+"""Benchmark: model step time as a function of population size.
+
+Run with ``python benchmarks/step_scaling.py``. With O(1) partner sampling
+the time per agent should stay roughly flat as ``num_agents`` grows.
+"""
+
+from __future__ import annotations
+
+import time
+
+from social_sim.models.basic_economy import BasicEconomyModel, EconomyParams
+
+SIZES = [500, 1_000, 2_000, 4_000, 8_000]
+STEPS = 5
+
+
+def time_step(num_agents: int, steps: int = STEPS) -> float:
+    """Return the mean wall-clock seconds per model step."""
+    model = BasicEconomyModel(EconomyParams(num_agents=num_agents, seed=42))
+    start = time.perf_counter()
+    model.run(steps=steps)
+    return (time.perf_counter() - start) / steps
+
+
+def main() -> None:
+    print(f"{'agents':>8} {'ms/step':>10} {'us/agent':>10}")
+    for num_agents in SIZES:
+        seconds = time_step(num_agents)
+        print(f"{num_agents:>8} {seconds * 1e3:>10.2f} {seconds / num_agents * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
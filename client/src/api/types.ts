@@ -6,6 +6,7 @@ export interface TaxBracketInput {
 export interface PolicySet {
   tax_enabled: boolean
   tax_brackets: TaxBracketInput[]
+  tax_mode: 'flat' | 'marginal'
   ubi_enabled: boolean
   income_enabled: boolean
   base_income: number
@@ -32,6 +33,12 @@ export interface TurnState {
   agents_in_poverty: number
   agents_bankrupt: number
   wealth_distribution: number[]
+  theil: number
+  atkinson: number
+  palma: number
+  top_1_share: number
+  top_10_share: number
+  wealth_percentiles: Record<string, number>
 }
 
 export interface Scores {
@@ -70,6 +77,7 @@ export const DEFAULT_POLICIES: PolicySet = {
     { threshold: 30, rate: 0.2 },
     { threshold: 50, rate: 0.3 },
   ],
+  tax_mode: 'flat',
   ubi_enabled: false,
   income_enabled: true,
   base_income: 1.0,
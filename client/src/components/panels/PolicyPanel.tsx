@@ -70,6 +70,14 @@ export function PolicyPanel({ policies, onChange, onAdvanceTurn, isLoading, isFi
                 </div>
               ))}
             </div>
+            <label className="policy-toggle">
+              <input
+                type="checkbox"
+                checked={policies.tax_mode === 'marginal'}
+                onChange={(e) => onChange({ tax_mode: e.target.checked ? 'marginal' : 'flat' })}
+              />
+              Marginal rates
+            </label>
             <label className="policy-toggle">
               <input
                 type="checkbox"
@@ -2,16 +2,27 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import math
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Self
 
-from social_sim.core.agent import BaseAgent
+import numpy as np
+
+from social_sim.core.agent import BaseAgent, column_values
 
 if TYPE_CHECKING:
     from social_sim.core.model import BaseModel
 
 
 class PersonAgent(BaseAgent):
-    """An agent representing an individual person."""
+    """An agent representing an individual person.
+
+    ``wealth``, ``happiness`` and ``productivity`` are properties that report
+    every change to ``model.aggregates``, so population totals and means stay
+    current without rescanning the agents.
+    """
+
+    __slots__ = ("_wealth", "_happiness", "_productivity")
 
     def __init__(
         self,
@@ -20,17 +31,95 @@ class PersonAgent(BaseAgent):
         happiness: float = 0.5,
         productivity: float = 1.0,
     ) -> None:
+        self._wealth = 0.0
+        self._happiness = 0.0
+        self._productivity = 0.0
         super().__init__(model, wealth=wealth)
         self.happiness = happiness
         self.productivity = productivity
+        model.aggregates.join()
+
+    @classmethod
+    def build_many(
+        cls,
+        model: BaseModel,
+        unique_ids: Sequence[int],
+        wealth: Sequence[float] | np.ndarray | None = None,
+        happiness: Sequence[float] | np.ndarray | None = None,
+        productivity: Sequence[float] | np.ndarray | None = None,
+    ) -> list[Self]:
+        """Build unregistered people and add their totals to the aggregates."""
+        n = len(unique_ids)
+        wealth_values = column_values(wealth, 10.0, n)
+        happiness_values = column_values(happiness, 0.5, n)
+        productivity_values = column_values(productivity, 1.0, n)
+
+        new = cls.__new__
+        agents = []
+        for unique_id, w, h, p in zip(
+            unique_ids, wealth_values, happiness_values, productivity_values
+        ):
+            agent = new(cls)
+            agent.model = model
+            agent.unique_id = unique_id
+            agent.pos = None
+            agent._connections = None
+            agent._wealth = w
+            agent._happiness = h
+            agent._productivity = p
+            agents.append(agent)
+
+        model.aggregates.join_many(
+            n,
+            wealth=math.fsum(wealth_values),
+            happiness=math.fsum(happiness_values),
+            productivity=math.fsum(productivity_values),
+        )
+        return agents
+
+    @property
+    def wealth(self) -> float:
+        return self._wealth
+
+    @wealth.setter
+    def wealth(self, value: float) -> None:
+        self.model.aggregates.sums["wealth"] += value - self._wealth
+        self._wealth = value
+
+    @property
+    def happiness(self) -> float:
+        return self._happiness
+
+    @happiness.setter
+    def happiness(self, value: float) -> None:
+        self.model.aggregates.sums["happiness"] += value - self._happiness
+        self._happiness = value
+
+    @property
+    def productivity(self) -> float:
+        return self._productivity
+
+    @productivity.setter
+    def productivity(self, value: float) -> None:
+        self.model.aggregates.sums["productivity"] += value - self._productivity
+        self._productivity = value
+
+    def remove(self) -> None:
+        """Remove the person from the model and from the tracked aggregates."""
+        if self in self.model.agents:
+            self.model.aggregates.leave(
+                wealth=self.wealth,
+                happiness=self.happiness,
+                productivity=self.productivity,
+            )
+        super().remove()
 
     def step(self) -> None:
         """Execute one step: find a partner and potentially trade."""
-        others = [a for a in self.model.agents if a.unique_id != self.unique_id]
-        if not others:
+        partner = self.model.sample_partner(self)
+        if partner is None:
             return
 
-        partner = self.random.choice(others)
         self.interact(partner)
         mean_wealth = getattr(self.model, "mean_wealth", None)
         self._update_happiness(mean_wealth)
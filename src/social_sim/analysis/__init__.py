@@ -0,0 +1,17 @@
+"""Analysis of simulation outputs."""
+
+from .bands import EnsembleBands, StreamingQuantile
+from .inequality import INEQUALITY_REPORTERS, WealthDistribution, WealthIndex
+from .sensitivity import MorrisIndices, SobolIndices, morris_indices, sobol_indices
+
+__all__ = [
+    "EnsembleBands",
+    "INEQUALITY_REPORTERS",
+    "MorrisIndices",
+    "SobolIndices",
+    "StreamingQuantile",
+    "WealthDistribution",
+    "WealthIndex",
+    "morris_indices",
+    "sobol_indices",
+]
@@ -0,0 +1,170 @@
+"""Streaming mean, spread and quantile bands over many runs."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+DEFAULT_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+
+class StreamingQuantile:
+    """The P² estimate of one quantile, kept for many cells at once.
+
+    Every cell holds five markers (min, p/2, p, (1+p)/2, max) that move
+    with each observation, so memory stays at five heights and positions
+    per cell however many values arrive (Jain & Chlamtac's P² algorithm).
+    Up to five values per cell the estimate is exact. ``update`` takes one
+    observation per cell and a mask of the cells that receive one.
+    """
+
+    def __init__(self, cells: int, q: float) -> None:
+        if not 0 <= q <= 1:
+            raise ValueError("q must lie in [0, 1]")
+        self.q = q
+        self.count = np.zeros(cells, dtype=np.int64)
+        self.heights = np.zeros((cells, 5))
+        self.positions = np.tile(np.arange(1.0, 6.0), (cells, 1))
+        self.desired = np.tile(1 + 4 * np.array([0, q / 2, q, (1 + q) / 2, 1]), (cells, 1))
+        self._increments = np.array([0, q / 2, q, (1 + q) / 2, 1])
+
+    def update(self, values: np.ndarray, mask: np.ndarray) -> None:
+        filling = mask & (self.count < 5)
+        if filling.any():
+            cells = np.flatnonzero(filling)
+            self.heights[cells, self.count[cells]] = values[cells]
+            self.count[cells] += 1
+            full = cells[self.count[cells] == 5]
+            self.heights[full] = np.sort(self.heights[full], axis=1)
+
+        cells = np.flatnonzero(mask & ~filling)
+        if not len(cells):
+            return
+        x = values[cells]
+        q = self.heights[cells]
+        n = self.positions[cells]
+        q[:, 0] = np.minimum(q[:, 0], x)
+        q[:, 4] = np.maximum(q[:, 4], x)
+        cell = np.clip((x[:, None] >= q[:, 1:4]).sum(axis=1), 0, 3)
+        n += np.arange(5) > cell[:, None]
+        desired = self.desired[cells] + self._increments
+        for i in (1, 2, 3):
+            d = desired[:, i] - n[:, i]
+            move = ((d >= 1) & (n[:, i + 1] - n[:, i] > 1)) | (
+                (d <= -1) & (n[:, i - 1] - n[:, i] < -1)
+            )
+            if not move.any():
+                continue
+            s = np.sign(d[move])
+            qi, qlo, qhi = q[move, i], q[move, i - 1], q[move, i + 1]
+            ni, nlo, nhi = n[move, i], n[move, i - 1], n[move, i + 1]
+            parabolic = qi + s / (nhi - nlo) * (
+                (ni - nlo + s) * (qhi - qi) / (nhi - ni)
+                + (nhi - ni - s) * (qi - qlo) / (ni - nlo)
+            )
+            neighbour = np.where(s > 0, qhi, qlo)
+            linear = qi + s * (neighbour - qi) / (np.where(s > 0, nhi, nlo) - ni)
+            q[move, i] = np.where((qlo < parabolic) & (parabolic < qhi), parabolic, linear)
+            n[move, i] += s
+        self.heights[cells] = q
+        self.positions[cells] = n
+        self.desired[cells] = desired
+        self.count[cells] += 1
+
+    def estimate(self) -> np.ndarray:
+        """Current quantile of every cell; NaN where no value arrived."""
+        result = self.heights[:, 2].copy()
+        for count in range(1, 6):
+            cells = np.flatnonzero(self.count == count)
+            if len(cells):
+                result[cells] = np.quantile(self.heights[cells, :count], self.q, axis=1)
+        result[self.count == 0] = np.nan
+        return result
+
+
+class EnsembleBands:
+    """Per-step mean, standard deviation and quantiles of reporters over runs.
+
+    Each run adds its ``steps x reporters`` history through ``add``; only
+    running sums (Welford's mean and squared deviations) and the P² markers
+    of every quantile are kept, so memory does not grow with the number of
+    runs. Runs may stop at different steps or skip steps: every statistic
+    counts only the runs that recorded that step, and non-finite values
+    are left out.
+    """
+
+    def __init__(
+        self,
+        reporters: Sequence[str],
+        steps: int,
+        quantiles: Sequence[float] = DEFAULT_QUANTILES,
+    ) -> None:
+        self.reporters = tuple(reporters)
+        self.steps = steps
+        self.quantiles = tuple(quantiles)
+        shape = (steps + 1, len(self.reporters))
+        self.runs = 0
+        self.count = np.zeros(shape, dtype=np.int64)
+        self._mean = np.zeros(shape)
+        self._m2 = np.zeros(shape)
+        cells = shape[0] * shape[1]
+        self._quantiles = [StreamingQuantile(cells, q) for q in self.quantiles]
+
+    def add(self, steps: np.ndarray, values: np.ndarray) -> None:
+        """Fold one run in: ``values[i, j]`` is reporter ``j`` at ``steps[i]``."""
+        values = np.asarray(values, dtype=float)
+        dense = np.full(self.count.shape, np.nan)
+        dense[np.asarray(steps)] = values
+        mask = np.isfinite(dense)
+        self.count += mask
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = np.where(mask, dense - self._mean, 0.0)
+            self._mean += np.where(mask, delta / np.maximum(self.count, 1), 0.0)
+            self._m2 += np.where(mask, delta * (dense - self._mean), 0.0)
+        flat, flat_mask = dense.ravel(), mask.ravel()
+        for quantile in self._quantiles:
+            quantile.update(flat, flat_mask)
+        self.runs += 1
+
+    def recorded_steps(self) -> np.ndarray:
+        """Steps recorded by at least one run."""
+        return np.flatnonzero(self.count.any(axis=1))
+
+    def _column(self, values: np.ndarray, reporter: str) -> np.ndarray:
+        return values[self.recorded_steps(), self.reporters.index(reporter)]
+
+    def mean(self, reporter: str) -> np.ndarray:
+        with np.errstate(invalid="ignore"):
+            mean = np.where(self.count > 0, self._mean, np.nan)
+        return self._column(mean, reporter)
+
+    def std(self, reporter: str) -> np.ndarray:
+        """Sample standard deviation per recorded step (NaN below two runs)."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            variance = np.where(self.count > 1, self._m2 / (self.count - 1), np.nan)
+        return self._column(np.sqrt(variance), reporter)
+
+    def quantile(self, reporter: str, q: float) -> np.ndarray:
+        """Estimated quantile ``q`` (one of ``quantiles``) per recorded step."""
+        estimate = self._quantiles[self.quantiles.index(q)].estimate()
+        return self._column(estimate.reshape(self.count.shape), reporter)
+
+    def confidence_interval(self, reporter: str, z: float = 1.96) -> tuple[np.ndarray, np.ndarray]:
+        """Normal-approximation interval for the mean, ``mean ± z * std / sqrt(n)``."""
+        mean = self.mean(reporter)
+        n = self._column(self.count, reporter)
+        half = z * self.std(reporter) / np.sqrt(n)
+        return mean - half, mean + half
+
+    def summary(self, reporter: str) -> dict[str, np.ndarray]:
+        """Every band of one reporter keyed by name (``mean``, ``std``, ``q50``, ...)."""
+        bands = {
+            "step": self.recorded_steps(),
+            "runs": self._column(self.count, reporter),
+            "mean": self.mean(reporter),
+            "std": self.std(reporter),
+        }
+        for q in self.quantiles:
+            bands[f"q{100 * q:g}"] = self.quantile(reporter, q)
+        return bands
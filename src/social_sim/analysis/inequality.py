@@ -0,0 +1,193 @@
+"""Inequality metrics computed from one sorted wealth buffer."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+PERCENTILES = (10, 25, 50, 75, 90)
+
+# Reporter names produced by ``WealthDistribution.summary`` besides "Gini".
+INEQUALITY_REPORTERS = (
+    "Theil",
+    "Atkinson",
+    "Palma",
+    "Top 1% Share",
+    "Top 10% Share",
+    "Wealth P10",
+    "Wealth P25",
+    "Wealth P50",
+    "Wealth P75",
+    "Wealth P90",
+)
+
+
+class WealthDistribution:
+    """A wealth vector sorted once, with every metric read from that buffer.
+
+    Sorting dominates the cost of inequality measurement, so all metrics
+    here (Gini, Lorenz curve, Theil, Atkinson, Palma, top shares,
+    percentiles, bin counts) reuse ``self.sorted`` and its cumulative sum
+    instead of sorting again.
+    """
+
+    def __init__(self, wealth: np.ndarray | Sequence[float]) -> None:
+        self.sorted = np.sort(np.asarray(wealth, dtype=float))
+        self.n = len(self.sorted)
+        self.cumulative = np.cumsum(self.sorted)
+        self.total = float(self.cumulative[-1]) if self.n else 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.n if self.n else 0.0
+
+    def gini(self) -> float:
+        """Gini coefficient of the distribution."""
+        if self.n == 0 or self.total == 0:
+            return 0.0
+        gini = (self.n + 1 - 2 * np.sum(self.cumulative) / self.total) / self.n
+        return float(max(0.0, gini))
+
+    def lorenz(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return Lorenz curve points as population and wealth shares in [0, 1]."""
+        population_share = np.arange(self.n + 1) / max(self.n, 1)
+        wealth_share = np.zeros(self.n + 1)
+        if self.total != 0:
+            wealth_share[1:] = self.cumulative / self.total
+        return population_share, wealth_share
+
+    def bottom_share(self, fraction: float) -> float:
+        """Share of total wealth held by the poorest ``fraction`` of people."""
+        if self.n == 0 or self.total == 0:
+            return 0.0
+        population_share, wealth_share = self.lorenz()
+        return float(np.interp(fraction, population_share, wealth_share))
+
+    def top_share(self, fraction: float) -> float:
+        """Share of total wealth held by the richest ``fraction`` of people."""
+        if self.n == 0 or self.total == 0:
+            return 0.0
+        return 1.0 - self.bottom_share(1.0 - fraction)
+
+    def palma(self) -> float:
+        """Wealth share of the top 10% divided by that of the bottom 40%."""
+        bottom = self.bottom_share(0.4)
+        if bottom <= 0:
+            return float("inf") if self.top_share(0.1) > 0 else 0.0
+        return self.top_share(0.1) / bottom
+
+    def theil(self) -> float:
+        """Theil T index; zero wealth contributes nothing (its limit)."""
+        mean = self.mean
+        if mean <= 0:
+            return 0.0
+        ratios = np.clip(self.sorted, 0.0, None) / mean
+        positive = ratios[ratios > 0]
+        return float(np.sum(positive * np.log(positive)) / self.n)
+
+    def atkinson(self, epsilon: float = 0.5) -> float:
+        """Atkinson index with inequality aversion ``epsilon``."""
+        mean = self.mean
+        if mean <= 0:
+            return 0.0
+        ratios = np.clip(self.sorted, 0.0, None) / mean
+        if epsilon == 1.0:
+            if np.any(ratios == 0):
+                return 1.0
+            return float(1.0 - np.exp(np.mean(np.log(ratios))))
+        if epsilon > 1.0 and np.any(ratios == 0):
+            return 1.0
+        power = 1.0 - epsilon
+        return float(1.0 - np.mean(ratios ** power) ** (1.0 / power))
+
+    def percentiles(self, qs: Sequence[float] = PERCENTILES) -> np.ndarray:
+        """Linear-interpolated percentiles, matching ``np.percentile``."""
+        if self.n == 0:
+            return np.zeros(len(qs))
+        positions = np.asarray(qs, dtype=float) / 100.0 * (self.n - 1)
+        return np.interp(positions, np.arange(self.n), self.sorted)
+
+    def count_below(self, value: float) -> int:
+        """Number of people with wealth strictly below ``value``."""
+        return int(np.searchsorted(self.sorted, value, side="left"))
+
+    def count_at_most(self, value: float) -> int:
+        """Number of people with wealth at or below ``value``."""
+        return int(np.searchsorted(self.sorted, value, side="right"))
+
+    def histogram(self, edges: Sequence[float]) -> list[int]:
+        """Counts per half-open bin ``[edges[i], edges[i + 1])``."""
+        positions = np.searchsorted(self.sorted, edges, side="left")
+        return np.diff(positions).astype(int).tolist()
+
+    def summary(self) -> dict[str, float]:
+        """Return every scalar metric keyed by its reporter name."""
+        p10, p25, p50, p75, p90 = self.percentiles(PERCENTILES)
+        return {
+            "Gini": self.gini(),
+            "Theil": self.theil(),
+            "Atkinson": self.atkinson(),
+            "Palma": self.palma(),
+            "Top 1% Share": self.top_share(0.01),
+            "Top 10% Share": self.top_share(0.10),
+            "Wealth P10": float(p10),
+            "Wealth P25": float(p25),
+            "Wealth P50": float(p50),
+            "Wealth P75": float(p75),
+            "Wealth P90": float(p90),
+        }
+
+
+class WealthIndex(WealthDistribution):
+    """A ``WealthDistribution`` that also knows which agent holds each value.
+
+    Built from wealth by agent slot (``unique_id - 1``; NaN for empty
+    slots), it keeps the slots in wealth order and each slot's position in
+    that order. After the one sort, the richest ``k`` agents cost O(k),
+    band counts and the rank of a wealth value cost O(log n), and an
+    agent's rank is a lookup plus one binary search. Ties keep slot order.
+    """
+
+    def __init__(self, wealth_by_slot: np.ndarray | Sequence[float]) -> None:
+        wealth_by_slot = np.asarray(wealth_by_slot, dtype=float)
+        present = np.flatnonzero(~np.isnan(wealth_by_slot))
+        order = np.argsort(wealth_by_slot[present], kind="stable")
+        self.slots = present[order]
+        self.sorted = wealth_by_slot[self.slots]
+        self.n = len(self.sorted)
+        self.cumulative = np.cumsum(self.sorted)
+        self.total = float(self.cumulative[-1]) if self.n else 0.0
+        self._position = np.full(len(wealth_by_slot), -1, dtype=np.int64)
+        self._position[self.slots] = np.arange(self.n)
+
+    def top(self, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return the slots and wealth of the ``k`` richest agents, richest first."""
+        if k < 0:
+            raise ValueError("k must not be negative")
+        first = max(self.n - k, 0)
+        return self.slots[first:][::-1], self.sorted[first:][::-1]
+
+    def count_between(self, low: float, high: float) -> int:
+        """Number of agents with wealth in ``[low, high)``."""
+        if high <= low:
+            return 0
+        return self.count_below(high) - self.count_below(low)
+
+    def wealth_of(self, slot: int) -> float:
+        """Wealth of the agent in ``slot``."""
+        return float(self.sorted[self._lookup(slot)])
+
+    def rank(self, slot: int) -> int:
+        """Number of agents strictly poorer than the agent in ``slot``."""
+        return self.count_below(self.sorted[self._lookup(slot)])
+
+    def percentile_rank(self, slot: int) -> float:
+        """Percentage of agents strictly poorer than the agent in ``slot``."""
+        return 100.0 * self.rank(slot) / self.n
+
+    def _lookup(self, slot: int) -> int:
+        """Return the sorted position of ``slot``, or raise if it holds no agent."""
+        if not 0 <= slot < len(self._position) or self._position[slot] < 0:
+            raise ValueError(f"no agent in slot {slot}")
+        return int(self._position[slot])
@@ -0,0 +1,180 @@
+"""Morris screening and Sobol' indices from sample designs over the unit cube.
+
+Designs are generated in ``[0, 1]^k`` and scaled to parameter ranges by the
+caller; index functions take the model outputs in design order.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from pydantic import BaseModel as PydanticModel
+
+
+class MorrisDesign(PydanticModel):
+    """``trajectories`` one-at-a-time paths of ``k + 1`` points each.
+
+    Row ``t * (k + 1) + j + 1`` differs from the row before it only in
+    factor ``changed[t, j]``, by ``steps[t, j]`` (plus or minus ``delta``).
+    """
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    points: np.ndarray
+    changed: np.ndarray
+    steps: np.ndarray
+    delta: float
+
+
+def morris_design(
+    factors: int,
+    trajectories: int,
+    levels: int = 4,
+    rng: np.random.Generator | None = None,
+) -> MorrisDesign:
+    """Sample Morris trajectories on a ``levels``-point grid per factor.
+
+    The step is ``delta = levels / (2 (levels - 1))``; each trajectory starts
+    at a random grid point from which every factor can move by ``delta``
+    in a random direction, and moves the factors in a random order.
+    """
+    if levels < 2 or levels % 2:
+        raise ValueError("levels must be an even number of at least 2")
+    if factors < 1 or trajectories < 2:
+        raise ValueError("need at least one factor and two trajectories")
+    rng = rng or np.random.default_rng()
+    delta = levels / (2 * (levels - 1))
+    grid = np.arange(levels // 2) / (levels - 1)
+    low = rng.choice(grid, size=(trajectories, factors))
+    direction = rng.choice([-1.0, 1.0], size=(trajectories, factors))
+    start = np.where(direction > 0, low, low + delta)
+    order = np.argsort(rng.random((trajectories, factors)), axis=1)
+    steps = np.take_along_axis(direction, order, axis=1) * delta
+
+    points = np.empty((trajectories, factors + 1, factors))
+    points[:, 0] = start
+    for j in range(factors):
+        points[:, j + 1] = points[:, j]
+        rows = np.arange(trajectories)
+        points[rows, j + 1, order[:, j]] += steps[:, j]
+    return MorrisDesign(
+        points=points.reshape(-1, factors), changed=order, steps=steps, delta=delta
+    )
+
+
+class MorrisIndices(PydanticModel):
+    """Elementary-effect statistics of one output, per factor, in unit-cube scale.
+
+    ``mu_star`` (mean absolute effect) ranks influence; ``sigma`` flags
+    non-linearity or interactions; ``mu_star_ci`` is a bootstrap interval.
+    """
+
+    parameters: list[str]
+    mu: list[float]
+    mu_star: list[float]
+    sigma: list[float]
+    mu_star_ci: list[tuple[float, float]]
+
+
+def morris_indices(
+    design: MorrisDesign,
+    outputs: np.ndarray,
+    parameters: list[str],
+    resamples: int = 1000,
+    confidence: float = 0.95,
+    rng: np.random.Generator | None = None,
+) -> MorrisIndices:
+    """Compute elementary effects from outputs in design order."""
+    trajectories, factors = design.changed.shape
+    y = np.asarray(outputs, dtype=float).reshape(trajectories, factors + 1)
+    effects = np.empty((trajectories, factors))
+    rows = np.arange(trajectories)[:, None]
+    effects[rows, design.changed] = np.diff(y, axis=1) / design.steps
+
+    rng = rng or np.random.default_rng()
+    sample = rng.integers(0, trajectories, size=(resamples, trajectories))
+    boot = np.abs(effects)[sample].mean(axis=1)
+    tail = (1 - confidence) / 2
+    low, high = np.quantile(boot, [tail, 1 - tail], axis=0)
+    return MorrisIndices(
+        parameters=list(parameters),
+        mu=effects.mean(axis=0).tolist(),
+        mu_star=np.abs(effects).mean(axis=0).tolist(),
+        sigma=effects.std(axis=0, ddof=1).tolist(),
+        mu_star_ci=list(zip(low.tolist(), high.tolist())),
+    )
+
+
+def saltelli_design(
+    factors: int,
+    samples: int,
+    rng: np.random.Generator | None = None,
+) -> np.ndarray:
+    """Stack the Saltelli blocks ``A``, ``B`` and every ``AB_i``, ``samples`` rows each.
+
+    ``AB_i`` is ``A`` with column ``i`` taken from ``B``; the design has
+    ``samples * (factors + 2)`` rows.
+    """
+    if samples < 2:
+        raise ValueError("samples must be at least 2")
+    rng = rng or np.random.default_rng()
+    a = rng.random((samples, factors))
+    b = rng.random((samples, factors))
+    blocks = [a, b]
+    for i in range(factors):
+        ab = a.copy()
+        ab[:, i] = b[:, i]
+        blocks.append(ab)
+    return np.vstack(blocks)
+
+
+class SobolIndices(PydanticModel):
+    """First-order and total Sobol' indices of one output, with bootstrap intervals."""
+
+    parameters: list[str]
+    first_order: list[float]
+    first_order_ci: list[tuple[float, float]]
+    total: list[float]
+    total_ci: list[tuple[float, float]]
+
+
+def _sobol(f_a: np.ndarray, f_b: np.ndarray, f_ab: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Saltelli (2010) first-order and Jansen total estimators.
+
+    The arrays may carry leading batch axes; samples run along the
+    second-to-last axis of ``f_ab`` (``... x samples x factors``) and the
+    last axis of ``f_a`` and ``f_b``.
+    """
+    variance = np.var(np.concatenate([f_a, f_b], axis=-1), axis=-1)[..., None]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        first = np.mean(f_b[..., None] * (f_ab - f_a[..., None]), axis=-2) / variance
+        total = 0.5 * np.mean((f_a[..., None] - f_ab) ** 2, axis=-2) / variance
+    return first, total
+
+
+def sobol_indices(
+    outputs: np.ndarray,
+    parameters: list[str],
+    resamples: int = 1000,
+    confidence: float = 0.95,
+    rng: np.random.Generator | None = None,
+) -> SobolIndices:
+    """Compute Sobol' indices from outputs of a ``saltelli_design``, in design order."""
+    factors = len(parameters)
+    y = np.asarray(outputs, dtype=float).reshape(factors + 2, -1)
+    f_a, f_b, f_ab = y[0], y[1], y[2:].T
+    first, total = _sobol(f_a, f_b, f_ab)
+
+    rng = rng or np.random.default_rng()
+    samples = len(f_a)
+    sample = rng.integers(0, samples, size=(resamples, samples))
+    boot_first, boot_total = _sobol(f_a[sample], f_b[sample], f_ab[sample])
+    tail = (1 - confidence) / 2
+    first_ci = np.nanquantile(boot_first, [tail, 1 - tail], axis=0)
+    total_ci = np.nanquantile(boot_total, [tail, 1 - tail], axis=0)
+    return SobolIndices(
+        parameters=list(parameters),
+        first_order=first.tolist(),
+        first_order_ci=list(zip(*first_ci.tolist())),
+        total=total.tolist(),
+        total_ci=list(zip(*total_ci.tolist())),
+    )
@@ -0,0 +1,247 @@
+"""Headless batch runner: ``social-sim scenarios.json -j 8 > results.ndjson``.
+
+Reads a scenario file, runs every scenario (in ``-j`` worker processes) and
+writes one JSON object per line to stdout as results come in: a
+``"scenario"`` record when a scenario finishes and, with ``--per-step``,
+``"step"`` records while it runs. Records arrive in completion order and
+carry the scenario's ``index``; a scenario that raises yields an
+``"error"`` record instead. With ``--catalog``, runs already in the
+experiment catalog are reused. This module only needs the models, not the
+web stack.
+
+The scenario file is either a list of scenarios or an object with the
+fields of ``SweepSpec``, where ``scenarios`` may stand for
+``variations``::
+
+    {"base": {"num_agents": 500, "seed": 1}, "steps": 200,
+     "scenarios": [{"name": "laissez-faire"},
+                   {"name": "ubi", "tax": {"enabled": true, "ubi_enabled": true}}],
+     "grid": {"disaster.probability": [0.0, 0.05]}}
+
+Each scenario overrides ``base`` with nested groups or dotted paths.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import multiprocessing as mp
+import queue
+import sys
+import time
+from collections.abc import Callable, Sequence
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, TextIO
+
+from pydantic import BaseModel as PydanticModel
+
+from social_sim.core.model import BaseModel
+from social_sim.core.stopping import StoppingCriteria
+from social_sim.models.basic_economy import EconomyParams
+from social_sim.models.catalog import ExperimentCatalog
+from social_sim.models.scenario import run_scenario
+from social_sim.models.sweep import SweepSpec
+
+Record = dict[str, Any]
+Task = tuple[int, dict[str, Any], EconomyParams]
+
+
+def load_scenarios(source: str | Path | TextIO) -> SweepSpec:
+    """Parse a scenario file from a path, ``"-"`` for stdin, or an open file."""
+    if not isinstance(source, (str, Path)):
+        data = json.load(source)
+    elif str(source) == "-":
+        data = json.load(sys.stdin)
+    else:
+        data = json.loads(Path(source).read_text())
+    if isinstance(data, list):
+        data = {"variations": data}
+    elif isinstance(data, dict) and "scenarios" in data:
+        data = dict(data)
+        data["variations"] = data.pop("scenarios")
+    return SweepSpec.model_validate(data)
+
+
+def _finite(values: dict[str, float]) -> dict[str, float | None]:
+    """JSON has no NaN or infinity; write them as null."""
+    return {name: value if math.isfinite(value) else None for name, value in values.items()}
+
+
+class BatchOptions(PydanticModel):
+    """How every scenario of a batch runs and reports."""
+
+    steps: int
+    stopping: StoppingCriteria | None = None
+    every: int = 1
+    per_step: bool = False
+    catalog: str | None = None
+
+
+def run_task(task: Task, options: BatchOptions, emit: Callable[[Record], None]) -> bool:
+    """Run one scenario, emitting its records; return whether it succeeded.
+
+    With a catalog, an identical catalogued run is reported (``"cached":
+    true``, without step records) instead of computed, and new runs are
+    recorded.
+    """
+    index, point, params = task
+    label: Record = {"index": index}
+    if "name" in point:
+        label["name"] = point["name"]
+    every = options.every
+
+    def on_step(model: BaseModel) -> None:
+        if model.step_count % every == 0:
+            names = list(model.get_model_data())
+            metrics = dict(zip(names, model.measure(names)))
+            emit({"type": "step", **label, "step": model.step_count, "metrics": _finite(metrics)})
+
+    start = time.perf_counter()
+    try:
+        catalog = ExperimentCatalog(options.catalog) if options.catalog else None
+        with catalog if catalog is not None else nullcontext():
+            stored = catalog.lookup(params, options.steps, options.stopping) if catalog else None
+            if stored is not None:
+                result = stored.result()
+            else:
+                result = run_scenario(
+                    params,
+                    options.steps,
+                    options.stopping,
+                    on_step if options.per_step else None,
+                    collect_every=every if options.per_step else None,
+                )
+                if catalog is not None:
+                    catalog.record(params, options.steps, result, options.stopping)
+    except Exception as error:
+        emit({"type": "error", **label, "error": f"{type(error).__name__}: {error}"})
+        return False
+    emit({
+        "type": "scenario",
+        **label,
+        "overrides": point,
+        "seed": params.seed,
+        "cached": stored is not None,
+        "summary": result.summary.model_dump(),
+        "metrics": _finite(result.metrics),
+        "seconds": time.perf_counter() - start,
+    })
+    return True
+
+
+def _worker(tasks: Any, records: Any, options: BatchOptions) -> None:
+    """Worker process: run tasks until the ``None`` sentinel, then send one back."""
+    while (task := tasks.get()) is not None:
+        run_task(task, options, records.put)
+    records.put(None)
+
+
+def run_batch(
+    spec: SweepSpec,
+    emit: Callable[[Record], None],
+    jobs: int = 1,
+    per_step: bool = False,
+    every: int = 1,
+    catalog: str | None = None,
+) -> int:
+    """Run every scenario of ``spec`` on ``jobs`` processes; return the failure count.
+
+    ``emit`` receives each record in the main process as soon as it arrives.
+    """
+    options = BatchOptions(
+        steps=spec.steps,
+        stopping=spec.stopping,
+        every=every,
+        per_step=per_step,
+        catalog=catalog,
+    )
+    points = spec.points()
+    tasks = list(zip(range(len(points)), points, spec.configurations()))
+    jobs = max(1, min(jobs, len(tasks)))
+    if jobs == 1:
+        return sum(not run_task(task, options, emit) for task in tasks)
+
+    context = mp.get_context()
+    task_queue = context.Queue()
+    record_queue = context.Queue()
+    for task in tasks:
+        task_queue.put(task)
+    for _ in range(jobs):
+        task_queue.put(None)
+    workers = [
+        context.Process(target=_worker, args=(task_queue, record_queue, options), daemon=True)
+        for _ in range(jobs)
+    ]
+    for worker in workers:
+        worker.start()
+
+    failures = 0
+    running = jobs
+    while running:
+        try:
+            record = record_queue.get(timeout=1.0)
+        except queue.Empty:
+            crashed = [w for w in workers if w.exitcode not in (None, 0)]
+            if crashed:
+                emit({"type": "error", "error": f"{len(crashed)} worker(s) died"})
+                for worker in workers:
+                    worker.terminate()
+                return failures + 1
+            continue
+        if record is None:
+            running -= 1
+            continue
+        failures += record["type"] == "error"
+        emit(record)
+    for worker in workers:
+        worker.join()
+    return failures
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="social-sim",
+        description="Run economy scenarios headless and stream NDJSON results to stdout.",
+    )
+    parser.add_argument("scenarios", help="scenario file (JSON), or - for stdin")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1, help="worker processes (default: 1)"
+    )
+    parser.add_argument(
+        "--per-step", action="store_true", help="also write a record per collected step"
+    )
+    parser.add_argument(
+        "--every", type=int, default=1, help="collect (and report) every N steps (default: 1)"
+    )
+    parser.add_argument("--steps", type=int, help="override the file's step count")
+    parser.add_argument(
+        "--catalog", help="SQLite experiment catalog: reuse identical runs, record new ones"
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        spec = load_scenarios(args.scenarios)
+        if args.steps is not None:
+            spec = spec.model_copy(update={"steps": args.steps})
+        spec.configurations()
+    except (OSError, ValueError) as error:
+        print(f"social-sim: invalid scenario file: {error}", file=sys.stderr)
+        return 2
+
+    def emit(record: Record) -> None:
+        sys.stdout.write(json.dumps(record) + "\n")
+        sys.stdout.flush()
+
+    failures = run_batch(
+        spec, emit, args.jobs, args.per_step, max(1, args.every), args.catalog
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
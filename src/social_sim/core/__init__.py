@@ -1,6 +1,28 @@
 """Core simulation components."""
 
 from .agent import BaseAgent
-from .model import BaseModel
+from .aggregates import AggregateTracker
+from .cohorts import CohortReporter
+from .model import BaseModel, CollectionPolicy
+from .pipeline import Phase, PhaseRegistry, PhaseTimings
+from .reporters import FusedReporter
+from .rng import RNGService
+from .stopping import RunSummary, StoppingCriteria
+from .trajectory import MemmapTrajectory, read_archive
 
-__all__ = ["BaseAgent", "BaseModel"]
+__all__ = [
+    "AggregateTracker",
+    "BaseAgent",
+    "BaseModel",
+    "CohortReporter",
+    "CollectionPolicy",
+    "FusedReporter",
+    "MemmapTrajectory",
+    "Phase",
+    "PhaseRegistry",
+    "PhaseTimings",
+    "RNGService",
+    "RunSummary",
+    "StoppingCriteria",
+    "read_archive",
+]
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Self
 
+import numpy as np
 from mesa import Agent
 
 if TYPE_CHECKING:
@@ -11,12 +13,58 @@ if TYPE_CHECKING:
 
 
 class BaseAgent(Agent):
-    """Base class for all agents in the simulation."""
+    """Base class for all agents in the simulation.
+
+    Agent attributes are declared in ``__slots__`` so that no instance
+    ``__dict__`` is materialized (Mesa's ``Agent`` still allows ad-hoc
+    attributes through one). ``wealth`` has no slot here: subclasses such as
+    ``PersonAgent`` define their own storage for it. The ``connections`` set
+    is created on first use.
+    """
+
+    __slots__ = ("model", "unique_id", "pos", "_connections")
 
     def __init__(self, model: BaseModel, wealth: float = 0.0) -> None:
+        self._connections: set[int] | None = None
         super().__init__(model)
         self.wealth = wealth
-        self.connections: set[int] = set()
+
+    @classmethod
+    def build_many(
+        cls,
+        model: BaseModel,
+        unique_ids: Sequence[int],
+        wealth: Sequence[float] | np.ndarray | None = None,
+    ) -> list[Self]:
+        """Build unregistered agents, one per id, without calling ``__init__``.
+
+        Used by ``BaseModel.spawn_agents``; subclasses with extra state
+        override it and fill in their own attributes the same way.
+        """
+        wealth_values = column_values(wealth, 0.0, len(unique_ids))
+        new = cls.__new__
+        agents = []
+        for unique_id, agent_wealth in zip(unique_ids, wealth_values):
+            agent = new(cls)
+            agent.model = model
+            agent.unique_id = unique_id
+            agent.pos = None
+            agent.wealth = agent_wealth
+            agent._connections = None
+            agents.append(agent)
+        return agents
+
+    @property
+    def connections(self) -> set[int]:
+        """Ids of connected agents; the set is allocated on first access."""
+        if self._connections is None:
+            self._connections = set()
+        return self._connections
+
+    @property
+    def has_connections(self) -> bool:
+        """Whether the agent has any connection, without allocating the set."""
+        return bool(self._connections)
 
     def interact(self, other: BaseAgent) -> None:
         """Interact with another agent. Override in subclasses."""
@@ -25,3 +73,14 @@ class BaseAgent(Agent):
     def step(self) -> None:
         """Execute one step of the agent. Override in subclasses."""
         pass
+
+
+def column_values(
+    values: Sequence[float] | np.ndarray | None,
+    default: float,
+    n: int,
+) -> list[float]:
+    """Return a per-agent column as Python floats, or ``default`` repeated."""
+    if values is None:
+        return [default] * n
+    return np.asarray(values, dtype=float).tolist()
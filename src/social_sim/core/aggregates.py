@@ -0,0 +1,60 @@
+"""Incrementally maintained population aggregates."""
+
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any
+
+
+class AggregateTracker:
+    """Running sums and a member count kept up to date as agents change.
+
+    Agents report every change to a tracked attribute as a delta via
+    ``shift``, so totals and means can be read in O(1). Floating-point drift
+    from the many small updates is bounded by ``resync``, which the model
+    calls every ``resync_interval`` steps to recompute the sums exactly.
+    """
+
+    def __init__(self, resync_interval: int = 100) -> None:
+        self.sums: defaultdict[str, float] = defaultdict(float)
+        self.count = 0
+        self.resync_interval = resync_interval
+
+    def join(self) -> None:
+        """Count a new member; its attribute values arrive through ``shift``."""
+        self.count += 1
+
+    def join_many(self, count: int, **totals: float) -> None:
+        """Count ``count`` new members whose attributes sum to ``totals``."""
+        self.count += count
+        for name, total in totals.items():
+            self.sums[name] += total
+
+    def leave(self, **values: float) -> None:
+        """Remove a member and its current attribute values."""
+        self.count -= 1
+        for name, value in values.items():
+            self.sums[name] -= value
+
+    def shift(self, name: str, delta: float) -> None:
+        """Apply a change in one member's attribute to the running sum."""
+        self.sums[name] += delta
+
+    def total(self, name: str) -> float:
+        """Return the running sum of an attribute."""
+        return self.sums[name]
+
+    def mean(self, name: str) -> float:
+        """Return the running mean of an attribute, or 0.0 with no members."""
+        if self.count == 0:
+            return 0.0
+        return self.sums[name] / self.count
+
+    def resync(self, members: Iterable[Any], names: Iterable[str]) -> None:
+        """Recompute the count and the named sums exactly from the members."""
+        members = list(members)
+        self.count = len(members)
+        for name in names:
+            self.sums[name] = math.fsum(getattr(m, name) for m in members)
@@ -0,0 +1,215 @@
+"""Per-step aggregates of agent attributes by cohort."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import numpy as np
+
+from .reporters import FusedReporter
+
+CohortKey = str | Callable[[Any, dict[str, np.ndarray]], np.ndarray]
+
+
+def grouped_stats(
+    labels: np.ndarray,
+    values: np.ndarray,
+    groups: int,
+    quantiles: Sequence[float] = (),
+) -> dict[str, np.ndarray]:
+    """Return count, sum, mean and quantiles of ``values`` per label in ``[0, groups)``.
+
+    Quantiles interpolate linearly like ``np.quantile``; empty groups get NaN
+    for everything but count and sum. One stable sort by value followed by
+    a stable (radix) sort by label orders every group at once.
+    """
+    counts = np.bincount(labels, minlength=groups)
+    sums = np.bincount(labels, weights=values, minlength=groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        stats = {"count": counts.astype(float), "sum": sums, "mean": sums / counts}
+    if not quantiles:
+        return stats
+    if not len(values):
+        for q in quantiles:
+            stats[quantile_name(q)] = np.full(groups, np.nan)
+        return stats
+
+    order = np.argsort(values, kind="stable")
+    keys = labels[order]
+    if groups <= np.iinfo(np.int16).max:
+        keys = keys.astype(np.int16)
+    ordered = values[order[np.argsort(keys, kind="stable")]]
+    empty = counts == 0
+    starts = np.cumsum(counts) - counts
+    last = np.where(empty, 0, starts + counts - 1)
+    for q in quantiles:
+        position = np.where(empty, 0.0, starts + q * (counts - 1))
+        low = np.floor(position).astype(np.int64)
+        high = np.minimum(low + 1, last)
+        value = ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+        stats[quantile_name(q)] = np.where(empty, np.nan, value)
+    return stats
+
+
+def quantile_name(q: float) -> str:
+    """Column label of a quantile, e.g. ``q50`` for 0.5 or ``q2.5`` for 0.025."""
+    return f"q{100 * q:g}"
+
+
+class CohortReporter:
+    """Aggregates of agent attributes per cohort, recorded as model columns.
+
+    ``by`` picks the cohorts: ``"wealth_decile"`` ranks agents by current
+    wealth into ``groups`` equal-count groups every step,
+    ``"initial_productivity"`` bands agents by the productivity they had
+    when first seen (equal-count bands over the first population, fixed
+    afterwards), and a callable ``key(model, values)`` returns a label in
+    ``[0, groups)`` per slot of the ``values`` arrays. Per step and cohort
+    it records the agent count and, for every attribute, the sum, mean and
+    each quantile in ``quantiles``. ``sample`` agents drawn uniformly from
+    the first population are also followed individually (NaN once gone).
+
+    Columns are named ``"<name>:<cohort>:<attribute>:<stat>"``, plus
+    ``"<name>:<cohort>:count"`` and ``"<name>:sample<k>:<attribute>"``, so
+    storage grows with the cohorts, not the population. ``table`` and
+    ``sample_table`` read them back as ``steps x cohorts`` arrays. A
+    reporter remembers first-seen values and its sample, so give every
+    model its own.
+    """
+
+    def __init__(
+        self,
+        name: str = "cohort",
+        by: CohortKey = "wealth_decile",
+        groups: int = 10,
+        attributes: Sequence[str] = ("wealth", "happiness", "productivity"),
+        quantiles: Sequence[float] = (),
+        sample: int = 0,
+    ) -> None:
+        if groups < 1:
+            raise ValueError("groups must be at least 1")
+        if isinstance(by, str) and by not in ("wealth_decile", "initial_productivity"):
+            raise ValueError(f"unknown cohort key {by!r}")
+        if any(not 0 <= q <= 1 for q in quantiles):
+            raise ValueError("quantiles must lie in [0, 1]")
+        self.name = name
+        self.by = by
+        self.groups = groups
+        self.attributes = tuple(attributes)
+        self.quantiles = tuple(quantiles)
+        self.sample = sample
+        self.stats = ("sum", "mean", *(quantile_name(q) for q in self.quantiles))
+        self._initial = np.empty(0)
+        self._band_edges: np.ndarray | None = None
+        self._sampled: np.ndarray | None = None
+
+    @property
+    def columns(self) -> list[str]:
+        """Every model column this reporter fills, in a fixed order."""
+        names = []
+        for cohort in range(self.groups):
+            names.append(f"{self.name}:{cohort}:count")
+            for attribute in self.attributes:
+                names.extend(f"{self.name}:{cohort}:{attribute}:{stat}" for stat in self.stats)
+        for k in range(self.sample):
+            names.extend(f"{self.name}:sample{k}:{attribute}" for attribute in self.attributes)
+        return names
+
+    def fused(self) -> FusedReporter:
+        return FusedReporter(self.columns, self.compute)
+
+    def _attributes_needed(self) -> tuple[str, ...]:
+        extra = {"wealth_decile": "wealth", "initial_productivity": "productivity"}
+        needed = list(self.attributes)
+        if isinstance(self.by, str) and extra[self.by] not in needed:
+            needed.append(extra[self.by])
+        return tuple(needed)
+
+    def compute(self, model: Any) -> dict[str, float]:
+        """Return every column's value for the model's current state."""
+        values = model.agent_arrays(self._attributes_needed())
+        first = values[self._attributes_needed()[0]]
+        present = np.flatnonzero(~np.isnan(first))
+        labels = self._labels(model, values, present)
+
+        result: dict[str, float] = {}
+        per_attribute = {
+            attribute: grouped_stats(
+                labels, values[attribute][present], self.groups, self.quantiles
+            )
+            for attribute in self.attributes
+        }
+        counts = np.bincount(labels, minlength=self.groups)
+        for cohort in range(self.groups):
+            prefix = f"{self.name}:{cohort}"
+            result[f"{prefix}:count"] = float(counts[cohort])
+            for attribute, stats in per_attribute.items():
+                for stat in self.stats:
+                    result[f"{prefix}:{attribute}:{stat}"] = float(stats[stat][cohort])
+
+        if self.sample:
+            if self._sampled is None:
+                rng = model.rngs.stream("cohort sample", self.name)
+                size = min(self.sample, len(present))
+                self._sampled = np.sort(rng.choice(present, size=size, replace=False))
+            for attribute in self.attributes:
+                column = values[attribute]
+                tracked = np.full(self.sample, np.nan)
+                alive = self._sampled[self._sampled < len(column)]
+                tracked[: len(alive)] = column[alive]
+                for k, value in enumerate(tracked.tolist()):
+                    result[f"{self.name}:sample{k}:{attribute}"] = value
+        return result
+
+    def _labels(
+        self,
+        model: Any,
+        values: dict[str, np.ndarray],
+        present: np.ndarray,
+    ) -> np.ndarray:
+        """Return the cohort of every present slot."""
+        n = len(present)
+        if self.by == "wealth_decile":
+            order = np.argsort(values["wealth"][present], kind="stable")
+            labels = np.empty(n, dtype=np.int64)
+            labels[order] = (np.arange(n) * self.groups) // max(n, 1)
+            return labels
+        if self.by == "initial_productivity":
+            initial = self._initial_values(values["productivity"], present)
+            if self._band_edges is None:
+                cuts = np.arange(1, self.groups) / self.groups
+                self._band_edges = np.quantile(initial, cuts) if n else np.zeros(self.groups - 1)
+            return np.searchsorted(self._band_edges, initial, side="right")
+        labels = np.asarray(self.by(model, values), dtype=np.int64)[present]
+        if len(labels) and (labels.min() < 0 or labels.max() >= self.groups):
+            raise ValueError(f"cohort labels must lie in [0, {self.groups})")
+        return labels
+
+    def _initial_values(self, current: np.ndarray, present: np.ndarray) -> np.ndarray:
+        """Remember each slot's value when first seen; return them for ``present``."""
+        if len(current) > len(self._initial):
+            grown = np.full(len(current), np.nan)
+            grown[: len(self._initial)] = self._initial
+            self._initial = grown
+        unseen = present[np.isnan(self._initial[present])]
+        self._initial[unseen] = current[unseen]
+        return self._initial[present]
+
+    def table(self, model: Any, attribute: str, stat: str = "mean") -> np.ndarray:
+        """Return the ``steps x cohorts`` history of one statistic.
+
+        ``attribute`` is ignored for ``stat="count"``.
+        """
+        data = model.get_model_data()
+        if stat == "count":
+            names = [f"{self.name}:{cohort}:count" for cohort in range(self.groups)]
+        else:
+            names = [f"{self.name}:{c}:{attribute}:{stat}" for c in range(self.groups)]
+        return np.column_stack([data[name] for name in names])
+
+    def sample_table(self, model: Any, attribute: str) -> np.ndarray:
+        """Return the ``steps x sample`` history of the sampled agents."""
+        data = model.get_model_data()
+        names = [f"{self.name}:sample{k}:{attribute}" for k in range(self.sample)]
+        return np.column_stack([data[name] for name in names])
@@ -2,11 +2,31 @@
 
 from __future__ import annotations
 
-from typing import Any
+import gc
+import sys
+import time
+from collections.abc import Callable, Sequence
+from itertools import islice
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, ClassVar, Literal, TypeVar
 
-from mesa import Model
-from mesa.datacollection import DataCollector
-from pydantic import BaseModel as PydanticModel
+import numpy as np
+from mesa import Agent, Model
+from mesa.agent import AgentSet
+from pydantic import BaseModel as PydanticModel, Field
+
+from .aggregates import AggregateTracker
+from .cohorts import CohortReporter
+from .pipeline import CompiledPipeline, ImplementationKind, PhaseRegistry
+from .recorder import ColumnarRecorder
+from .registry import AgentIndex, TypeRegistry
+from .reporters import FusedReporter
+from .rng import RNGService
+from .stopping import ConvergenceMonitor, RunSummary, StoppingCriteria
+from .trajectory import MemmapTrajectory
+
+AgentT = TypeVar("AgentT", bound=Agent)
 
 
 class SimulationParams(PydanticModel):
@@ -16,50 +36,489 @@ class SimulationParams(PydanticModel):
     seed: int | None = None
 
 
+class CollectionPolicy(PydanticModel):
+    """When ``BaseModel`` records reporter data.
+
+    ``every`` collects after every ``interval``-th step and always after the
+    last step of ``run``; ``end`` collects only once ``run`` finishes;
+    ``manual`` collects only when ``collect()`` is called explicitly.
+    With ``agents`` off, only the model reporters are recorded.
+    """
+
+    mode: Literal["every", "end", "manual"] = "every"
+    interval: int = Field(default=1, ge=1)
+    agents: bool = True
+
+
 class BaseModel(Model):
-    """Base class for all simulation models."""
+    """Base class for all simulation models.
+
+    Vectorized phases draw from ``rngs``, which derives an independent NumPy
+    stream per phase (``rngs.stream("trade")``) from the model seed, so one
+    phase's draws never shift another's. Agent-level code that draws one
+    value at a time uses ``rngs.scalar_stream`` instead; ``sample_partner``
+    draws from the ``"partners"`` scalar stream. Mesa's ``random`` and
+    ``rng`` are left to Mesa.
+
+    Subclasses that step through phases set ``phases`` to their registry and
+    ``phase_kind`` to the implementation they run, call ``compile_phases``
+    once set up, and run ``pipeline`` in ``step``. Models that serve
+    ``wealth_index`` set ``wealth_index_type`` to the index class (such as
+    ``analysis.WealthIndex``), which is built from the wealth slots.
+    """
+
+    phases: ClassVar[PhaseRegistry] = PhaseRegistry()
+    phase_kind: ClassVar[ImplementationKind] = "scalar"
+    wealth_index_type: ClassVar[Callable[[np.ndarray], Any] | None] = None
 
     def __init__(self, params: SimulationParams | None = None) -> None:
         super().__init__(seed=params.seed if params else None)
         self.params = params or SimulationParams()
+        self.rngs = RNGService(self.params.seed)
+        self._partner_random = self.rngs.scalar_stream("partners")
         self.running = True
         self.step_count = 0
-        self.datacollector: DataCollector | None = None
+        self.recorder: ColumnarRecorder | None = None
+        self.collection = CollectionPolicy()
+        self._model_reporters: dict[str, Callable[[Any], float]] = {}
+        self._agent_reporters: dict[str, str | Callable[[Any], np.ndarray]] = {}
+        self.aggregates = AggregateTracker()
+        self._fused_values: dict[FusedReporter, dict[str, float]] = {}
+        self._registry = TypeRegistry()
+        self._all_agents_index: AgentIndex = self._registry.index(Agent)
+        self.pipeline = CompiledPipeline()
+        self.stopping: StoppingCriteria | None = None
+        self.last_run: RunSummary | None = None
+        self._wealth_index: Any = None
+        self._wealth_index_step = -1
+
+    def register_agent(self, agent: Agent) -> None:
+        """Register an agent and add it to the per-type indexes."""
+        super().register_agent(agent)
+        self._registry.add(agent)
+        self._wealth_index = None
+
+    def deregister_agent(self, agent: Agent) -> None:
+        """Deregister an agent and drop it from the per-type indexes."""
+        super().deregister_agent(agent)
+        self._registry.remove(agent)
+        self._wealth_index = None
+
+    def spawn_agents(self, agent_type: type[AgentT], n: int, **columns: Any) -> list[AgentT]:
+        """Create ``n`` agents of one type at once and register them in bulk.
+
+        Each keyword is a per-agent column of length ``n`` (a list or array)
+        handed to ``agent_type.build_many``, which builds the agents without
+        running ``__init__`` one by one. Registration then fills Mesa's agent
+        sets and the type indexes in a single pass. The cyclic garbage
+        collector is paused meanwhile: none of the new objects is garbage, and
+        its repeated full scans would otherwise dominate. See
+        ``benchmarks/construction.py`` for the budget at one million agents.
+        """
+        for name, values in columns.items():
+            if values is not None and len(values) != n:
+                raise ValueError(f"column {name!r} has {len(values)} values, expected {n}")
+
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            unique_ids = list(islice(Agent._ids[self], n))
+            agents = agent_type.build_many(self, unique_ids, **columns)  # type: ignore[attr-defined]
+            self._register_many(agent_type, agents)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        return agents
+
+    def _register_many(self, agent_type: type[Agent], agents: list[Agent]) -> None:
+        """Register agents that are all exactly of ``agent_type``.
+
+        Fills Mesa 3's internal agent sets directly (``_agents``,
+        ``_agents_by_type``, ``AgentSet._agents``), hence the ``mesa<4`` pin.
+        """
+        if not agents:
+            return
+        members = dict.fromkeys(agents)
+        self._agents.update(members)
+        agentset = self._agents_by_type.get(agent_type)
+        if agentset is None:
+            self._agents_by_type[agent_type] = AgentSet(agents, random=self.random)
+        else:
+            # Same effect as AgentSet.add per agent, without the method calls.
+            agentset._agents.update(members)
+        self._all_agents._agents.update(members)
+        self._registry.add_many(agent_type, agents)
+        self._wealth_index = None
+
+    def memory_report(self, sample: int = 1000) -> dict[str, float]:
+        """Estimate the memory held per agent, in bytes.
+
+        ``objects`` covers the agent instances and the values only they
+        reference (boxed floats, large ints, sets, instance dicts), averaged
+        over up to ``sample`` agents. ``registry`` is the Mesa agent sets plus
+        the type indexes. Both are per agent and add up to ``per_agent``;
+        ``total`` is ``per_agent`` times ``agents``. ``recorder`` is the
+        collected data in bytes.
+        """
+        agents = self._all_agents_index.agents
+        n = len(agents)
+        model_refs = {id(self), id(None)}
+
+        def owned_bytes(agent: Agent) -> int:
+            size = sys.getsizeof(agent)
+            for value in gc.get_referents(agent):
+                if id(value) in model_refs or isinstance(value, type):
+                    continue
+                # Owned values are referenced only by the agent, the referents
+                # list, the loop variable and getrefcount's argument.
+                if sys.getrefcount(value) <= 4:
+                    size += sys.getsizeof(value)
+            return size
+
+        sampled = agents[:sample]
+        objects = sum(map(owned_bytes, sampled)) / len(sampled) if sampled else 0.0
+
+        registry = sys.getsizeof(self._agents)
+        for agentset in [*self._agents_by_type.values(), self._all_agents]:
+            refs = agentset._agents.data
+            registry += sys.getsizeof(refs)
+            if refs:
+                registry += len(refs) * sys.getsizeof(next(iter(refs)))
+        for index in self._registry.indexes():
+            registry += sys.getsizeof(index.agents) + sys.getsizeof(index.positions)
+            registry += sum(map(sys.getsizeof, index.positions.values()))
+
+        per_agent = objects + registry / n if n else 0.0
+        return {
+            "agents": n,
+            "objects": objects,
+            "registry": registry / n if n else 0.0,
+            "per_agent": per_agent,
+            "total": per_agent * n,
+            "recorder": self.recorder.nbytes if self.recorder is not None else 0,
+        }
+
+    def agents_of_type(self, agent_type: type[Agent]) -> list[Agent]:
+        """Return the agents of a type (subclasses included) without scanning.
+
+        The returned list is the live index; copy it before adding or
+        removing agents while iterating.
+        """
+        return self._registry.index(agent_type).agents
+
+    def count_agents(self, agent_type: type[Agent] = Agent) -> int:
+        """Return the number of agents of a type (subclasses included) in O(1)."""
+        return len(self._registry.index(agent_type))
+
+    def sample_partner(
+        self,
+        agent: Agent,
+        agent_type: type[Agent] = Agent,
+    ) -> Agent | None:
+        """Draw a uniformly random agent of ``agent_type`` other than ``agent`` in O(1)."""
+        index = self._registry.index(agent_type)
+        n = len(index)
+        position = index.positions.get(agent)
+        if position is None:
+            return index.agents[self._partner_random.randrange(n)] if n else None
+        if n < 2:
+            return None
+
+        # Draw from the n - 1 other slots by skipping over the agent's own slot.
+        draw = self._partner_random.randrange(n - 1)
+        if draw >= position:
+            draw += 1
+        return index.agents[draw]
 
     def setup_datacollector(
         self,
         model_reporters: dict[str, Any] | None = None,
         agent_reporters: dict[str, Any] | None = None,
+        fused_reporters: list[FusedReporter] | None = None,
+        agent_dtype: np.dtype | type = np.float64,
+        cohort_reporters: list[CohortReporter] | None = None,
     ) -> None:
-        """Configure data collection for the model."""
-        self.datacollector = DataCollector(
-            model_reporters=model_reporters or {},
-            agent_reporters=agent_reporters or {},
+        """Configure data collection for the model.
+
+        Model reporters are attribute names or callables taking the model and
+        returning a number. Agent reporters are either attribute names, read
+        from every registered agent and stored in the slot ``unique_id - 1``,
+        or callables taking the model and returning one value per slot.
+        Cohort reporters add model columns with per-cohort aggregates.
+        """
+        reporters: dict[str, Callable[[Any], float]] = {}
+        fused_reporters = list(fused_reporters or [])
+        fused_reporters += [cohorts.fused() for cohorts in cohort_reporters or []]
+        for fused in fused_reporters:
+            for name in fused.names:
+                reporters[name] = self._fused_column(fused, name)
+        for name, reporter in (model_reporters or {}).items():
+            reporters[name] = attrgetter(reporter) if isinstance(reporter, str) else reporter
+
+        self._model_reporters = reporters
+        self._agent_reporters = dict(agent_reporters or {})
+        self.recorder = ColumnarRecorder(
+            model_columns=list(reporters),
+            agent_columns=list(self._agent_reporters),
+            agent_dtype=agent_dtype,
+            agent_capacity=self.count_agents(),
+        )
+
+    @staticmethod
+    def _fused_column(fused: FusedReporter, name: str) -> Callable[[Any], float]:
+        """Build the reporter for one column of a fused reporter."""
+        return lambda m: m._read_fused(fused, name)
+
+    def _read_fused(self, fused: FusedReporter, name: str) -> float:
+        """Return one fused value, computing the whole group once per collect."""
+        values = self._fused_values.get(fused)
+        if values is None:
+            values = self._fused_values[fused] = fused.compute(self)
+        return values[name]
+
+    def record_trajectories(
+        self,
+        directory: str | Path,
+        dtype: np.dtype | type = np.float32,
+        agents: int | None = None,
+    ) -> MemmapTrajectory:
+        """Keep the agent reporter history in memory-mapped files in ``directory``.
+
+        Rows already collected move to the files too. ``agents`` reserves
+        slots up front (by default the recorder's current capacity); the
+        files are flushed at the end of every ``run``. Returns the
+        trajectory, which ``MemmapTrajectory.open`` can map again later.
+        """
+        recorder = self.recorder
+        if recorder is None or not recorder.agent_columns:
+            raise ValueError("the model has no agent reporters to record")
+        trajectory = MemmapTrajectory(
+            directory,
+            recorder.agent_columns,
+            dtype,
+            agents=recorder.agent_capacity if agents is None else agents,
+            capacity=recorder.capacity,
+        )
+        recorder.attach_trajectory(trajectory)
+        return trajectory
+
+    def collect(self) -> None:
+        """Record reporter data for the current state."""
+        if self.recorder is None:
+            return
+
+        self._fused_values.clear()
+        model_values = [reporter(self) for reporter in self._model_reporters.values()]
+        agent_values: dict[str, np.ndarray] = {}
+        slots: np.ndarray | None = None
+        agent_reporters = self._agent_reporters if self.collection.agents else {}
+        for name, reporter in agent_reporters.items():
+            if callable(reporter):
+                agent_values[name] = np.asarray(reporter(self))
+                continue
+            if slots is None:
+                slots = self._agent_slots()
+            agent_values[name] = self._agent_attribute_row(reporter, slots)
+        self.recorder.append(self.steps, model_values, agent_values)
+
+    def add_cohort_reporter(self, reporter: CohortReporter) -> None:
+        """Record a cohort reporter's columns too, from the next collect on."""
+        if self.recorder is None:
+            raise ValueError("set up the data collector first")
+        fused = reporter.fused()
+        for name in fused.names:
+            self._model_reporters[name] = self._fused_column(fused, name)
+        self.recorder.add_model_columns(fused.names)
+
+    def agent_arrays(self, attributes: Sequence[str]) -> dict[str, np.ndarray]:
+        """Return each attribute of every agent by slot (``unique_id - 1``).
+
+        Slots without an agent hold NaN. Array-backed models override this
+        to hand out their arrays directly.
+        """
+        slots = self._agent_slots()
+        return {name: self._agent_attribute_row(name, slots) for name in attributes}
+
+    @property
+    def wealth_index(self) -> Any:
+        """Agents ordered by wealth, rebuilt on first use after each step.
+
+        Changes to wealth between steps (shocks, new citizens) must call
+        ``invalidate_wealth_index``; agents added or removed do so already.
+        """
+        if self.wealth_index_type is None:
+            raise NotImplementedError(f"{type(self).__name__} sets no wealth_index_type")
+        if self._wealth_index is None or self._wealth_index_step != self.steps:
+            wealth = self.agent_arrays(("wealth",))["wealth"]
+            self._wealth_index = self.wealth_index_type(wealth)
+            self._wealth_index_step = self.steps
+        return self._wealth_index
+
+    def invalidate_wealth_index(self) -> None:
+        """Rebuild ``wealth_index`` on its next use."""
+        self._wealth_index = None
+
+    def _agent_slots(self) -> np.ndarray:
+        """Return the recorder slot (``unique_id - 1``) of every registered agent."""
+        agents = self._all_agents_index.agents
+        return np.fromiter((a.unique_id - 1 for a in agents), dtype=np.int64, count=len(agents))
+
+    def _agent_attribute_row(self, attribute: str, slots: np.ndarray) -> np.ndarray:
+        """Scatter one attribute of every registered agent into its slot.
+
+        Agents without the attribute (a firm among persons, say) get NaN.
+        """
+        agents = self._all_agents_index.agents
+        values = np.fromiter(
+            (getattr(a, attribute, np.nan) for a in agents), dtype=float, count=len(agents)
         )
+        row = np.full(int(slots.max()) + 1 if len(slots) else 0, np.nan)
+        row[slots] = values
+        return row
+
+    def compile_phases(self) -> None:
+        """Rebuild ``pipeline`` from ``phases`` and the current params.
+
+        Call again after changing which phases the params enable. A timing
+        hook set on the previous pipeline carries over.
+        """
+        hook = self.pipeline.on_phase
+        self.pipeline = self.phases.compile(self, self.params, self.phase_kind)
+        self.pipeline.on_phase = hook
 
     def step(self) -> None:
         """Execute one step of the model."""
         self.step_count += 1
-        if self.datacollector:
-            self.datacollector.collect(self)
+        interval = self.aggregates.resync_interval
+        if interval and self.step_count % interval == 0:
+            self.resync_aggregates()
+        policy = self.collection
+        if policy.mode == "every" and self.step_count % policy.interval == 0:
+            self.collect()
+
+    def resync_aggregates(self) -> None:
+        """Recompute tracked aggregates exactly. Override in subclasses."""
+        pass
+
+    def run(
+        self,
+        steps: int,
+        stopping: StoppingCriteria | None = None,
+        on_step: Callable[[BaseModel], None] | None = None,
+    ) -> RunSummary:
+        """Run the model for up to ``steps`` steps and report how the run ended.
+
+        ``stopping`` (or else the model's ``stopping``) can end the run early
+        on convergence or when a budget runs out; the returned summary is also
+        kept as ``last_run``. Clearing ``running`` stops the run as well.
+        ``on_step`` is called with the model after every step.
+        """
+        criteria = stopping or self.stopping
+        monitor = None
+        if criteria is not None and criteria.metrics:
+            unknown = [name for name in criteria.metrics if name not in self._model_reporters]
+            if unknown:
+                raise ValueError(f"unknown stopping metrics: {unknown}")
+            monitor = ConvergenceMonitor(criteria)
 
-    def run(self, steps: int) -> None:
-        """Run the model for a given number of steps."""
+        if self.recorder is not None:
+            self.recorder.reserve(self.recorder.rows + self._expected_collections(steps))
+        start = time.perf_counter()
+        reason = "completed"
+        steps_run = 0
         for _ in range(steps):
             if not self.running:
+                reason = "stopped"
                 break
+            if criteria is not None:
+                if criteria.max_steps is not None and steps_run >= criteria.max_steps:
+                    reason = "step_budget"
+                    break
+                if (
+                    criteria.max_seconds is not None
+                    and time.perf_counter() - start >= criteria.max_seconds
+                ):
+                    reason = "time_budget"
+                    break
             self.step()
+            steps_run += 1
+            if on_step is not None:
+                on_step(self)
+            if monitor is not None and steps_run % criteria.check_every == 0:
+                converged = monitor.observe(self.measure(criteria.metrics))
+                if converged and steps_run >= criteria.min_steps:
+                    reason = "converged"
+                    break
+
+        if steps_run and self.collection.mode != "manual" and not self._collected_current_step():
+            self.collect()
+        if self.recorder is not None:
+            self.recorder.flush()
+        self.last_run = RunSummary(
+            reason=reason,
+            step=self.step_count,
+            steps_run=steps_run,
+            seconds=time.perf_counter() - start,
+        )
+        return self.last_run
+
+    def measure(self, names: list[str]) -> list[float]:
+        """Return the current values of some model reporters.
+
+        Reuses the row collected for the current step when there is one.
+        """
+        recorder = self.recorder
+        if recorder is not None and recorder.rows and recorder.steps[-1] == self.steps:
+            return [float(recorder.model_column(name)[-1]) for name in names]
+        self._fused_values.clear()
+        return [float(self._model_reporters[name](self)) for name in names]
+
+    def _expected_collections(self, steps: int) -> int:
+        """Return how many rows a run of ``steps`` steps will record."""
+        policy = self.collection
+        if policy.mode == "every":
+            return steps // policy.interval + 1
+        if policy.mode == "end":
+            return 1
+        return 0
+
+    def _collected_current_step(self) -> bool:
+        """Return whether the recorder already holds a row for this step."""
+        recorder = self.recorder
+        if recorder is None:
+            return True
+        return recorder.rows > 0 and recorder.steps[-1] == self.steps
+
+    def get_collected_steps(self) -> np.ndarray:
+        """Return the step number of every collected row as a view."""
+        if self.recorder is None:
+            return np.empty(0, dtype=np.int64)
+        return self.recorder.steps
+
+    def get_model_data(self) -> dict[str, np.ndarray]:
+        """Return collected model-level data as views, one array per reporter."""
+        if self.recorder is None:
+            return {}
+        return {name: self.recorder.model_column(name) for name in self.recorder.model_columns}
+
+    def get_agent_matrix(self, name: str) -> np.ndarray:
+        """Return the ``steps x agents`` history of one agent reporter as a view."""
+        if self.recorder is None:
+            raise KeyError(name)
+        return self.recorder.agent_matrix(name)
+
+    def get_agent_data(self) -> dict[str, np.ndarray]:
+        """Return collected agent-level data in long form (Step, AgentID, ...)."""
+        if self.recorder is None or not self.recorder.agent_columns:
+            return {}
 
-    def get_model_data(self) -> dict[str, list[Any]]:
-        """Return collected model-level data."""
-        if self.datacollector:
-            return self.datacollector.get_model_vars_dataframe().to_dict(orient="list")
-        return {}
-
-    def get_agent_data(self) -> dict[str, list[Any]]:
-        """Return collected agent-level data."""
-        if self.datacollector:
-            df = self.datacollector.get_agent_vars_dataframe()
-            df = df.reset_index()
-            return df.to_dict(orient="list")
-        return {}
+        matrices = {name: self.recorder.agent_matrix(name) for name in self.recorder.agent_columns}
+        present = ~np.isnan(next(iter(matrices.values())))
+        rows, slots = np.nonzero(present)
+        data: dict[str, np.ndarray] = {
+            "Step": self.recorder.steps[rows],
+            "AgentID": slots + 1,
+        }
+        for name, matrix in matrices.items():
+            data[name] = matrix[present]
+        return data
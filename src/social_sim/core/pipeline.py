@@ -0,0 +1,176 @@
+"""Model steps as an ordered pipeline of named, switchable phases."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import partial
+from typing import Any, Literal
+
+ImplementationKind = Literal["scalar", "vectorized"]
+PhaseImpl = str | Callable[[Any], None]
+PhaseHook = Callable[[str, float], None]
+
+
+class Phase:
+    """One stage of a model step.
+
+    ``method`` names a model method that every model class implements in its
+    own way. ``scalar`` and ``vectorized`` instead give separate
+    implementations for models that keep per-agent objects and for models
+    that keep arrays, each a function taking the model or a method name,
+    and take precedence over ``method``. ``enabled``
+    decides from the model's params whether the phase runs at all; while
+    it is off, the model attributes in ``resets`` hold their reset values.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        method: str | None = None,
+        *,
+        scalar: PhaseImpl | None = None,
+        vectorized: PhaseImpl | None = None,
+        enabled: Callable[[Any], bool] | None = None,
+        resets: Mapping[str, Any] | None = None,
+    ) -> None:
+        if method is None and scalar is None and vectorized is None:
+            raise ValueError(f"phase {name!r} needs a method or an implementation")
+        self.name = name
+        self.method = method
+        self.scalar = scalar
+        self.vectorized = vectorized
+        self.enabled = enabled
+        self.resets = dict(resets or {})
+
+    def is_enabled(self, params: Any) -> bool:
+        return self.enabled is None or self.enabled(params)
+
+    def bind(self, model: Any, kind: ImplementationKind) -> Callable[[], None]:
+        """Return this phase's ``kind`` implementation bound to ``model``."""
+        impl = self.scalar if kind == "scalar" else self.vectorized
+        if impl is None:
+            impl = self.method
+        if impl is None:
+            raise ValueError(f"phase {self.name!r} has no {kind} implementation")
+        if isinstance(impl, str):
+            return getattr(model, impl)
+        return partial(impl, model)
+
+
+class PhaseRegistry:
+    """The ordered phases a model class steps through.
+
+    ``register`` adds a phase at the end or next to an existing one, so new
+    policies plug in without touching the model's ``step``. ``compile``
+    turns the registry into a ``CompiledPipeline`` for one model.
+    """
+
+    def __init__(self, phases: Iterable[Phase] = ()) -> None:
+        self._phases: list[Phase] = []
+        for phase in phases:
+            self.register(phase)
+
+    @property
+    def names(self) -> list[str]:
+        return [phase.name for phase in self._phases]
+
+    def __iter__(self) -> Iterator[Phase]:
+        return iter(self._phases)
+
+    def copy(self) -> PhaseRegistry:
+        """Return an independent registry, e.g. for a subclass to extend."""
+        return PhaseRegistry(self._phases)
+
+    def register(
+        self,
+        phase: Phase,
+        *,
+        before: str | None = None,
+        after: str | None = None,
+    ) -> None:
+        """Add a phase at the end, or right ``before`` or ``after`` a named one."""
+        if phase.name in self.names:
+            raise ValueError(f"phase {phase.name!r} is already registered")
+        if before is not None and after is not None:
+            raise ValueError("pass at most one of before and after")
+        anchor = before if before is not None else after
+        if anchor is None:
+            self._phases.append(phase)
+            return
+        if anchor not in self.names:
+            raise ValueError(f"unknown phase {anchor!r}")
+        position = self.names.index(anchor) + (after is not None)
+        self._phases.insert(position, phase)
+
+    def unregister(self, name: str) -> Phase:
+        """Remove and return the named phase."""
+        if name not in self.names:
+            raise ValueError(f"unknown phase {name!r}")
+        return self._phases.pop(self.names.index(name))
+
+    def select(self, model: Any, params: Any) -> list[Phase]:
+        """Return the phases ``params`` enable, in order, and reset the others on ``model``."""
+        selected = []
+        for phase in self._phases:
+            if phase.is_enabled(params):
+                selected.append(phase)
+            else:
+                for attribute, value in phase.resets.items():
+                    setattr(model, attribute, value)
+        return selected
+
+    def compile(self, model: Any, params: Any, kind: ImplementationKind) -> CompiledPipeline:
+        """Bind the enabled phases to ``model`` and reset the disabled ones.
+
+        Enablement is decided here, once, so a disabled phase costs nothing
+        per step. Compile again after changing which phases ``params`` enable.
+        """
+        return CompiledPipeline(
+            (phase.name, phase.bind(model, kind)) for phase in self.select(model, params)
+        )
+
+
+class CompiledPipeline:
+    """The enabled phases of one model, bound and ready to run in order.
+
+    Set ``on_phase`` to a callable taking a phase name and its duration in
+    seconds to time every phase (see ``PhaseTimings``); without it a step
+    is just the sequence of phase calls.
+    """
+
+    def __init__(self, steps: Iterable[tuple[str, Callable[[], None]]] = ()) -> None:
+        self.steps = tuple(steps)
+        self.on_phase: PhaseHook | None = None
+
+    @property
+    def names(self) -> list[str]:
+        return [name for name, _ in self.steps]
+
+    def run(self) -> None:
+        """Run every enabled phase once."""
+        hook = self.on_phase
+        if hook is None:
+            for _, call in self.steps:
+                call()
+            return
+        for name, call in self.steps:
+            start = time.perf_counter()
+            call()
+            hook(name, time.perf_counter() - start)
+
+
+class PhaseTimings:
+    """A ``CompiledPipeline.on_phase`` hook that totals time per phase."""
+
+    def __init__(self) -> None:
+        self.seconds: dict[str, float] = {}
+        self.calls: dict[str, int] = {}
+
+    def __call__(self, name: str, seconds: float) -> None:
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def mean_seconds(self) -> dict[str, float]:
+        """Average seconds per call of each phase."""
+        return {name: total / self.calls[name] for name, total in self.seconds.items()}
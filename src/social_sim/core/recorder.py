@@ -0,0 +1,167 @@
+"""Preallocated columnar storage for collected time series."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+
+from .trajectory import MemmapTrajectory
+
+
+class ColumnarRecorder:
+    """Per-step model metrics and agent attributes in preallocated arrays.
+
+    Model metrics live in one ``metrics x steps`` float64 block, so each
+    metric's history is a contiguous row. Every agent attribute gets its own
+    ``steps x agents`` block whose columns are agent slots; slots without a
+    value in a step (agents not yet born or already removed) hold NaN. Both
+    dimensions grow by doubling, and ``reserve`` can size them up front.
+    Accessors return views into the blocks, not copies. After
+    ``attach_trajectory`` the agent blocks live in a ``MemmapTrajectory`` on
+    disk instead of in memory.
+    """
+
+    def __init__(
+        self,
+        model_columns: Sequence[str],
+        agent_columns: Sequence[str] = (),
+        agent_dtype: np.dtype | type = np.float64,
+        capacity: int = 64,
+        agent_capacity: int = 0,
+    ) -> None:
+        self.model_columns = tuple(model_columns)
+        self.agent_columns = tuple(agent_columns)
+        self.agent_dtype = np.dtype(agent_dtype)
+        self.rows = 0
+        self.agent_width = 0
+        self._column_index = {name: j for j, name in enumerate(self.model_columns)}
+        self._steps = np.zeros(capacity, dtype=np.int64)
+        self._model = np.zeros((len(self.model_columns), capacity))
+        self._agents = {
+            name: np.full((capacity, agent_capacity), np.nan, dtype=self.agent_dtype)
+            for name in self.agent_columns
+        }
+        self.trajectory: MemmapTrajectory | None = None
+
+    def attach_trajectory(self, trajectory: MemmapTrajectory) -> None:
+        """Move the agent blocks, and every later agent row, to ``trajectory``."""
+        if set(trajectory.columns) != set(self.agent_columns):
+            raise ValueError("trajectory columns must match the agent columns")
+        trajectory.reserve(self.capacity, self.agent_width)
+        for row in range(self.rows):
+            trajectory.append(
+                int(self._steps[row]),
+                {name: block[row, : self.agent_width] for name, block in self._agents.items()},
+            )
+        self.trajectory = trajectory
+        self._agents = {name: np.empty((0, 0), dtype=self.agent_dtype) for name in self._agents}
+
+    def add_model_columns(self, names: Sequence[str]) -> None:
+        """Add model columns; rows recorded before hold NaN in them."""
+        names = [name for name in names if name not in self._column_index]
+        if not names:
+            return
+        added = np.full((len(names), self.capacity), np.nan)
+        self._model = np.vstack([self._model, added])
+        for name in names:
+            self._column_index[name] = len(self.model_columns)
+            self.model_columns += (name,)
+
+    @property
+    def capacity(self) -> int:
+        """Number of steps that fit before the next reallocation."""
+        return len(self._steps)
+
+    @property
+    def agent_capacity(self) -> int:
+        """Number of agent slots that fit before the next reallocation."""
+        if self.trajectory is not None:
+            return self.trajectory.agent_capacity
+        if not self._agents:
+            return 0
+        return next(iter(self._agents.values())).shape[1]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes currently allocated in memory for all blocks."""
+        return (
+            self._steps.nbytes
+            + self._model.nbytes
+            + sum(block.nbytes for block in self._agents.values())
+        )
+
+    def reserve(self, rows: int, agents: int = 0) -> None:
+        """Make room for at least ``rows`` steps and ``agents`` slots."""
+        if rows > self.capacity:
+            self._resize(rows, self.agent_capacity)
+        if agents > self.agent_capacity:
+            self._resize(self.capacity, agents)
+
+    def _resize(self, rows: int, agents: int) -> None:
+        """Reallocate every block to the given shape, keeping existing data."""
+        steps = np.zeros(rows, dtype=np.int64)
+        steps[: self.rows] = self._steps[: self.rows]
+        self._steps = steps
+
+        model = np.zeros((len(self.model_columns), rows))
+        model[:, : self.rows] = self._model[:, : self.rows]
+        self._model = model
+
+        if self.trajectory is not None:
+            self.trajectory.reserve(rows, agents)
+            return
+        for name, block in self._agents.items():
+            grown = np.full((rows, agents), np.nan, dtype=self.agent_dtype)
+            grown[: self.rows, : self.agent_width] = block[: self.rows, : self.agent_width]
+            self._agents[name] = grown
+
+    def append(
+        self,
+        step: int,
+        model_values: Sequence[float],
+        agent_values: Mapping[str, np.ndarray] | None = None,
+    ) -> None:
+        """Store one step: a value per model column and a row per agent column."""
+        agent_values = agent_values or {}
+        width = max((len(values) for values in agent_values.values()), default=0)
+        rows = self.capacity
+        if self.rows == rows:
+            rows = max(1, 2 * rows)
+        agents = self.agent_capacity
+        if width > agents:
+            agents = max(width, 2 * agents)
+        if (rows, agents) != (self.capacity, self.agent_capacity):
+            self._resize(rows, agents)
+
+        row = self.rows
+        self._steps[row] = step
+        self._model[:, row] = model_values
+        if self.trajectory is not None:
+            self.trajectory.append(step, agent_values)
+        else:
+            for name, values in agent_values.items():
+                self._agents[name][row, : len(values)] = values
+        self.agent_width = max(self.agent_width, width)
+
+        self.rows += 1
+
+    def flush(self) -> None:
+        """Write the trajectory's pending pages and metadata to disk, if any."""
+        if self.trajectory is not None:
+            self.trajectory.flush()
+
+    @property
+    def steps(self) -> np.ndarray:
+        """Model step number of every recorded row."""
+        return self._steps[: self.rows]
+
+    def model_column(self, name: str) -> np.ndarray:
+        """Return the history of one model metric."""
+        return self._model[self._column_index[name], : self.rows]
+
+    def agent_matrix(self, name: str) -> np.ndarray:
+        """Return the ``steps x agents`` history of one agent attribute."""
+        if self.trajectory is not None:
+            return self.trajectory.matrix(name)
+        return self._agents[name][: self.rows, : self.agent_width]
@@ -0,0 +1,92 @@
+"""Type-indexed agent registry."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+
+from mesa import Agent
+
+
+class AgentIndex:
+    """A dense list of agents with O(1) add, remove and position lookup.
+
+    Removal moves the last agent into the freed slot, so ``agents`` stays
+    contiguous and can be indexed directly for random sampling.
+    """
+
+    def __init__(self) -> None:
+        self.agents: list[Agent] = []
+        self.positions: dict[Agent, int] = {}
+
+    def add(self, agent: Agent) -> None:
+        self.positions[agent] = len(self.agents)
+        self.agents.append(agent)
+
+    def extend(self, agents: Sequence[Agent]) -> None:
+        start = len(self.agents)
+        self.positions.update(zip(agents, range(start, start + len(agents))))
+        self.agents.extend(agents)
+
+    def remove(self, agent: Agent) -> None:
+        position = self.positions.pop(agent)
+        last = self.agents.pop()
+        if last is not agent:
+            self.agents[position] = last
+            self.positions[last] = position
+
+    def __len__(self) -> int:
+        return len(self.agents)
+
+    def __iter__(self) -> Iterator[Agent]:
+        return iter(self.agents)
+
+
+class TypeRegistry:
+    """An ``AgentIndex`` of every agent plus one per requested agent class.
+
+    An agent is indexed under each indexed class in its MRO, so
+    ``index(PersonAgent)`` also yields subclasses of ``PersonAgent`` and
+    ``index(Agent)`` yields every agent. Classes are indexed only once they
+    are asked for, since every index costs memory per agent; a new index is
+    filled by one scan of all agents.
+    """
+
+    def __init__(self) -> None:
+        self._indexes: dict[type[Agent], AgentIndex] = {Agent: AgentIndex()}
+        self._lineage: dict[type[Agent], tuple[AgentIndex, ...]] = {}
+
+    def _indexes_for(self, agent_type: type[Agent]) -> tuple[AgentIndex, ...]:
+        """Return the indexes an agent type belongs to, memoized."""
+        indexes = self._lineage.get(agent_type)
+        if indexes is None:
+            indexes = tuple(
+                self._indexes[cls] for cls in agent_type.__mro__ if cls in self._indexes
+            )
+            self._lineage[agent_type] = indexes
+        return indexes
+
+    def add(self, agent: Agent) -> None:
+        for index in self._indexes_for(type(agent)):
+            index.add(agent)
+
+    def add_many(self, agent_type: type[Agent], agents: Sequence[Agent]) -> None:
+        """Index many agents that are all exactly of ``agent_type``."""
+        for index in self._indexes_for(agent_type):
+            index.extend(agents)
+
+    def remove(self, agent: Agent) -> None:
+        for index in self._indexes_for(type(agent)):
+            index.remove(agent)
+
+    def indexes(self) -> list[AgentIndex]:
+        """Return every index, one per indexed class."""
+        return list(self._indexes.values())
+
+    def index(self, agent_type: type[Agent]) -> AgentIndex:
+        """Return the index for a type, building it on first request."""
+        index = self._indexes.get(agent_type)
+        if index is None:
+            index = self._indexes[agent_type] = AgentIndex()
+            index.extend([a for a in self._indexes[Agent] if isinstance(a, agent_type)])
+            self._lineage.clear()
+        return index
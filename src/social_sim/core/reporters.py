@@ -0,0 +1,24 @@
+"""Model reporters that share one pass over the population."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+
+class FusedReporter:
+    """Several model reporters computed together once per collect.
+
+    ``compute`` receives the model and returns a mapping with a value for
+    every name in ``names``. ``BaseModel.setup_datacollector`` registers one
+    DataCollector column per name; the first column read in a collect runs
+    ``compute`` and the remaining columns reuse its result.
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        compute: Callable[[Any], dict[str, float]],
+    ) -> None:
+        self.names = tuple(names)
+        self.compute = compute
@@ -0,0 +1,102 @@
+"""Reproducible random substreams derived from one seed."""
+
+from __future__ import annotations
+
+import random
+import zlib
+
+import numpy as np
+
+StreamKey = int | str
+
+# Items per block in ``RNGService.random_blocks``.
+BLOCK_SIZE = 1 << 16
+
+
+def _spawn_key(key: tuple[StreamKey, ...]) -> tuple[int, ...]:
+    """Map a stream key to a ``SeedSequence`` spawn key; strings hash stably."""
+    return tuple(
+        part if isinstance(part, int) else zlib.crc32(part.encode()) for part in key
+    )
+
+
+class RNGService:
+    """Independent NumPy generators addressed by keys, all derived from one seed.
+
+    A key is a tuple of names and numbers, such as ``("trade", step, block)``
+    or ``("ensemble", member)``. The same seed and key always give the same
+    stream, and distinct keys give statistically independent streams (they
+    become ``SeedSequence`` spawn keys), so results do not depend on which
+    process draws a stream or in what order streams are used. ``stream``
+    returns a long-lived generator per key, suited to a model phase;
+    ``generator`` returns a fresh one each call. ``scalar_stream`` is the
+    ``random.Random`` counterpart for agent code that draws one value at a
+    time, where NumPy's per-call overhead would dominate.
+    """
+
+    def __init__(self, seed: int | None = None) -> None:
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self._streams: dict[tuple[StreamKey, ...], np.random.Generator] = {}
+        self._scalar_streams: dict[tuple[StreamKey, ...], random.Random] = {}
+
+    @property
+    def entropy(self) -> int:
+        """The root entropy; pass it as ``seed`` to rebuild an identical service."""
+        return self.seed_sequence.entropy  # type: ignore[return-value]
+
+    def seed_for(self, *key: StreamKey) -> np.random.SeedSequence:
+        return np.random.SeedSequence(self.seed_sequence.entropy, spawn_key=_spawn_key(key))
+
+    def generator(self, *key: StreamKey) -> np.random.Generator:
+        """Return a new generator positioned at the start of the keyed stream."""
+        return np.random.Generator(np.random.PCG64(self.seed_for(*key)))
+
+    def stream(self, *key: StreamKey) -> np.random.Generator:
+        """Return the persistent generator for a key, created on first use."""
+        generator = self._streams.get(key)
+        if generator is None:
+            generator = self._streams[key] = self.generator(*key)
+        return generator
+
+    def scalar_stream(self, *key: StreamKey) -> random.Random:
+        """Return the persistent ``random.Random`` for a key, created on first use.
+
+        It is seeded from the keyed seed sequence under a ``"scalar"`` prefix,
+        so it is independent of ``stream(*key)``.
+        """
+        rand = self._scalar_streams.get(key)
+        if rand is None:
+            state = self.seed_for("scalar", *key).generate_state(4, np.uint64)
+            seed = int.from_bytes(state.tobytes(), "little")
+            rand = self._scalar_streams[key] = random.Random(seed)
+        return rand
+
+    def spawn(self, count: int, *key: StreamKey) -> list[np.random.Generator]:
+        """Return ``count`` independent generators, e.g. one per ensemble member."""
+        return [self.generator(*key, member) for member in range(count)]
+
+    def seeds(self, count: int, *key: StreamKey) -> list[int]:
+        """Return ``count`` independent integer seeds, e.g. one per ensemble model.
+
+        Seed ``i`` comes from the same key as ``spawn``'s ``i``-th generator.
+        """
+        return [
+            int(self.seed_for(*key, member).generate_state(1, np.uint64)[0])
+            for member in range(count)
+        ]
+
+    def random_blocks(self, lo: int, hi: int, *key: StreamKey) -> np.ndarray:
+        """Uniform ``[0, 1)`` draws for items ``lo..hi-1``, independent of the split.
+
+        Item ``i`` takes its value from the generator keyed ``(*key, block)``
+        with ``block = i // BLOCK_SIZE``, so any partition of a range into
+        batches or shards yields exactly the same values per item.
+        """
+        if hi <= lo:
+            return np.empty(0)
+        draws = []
+        for block in range(lo // BLOCK_SIZE, (hi - 1) // BLOCK_SIZE + 1):
+            start = block * BLOCK_SIZE
+            values = self.generator(*key, block).random(BLOCK_SIZE)
+            draws.append(values[max(lo, start) - start : min(hi, start + BLOCK_SIZE) - start])
+        return np.concatenate(draws)
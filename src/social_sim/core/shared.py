@@ -0,0 +1,68 @@
+"""NumPy arrays in a shared-memory segment, visible to worker processes."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+ArraySpec = tuple[tuple[int, ...], str]
+
+_ALIGNMENT = 64
+
+
+def _layout(specs: Mapping[str, ArraySpec]) -> tuple[dict[str, int], int]:
+    """Return cache-line aligned byte offsets for each array and the total size."""
+    offsets: dict[str, int] = {}
+    size = 0
+    for name, (shape, dtype) in specs.items():
+        offsets[name] = size
+        nbytes = int(np.prod(shape, dtype=np.int64)) * np.dtype(dtype).itemsize
+        size += -(-nbytes // _ALIGNMENT) * _ALIGNMENT
+    return offsets, size
+
+
+class SharedArrays:
+    """Named arrays packed into one ``multiprocessing.shared_memory`` segment.
+
+    The creating process owns the segment and must ``unlink`` it; its child
+    processes ``attach`` by name with the same specs and only ``close``
+    (they share the owner's resource tracker, so nothing is tracked twice).
+    Arrays are views into the segment, so all processes see each other's
+    writes without copying. Every view must be dropped before ``close``.
+    """
+
+    def __init__(self, specs: Mapping[str, ArraySpec], name: str | None = None) -> None:
+        self.specs = dict(specs)
+        offsets, size = _layout(self.specs)
+        self.owner = name is None
+        self._shm = SharedMemory(name=name, create=self.owner, size=max(size, 1))
+        self.arrays: dict[str, np.ndarray] = {
+            key: np.ndarray(shape, dtype=dtype, buffer=self._shm.buf, offset=offsets[key])
+            for key, (shape, dtype) in self.specs.items()
+        }
+
+    @classmethod
+    def attach(cls, name: str, specs: Mapping[str, ArraySpec]) -> SharedArrays:
+        return cls(specs, name=name)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def nbytes(self) -> int:
+        return self._shm.size
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        return self.arrays[key]
+
+    def close(self) -> None:
+        """Drop this process's views and mapping of the segment."""
+        self.arrays.clear()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Free the segment; call once, from the owner, after ``close``."""
+        self._shm.unlink()
@@ -0,0 +1,62 @@
+"""Criteria for ending a model run early, and the summary of how a run ended."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Literal
+
+import numpy as np
+from pydantic import BaseModel as PydanticModel, Field
+
+StopReason = Literal["completed", "converged", "step_budget", "time_budget", "stopped"]
+
+
+class StoppingCriteria(PydanticModel):
+    """When ``BaseModel.run`` ends before its step count.
+
+    The run has converged once every reporter in ``metrics`` has stayed
+    within ``tolerance`` over the last ``window`` checks, i.e. its max minus
+    min is at most ``tolerance * max(1, |latest value|)`` (absolute for
+    small values, relative for large ones). Reporters are checked after
+    every ``check_every``-th step and convergence is only accepted after
+    ``min_steps`` steps. ``max_steps`` and ``max_seconds`` are budgets for
+    one run; an empty ``metrics`` list leaves only the budgets.
+    """
+
+    metrics: list[str] = Field(default_factory=lambda: ["Gini", "Mean Wealth", "Mean Happiness"])
+    window: int = Field(default=20, ge=2)
+    tolerance: float = Field(default=1e-3, ge=0)
+    check_every: int = Field(default=1, ge=1)
+    min_steps: int = Field(default=0, ge=0)
+    max_steps: int | None = Field(default=None, ge=0)
+    max_seconds: float | None = Field(default=None, gt=0)
+
+
+class RunSummary(PydanticModel):
+    """How a run ended: why, at which model step, and how much it ran."""
+
+    reason: StopReason
+    step: int
+    steps_run: int
+    seconds: float
+
+
+class ConvergenceMonitor:
+    """A sliding window of reporter values that detects a steady state."""
+
+    def __init__(self, criteria: StoppingCriteria) -> None:
+        self.criteria = criteria
+        self._window = np.empty((criteria.window, len(criteria.metrics)))
+        self._count = 0
+
+    def observe(self, values: Sequence[float]) -> bool:
+        """Add one check's values; return whether the window has converged."""
+        window = self._window
+        latest = self._count % len(window)
+        window[latest] = values
+        self._count += 1
+        if self._count < len(window):
+            return False
+        spread = window.max(axis=0) - window.min(axis=0)
+        scale = np.maximum(1.0, np.abs(window[latest]))
+        return bool(np.all(spread <= self.criteria.tolerance * scale))
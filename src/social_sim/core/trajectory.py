@@ -0,0 +1,226 @@
+"""Agent trajectories stored in memory-mapped files on disk."""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+
+import numpy as np
+
+METADATA_FILE = "trajectory.json"
+
+
+class MemmapTrajectory:
+    """Per-step agent attributes written to ``numpy.memmap`` files as a run goes.
+
+    Each column is a ``steps x agents`` matrix (float32 by default) in its
+    own raw file in ``directory``; ``trajectory.json`` records the layout.
+    The page cache holds only the rows being written or read, so a history
+    far larger than RAM fits on disk. Rows grow by extending the files
+    (cheap and sparse); more agent slots need a one-off rewrite, so size
+    ``agents`` up front when the population will grow. ``matrix`` returns
+    views of the mapped files, without copying, and ``open`` maps a finished
+    trajectory read-only for analysis. ``archive`` writes a compressed copy
+    in row chunks that ``read_archive`` can read back piecewise.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        columns: Sequence[str],
+        dtype: np.dtype | type = np.float32,
+        agents: int = 0,
+        capacity: int = 64,
+        *,
+        mode: str = "w+",
+    ) -> None:
+        self.directory = Path(directory)
+        self.columns = tuple(columns)
+        self.dtype = np.dtype(dtype)
+        self.mode = mode
+        self.rows = 0
+        self.width = 0
+        self._files = {name: f"column{j}.bin" for j, name in enumerate(self.columns)}
+        self._capacity = 0
+        self._agent_capacity = agents
+        self._steps: np.ndarray = np.empty(0, dtype=np.int64)
+        self._blocks: dict[str, np.ndarray] = {}
+        if mode == "w+":
+            self.directory.mkdir(parents=True, exist_ok=True)
+            for path in self._paths():
+                path.write_bytes(b"")
+            self._map(max(1, capacity), agents)
+            self.flush()
+
+    @classmethod
+    def open(cls, directory: str | Path, mode: str = "r") -> MemmapTrajectory:
+        """Map an existing trajectory, read-only by default (``"r+"`` to append)."""
+        directory = Path(directory)
+        meta = json.loads((directory / METADATA_FILE).read_text())
+        trajectory = cls(directory, meta["columns"], meta["dtype"], meta["agents"], mode=mode)
+        trajectory.rows = meta["rows"]
+        trajectory.width = meta["width"]
+        trajectory._map(meta["capacity"], meta["agents"])
+        return trajectory
+
+    @property
+    def capacity(self) -> int:
+        """Number of steps that fit in the files before they are extended."""
+        return self._capacity
+
+    @property
+    def agent_capacity(self) -> int:
+        return self._agent_capacity
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes reserved on disk for all columns."""
+        return sum(block.nbytes for block in self._blocks.values()) + self._steps.nbytes
+
+    def _paths(self) -> list[Path]:
+        """The step-number file followed by one file per column."""
+        return [self.directory / "steps.bin"] + [
+            self.directory / self._files[name] for name in self.columns
+        ]
+
+    def _map(self, rows: int, agents: int) -> None:
+        """(Re)map every file with shape ``rows x agents``, extending it if needed."""
+        mode = "r" if self.mode == "r" else "r+"
+        paths = self._paths()
+        sizes = [rows * 8] + [rows * agents * self.dtype.itemsize] * len(self.columns)
+        if mode == "r+":
+            for path, size in zip(paths, sizes):
+                with open(path, "ab") as handle:
+                    if handle.tell() < size:
+                        handle.truncate(size)
+        self._steps = self._memmap(paths[0], np.int64, (rows,), mode)
+        self._blocks = {
+            name: self._memmap(path, self.dtype, (rows, agents), mode)
+            for name, path in zip(self.columns, paths[1:])
+        }
+        self._capacity = rows
+        self._agent_capacity = agents
+
+    @staticmethod
+    def _memmap(
+        path: Path,
+        dtype: np.dtype | type,
+        shape: tuple[int, ...],
+        mode: str,
+    ) -> np.ndarray:
+        if 0 in shape:
+            return np.empty(shape, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode=mode, shape=shape)
+
+    def reserve(self, rows: int, agents: int = 0) -> None:
+        """Make room for at least ``rows`` steps and ``agents`` slots."""
+        if agents > self._agent_capacity:
+            self._widen(agents)
+        if rows > self._capacity:
+            self._map(rows, self._agent_capacity)
+
+    def _widen(self, agents: int) -> None:
+        """Rewrite every column file with ``agents`` slots per row."""
+        old_blocks = self._blocks
+        rows = self._capacity
+        for name in self.columns:
+            path = self.directory / self._files[name]
+            wider = path.with_suffix(".tmp")
+            block = np.memmap(wider, dtype=self.dtype, mode="w+", shape=(rows, agents))
+            block[: self.rows, : self._agent_capacity] = old_blocks[name][: self.rows]
+            block[: self.rows, self._agent_capacity :] = np.nan
+            block.flush()
+            del block
+            old_blocks[name] = np.empty(0)
+            os.replace(wider, path)
+        self._map(rows, agents)
+
+    def append(self, step: int, values: Mapping[str, np.ndarray]) -> None:
+        """Write one step: a row per column, NaN past each row's values."""
+        width = max((len(row) for row in values.values()), default=0)
+        agents = self._agent_capacity
+        if width > agents:
+            self.reserve(self._capacity, max(width, 2 * agents))
+        if self.rows == self._capacity:
+            self.reserve(2 * self._capacity)
+
+        row = self.rows
+        self._steps[row] = step
+        for name in self.columns:
+            block = self._blocks[name]
+            data = values.get(name)
+            filled = 0 if data is None else len(data)
+            if filled:
+                block[row, :filled] = data
+            block[row, filled:] = np.nan
+        self.width = max(self.width, width)
+        self.rows += 1
+
+    @property
+    def steps(self) -> np.ndarray:
+        """Model step number of every written row."""
+        return self._steps[: self.rows]
+
+    def matrix(self, name: str) -> np.ndarray:
+        """Return the ``steps x agents`` history of one column as a mapped view."""
+        return self._blocks[name][: self.rows, : self.width]
+
+    def flush(self) -> None:
+        """Write pending pages and the metadata, so ``open`` sees every row."""
+        for block in (self._steps, *self._blocks.values()):
+            if isinstance(block, np.memmap):
+                block.flush()
+        meta = {
+            "columns": list(self.columns),
+            "dtype": self.dtype.str,
+            "rows": self.rows,
+            "width": self.width,
+            "capacity": self._capacity,
+            "agents": self._agent_capacity,
+        }
+        (self.directory / METADATA_FILE).write_text(json.dumps(meta))
+
+    def archive(self, path: str | Path, chunk_rows: int = 1024) -> None:
+        """Write a compressed ``.npz`` copy, one zip member per column chunk.
+
+        Each member holds ``chunk_rows`` steps, so ``read_archive`` only
+        decompresses the chunks covering the rows it is asked for.
+        """
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows must be at least 1")
+        meta = {
+            "columns": list(self.columns),
+            "rows": self.rows,
+            "width": self.width,
+            "chunk_rows": chunk_rows,
+        }
+        arrays = {"meta": np.array(json.dumps(meta)), "steps": np.asarray(self.steps)}
+        for j, name in enumerate(self.columns):
+            matrix = self.matrix(name)
+            for chunk, start in enumerate(range(0, self.rows, chunk_rows)):
+                arrays[f"c{j}_{chunk:06d}"] = np.asarray(matrix[start : start + chunk_rows])
+        np.savez_compressed(path, **arrays)
+
+
+def read_archive(
+    path: str | Path,
+    name: str,
+    start: int = 0,
+    stop: int | None = None,
+) -> np.ndarray:
+    """Read rows ``start:stop`` of one column from a ``MemmapTrajectory.archive``."""
+    with np.load(path) as archive:
+        meta = json.loads(str(archive["meta"]))
+        column = meta["columns"].index(name)
+        stop = meta["rows"] if stop is None else min(stop, meta["rows"])
+        chunk_rows = meta["chunk_rows"]
+        if stop <= start:
+            return np.empty((0, meta["width"]))
+        pieces = []
+        for chunk in range(start // chunk_rows, (stop - 1) // chunk_rows + 1):
+            first = chunk * chunk_rows
+            data = archive[f"c{column}_{chunk:06d}"]
+            pieces.append(data[max(start, first) - first : stop - first])
+        return np.concatenate(pieces)
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import random
 import uuid
+from typing import Literal
 
 import numpy as np
 
-from social_sim.agents.person import PersonAgent
+from social_sim.analysis.inequality import PERCENTILES
+from social_sim.core.model import CollectionPolicy
 from social_sim.game.events import (
     ActiveEffect,
     EventDef,
@@ -15,22 +16,24 @@ from social_sim.game.events import (
     tick_active_effects,
 )
 from social_sim.game.schemas import (
+    AgentWealth,
     EventResponse,
     HistoryData,
     PolicySet,
+    PopulationResponse,
     Scores,
     TurnResponse,
     TurnState,
 )
 from social_sim.game.scoring import calculate_all
 from social_sim.models.basic_economy import (
-    BasicEconomyModel,
     EconomyParams,
     EducationParams,
     IncomeParams,
     TaxBracket,
     TaxParams,
 )
+from social_sim.models.factory import create_economy_model
 
 
 class GameEngine:
@@ -40,6 +43,8 @@ class GameEngine:
         difficulty: str = "normal",
         max_turns: int = 20,
         steps_per_turn: int = 5,
+        backend: str = "agent",
+        collection: Literal["off", "turn", "step"] = "turn",
     ) -> None:
         self.game_id = str(uuid.uuid4())
         self.turn = 0
@@ -56,9 +61,16 @@ class GameEngine:
             num_agents=100,
             initial_wealth=10.0,
             seed=seed,
+            backend=backend,
         )
-        self.model = BasicEconomyModel(params)
-        self.rng = random.Random(seed)
+        self.model = create_economy_model(params)
+        self.collection = collection
+        # The game reads end-of-turn state itself, so per-step rows are opt-in.
+        if collection != "step":
+            self.model.collection = CollectionPolicy(mode="manual")
+        # Events draw from their own stream of the model's seed, so they never
+        # shift the economy's draws (and vice versa).
+        self.rng = self.model.rngs.stream("events")
 
     @property
     def is_finished(self) -> bool:
@@ -80,6 +92,8 @@ class GameEngine:
 
         self.active_effects = tick_active_effects(self.active_effects)
         self.turn += 1
+        if self.collection == "turn":
+            self.model.collect()
 
         state = self._take_snapshot()
         self._record_history(state)
@@ -114,6 +128,7 @@ class GameEngine:
             TaxBracket(threshold=b.threshold, rate=b.rate)
             for b in p.tax_brackets
         ]
+        ep.tax.mode = p.tax_mode
         ep.tax.ubi_enabled = p.ubi_enabled
 
         ep.income.enabled = p.income_enabled
@@ -121,13 +136,12 @@ class GameEngine:
 
         ep.education.enabled = p.education_enabled
         ep.education.investment_rate = p.education_rate
+        self.model.compile_phases()
 
     def _apply_active_effects(self) -> None:
         for eff in self.active_effects:
             if eff.type == "productivity_modifier":
-                for agent in self.model.agents:
-                    if isinstance(agent, PersonAgent):
-                        agent.productivity *= (1 + eff.value)
+                self.model.scale_productivity(1 + eff.value)
             elif eff.type == "income_modifier":
                 self.model.economy_params.income.base_income *= (1 + eff.value)
 
@@ -136,11 +150,7 @@ class GameEngine:
             eff = event.effect
 
             if eff.type == "wealth_damage":
-                for agent in self.model.agents:
-                    if isinstance(agent, PersonAgent):
-                        damage = agent.wealth * eff.value
-                        agent.wealth -= damage
-                        self.total_disaster_damage += damage
+                self.total_disaster_damage += self.model.apply_wealth_shock(eff.value)
 
             elif eff.type == "productivity_modifier":
                 if eff.duration > 0:
@@ -153,9 +163,7 @@ class GameEngine:
                         )
                     )
                 else:
-                    for agent in self.model.agents:
-                        if isinstance(agent, PersonAgent):
-                            agent.productivity *= (1 + eff.value)
+                    self.model.scale_productivity(1 + eff.value)
 
             elif eff.type == "income_modifier":
                 if eff.duration > 0:
@@ -171,44 +179,86 @@ class GameEngine:
                     self.model.economy_params.income.base_income *= (1 + eff.value)
 
             elif eff.type == "add_agents":
-                for _ in range(int(eff.value)):
-                    productivity = self.rng.uniform(0.5, 1.5)
-                    mean_wealth = float(np.mean([
-                        a.wealth for a in self.model.agents
-                        if isinstance(a, PersonAgent)
-                    ]))
-                    PersonAgent(
-                        self.model,
-                        wealth=mean_wealth * 0.5,
-                        productivity=productivity,
-                    )
+                current_wealth = self.model.get_wealth()
+                total_wealth = float(current_wealth.sum())
+                population = len(current_wealth)
+                count = int(eff.value)
+                new_wealth: list[float] = []
+                new_productivity = self.rng.uniform(0.5, 1.5, size=count)
+                # Each newcomer starts at half the mean, including earlier newcomers.
+                for _ in range(count):
+                    wealth = total_wealth / population * 0.5
+                    new_wealth.append(wealth)
+                    total_wealth += wealth
+                    population += 1
+                self.model.add_citizens(new_wealth, new_productivity)
 
     def _take_snapshot(self) -> TurnState:
-        person_agents = [
-            a for a in self.model.agents if isinstance(a, PersonAgent)
-        ]
-        wealth_values = [a.wealth for a in person_agents]
-        population = len(person_agents)
+        distribution = self.model.wealth_index
+        population = distribution.n
 
         bins = [0, 2, 5, 10, 20, 35, 50, float("inf")]
-        wealth_distribution = []
-        for i in range(len(bins) - 1):
-            count = sum(1 for w in wealth_values if bins[i] <= w < bins[i + 1])
-            wealth_distribution.append(count)
+        percentiles = distribution.percentiles(PERCENTILES)
 
         return TurnState(
-            gini=self.model._compute_gini(self.model),
-            mean_wealth=float(np.mean(wealth_values)) if wealth_values else 0.0,
-            mean_happiness=float(np.mean([a.happiness for a in person_agents])) if person_agents else 0.0,
-            mean_productivity=float(np.mean([a.productivity for a in person_agents])) if person_agents else 0.0,
+            gini=distribution.gini(),
+            mean_wealth=distribution.mean,
+            mean_happiness=float(np.mean(self.model.get_happiness())) if population else 0.0,
+            mean_productivity=float(np.mean(self.model.get_productivity())) if population else 0.0,
             tax_revenue=self.model.tax_revenue,
             ubi_amount=self.model.ubi_amount,
             total_income=self.model.total_income,
             population=population,
-            agents_in_poverty=sum(1 for w in wealth_values if w < 1.0),
-            agents_bankrupt=sum(1 for w in wealth_values if w <= 0),
-            wealth_distribution=wealth_distribution,
+            agents_in_poverty=distribution.count_below(1.0),
+            agents_bankrupt=distribution.count_at_most(0.0),
+            wealth_distribution=distribution.histogram(bins),
+            theil=distribution.theil(),
+            atkinson=distribution.atkinson(),
+            palma=distribution.palma(),
+            top_1_share=distribution.top_share(0.01),
+            top_10_share=distribution.top_share(0.10),
+            wealth_percentiles={
+                f"p{q}": float(value) for q, value in zip(PERCENTILES, percentiles)
+            },
+        )
+
+    def population(
+        self,
+        top: int = 10,
+        min_wealth: float | None = None,
+        max_wealth: float | None = None,
+        agent_id: int | None = None,
+    ) -> PopulationResponse:
+        """Inspect the population through the model's wealth index.
+
+        Lists the ``top`` richest agents, counts agents with wealth in
+        ``[min_wealth, max_wealth)`` when either bound is given, and looks
+        up ``agent_id`` (raising ``ValueError`` if no such agent lives).
+        """
+        index = self.model.wealth_index
+
+        def describe(slot: int) -> AgentWealth:
+            return AgentWealth(
+                agent_id=slot + 1,
+                wealth=index.wealth_of(slot),
+                percentile_rank=index.percentile_rank(slot),
+            )
+
+        slots, _ = index.top(top)
+        response = PopulationResponse(
+            game_id=self.game_id,
+            turn=self.turn,
+            population=index.n,
+            richest=[describe(int(slot)) for slot in slots],
         )
+        if min_wealth is not None or max_wealth is not None:
+            response.agents_in_band = index.count_between(
+                -np.inf if min_wealth is None else min_wealth,
+                np.inf if max_wealth is None else max_wealth,
+            )
+        if agent_id is not None:
+            response.agent = describe(agent_id - 1)
+        return response
 
     def _record_history(self, state: TurnState) -> None:
         self.history.gini.append(state.gini)
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import random
 from dataclasses import dataclass, field
 
+import numpy as np
+
 
 @dataclass
 class EventEffect:
@@ -100,16 +101,17 @@ DIFFICULTY_MULTIPLIERS: dict[str, tuple[float, float]] = {
 
 
 def roll_events(
-    rng: random.Random,
+    rng: np.random.Generator,
     difficulty: str = "normal",
 ) -> list[EventDef]:
     neg_mult, pos_mult = DIFFICULTY_MULTIPLIERS.get(difficulty, (1.0, 1.0))
     triggered: list[EventDef] = []
 
-    for event in EVENT_CATALOG:
+    # One batched draw per turn, one value per catalog event.
+    for event, draw in zip(EVENT_CATALOG, rng.random(len(EVENT_CATALOG)).tolist()):
         mult = neg_mult if event.is_negative else pos_mult
         prob = event.base_probability * mult
-        if rng.random() < prob:
+        if draw < prob:
             triggered.append(event)
 
     return triggered
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -18,6 +20,7 @@ class PolicySet(BaseModel):
         TaxBracketInput(threshold=30, rate=0.2),
         TaxBracketInput(threshold=50, rate=0.3),
     ])
+    tax_mode: Literal["flat", "marginal"] = "flat"
     ubi_enabled: bool = False
     income_enabled: bool = True
     base_income: float = 1.0
@@ -29,6 +32,7 @@ class CreateGameRequest(BaseModel):
     player_name: str = "Player"
     difficulty: str = "normal"
     seed: int | None = None
+    backend: Literal["agent", "array"] = "agent"
 
 
 class TurnRequest(BaseModel):
@@ -54,6 +58,12 @@ class TurnState(BaseModel):
     agents_in_poverty: int
     agents_bankrupt: int
     wealth_distribution: list[int]
+    theil: float = 0.0
+    atkinson: float = 0.0
+    palma: float = 0.0
+    top_1_share: float = 0.0
+    top_10_share: float = 0.0
+    wealth_percentiles: dict[str, float] = Field(default_factory=dict)
 
 
 class Scores(BaseModel):
@@ -93,3 +103,18 @@ class GameResponse(BaseModel):
     history: HistoryData
     scores: Scores | None
     policies: PolicySet
+
+
+class AgentWealth(BaseModel):
+    agent_id: int
+    wealth: float
+    percentile_rank: float
+
+
+class PopulationResponse(BaseModel):
+    game_id: str
+    turn: int
+    population: int
+    richest: list[AgentWealth]
+    agents_in_band: int | None = None
+    agent: AgentWealth | None = None
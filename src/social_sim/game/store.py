@@ -10,8 +10,9 @@ _games: dict[str, GameEngine] = {}
 def create_game(
     seed: int | None = None,
     difficulty: str = "normal",
+    backend: str = "agent",
 ) -> GameEngine:
-    engine = GameEngine(seed=seed, difficulty=difficulty)
+    engine = GameEngine(seed=seed, difficulty=difficulty, backend=backend)
     _games[engine.game_id] = engine
     return engine
 
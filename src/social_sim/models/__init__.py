@@ -1,5 +1,31 @@
 """Model implementations."""
 
+from .array_economy import ArrayEconomyModel
 from .basic_economy import BasicEconomyModel
+from .catalog import ExperimentCatalog
+from .distributions import Distribution
+from .ensemble import EnsembleMember, EnsembleRunner
+from .factory import EconomyModel, create_economy_model
+from .parallel_economy import ParallelEconomyModel
+from .scenario import ScenarioResult, run_scenario
+from .sensitivity import ParameterRange, SensitivityAnalysis, SensitivityResult
+from .sweep import SweepManager, SweepSpec
 
-__all__ = ["BasicEconomyModel"]
+__all__ = [
+    "ArrayEconomyModel",
+    "BasicEconomyModel",
+    "Distribution",
+    "EconomyModel",
+    "EnsembleMember",
+    "EnsembleRunner",
+    "ExperimentCatalog",
+    "ParallelEconomyModel",
+    "ParameterRange",
+    "ScenarioResult",
+    "SensitivityAnalysis",
+    "SensitivityResult",
+    "SweepManager",
+    "SweepSpec",
+    "create_economy_model",
+    "run_scenario",
+]
@@ -0,0 +1,268 @@
+"""NumPy struct-of-arrays backend for the basic economy model."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from social_sim.analysis.inequality import WealthIndex
+from social_sim.core.model import BaseModel
+from social_sim.core.reporters import FusedReporter
+from social_sim.models.basic_economy import (
+    ECONOMY_PHASES,
+    EconomyParams,
+    compute_gini,
+    compute_happiness,
+    draw_initial_population,
+    population_reporter_names,
+    summarize_population,
+)
+from social_sim.models.network import CSRGraph
+from social_sim.models.tax import TaxSchedule
+from social_sim.models.trade import (
+    draw_network_partners,
+    draw_partners,
+    exchange_synchronously,
+)
+
+
+class ArrayEconomyModel(BaseModel):
+    """The basic economy model with citizens stored as contiguous arrays.
+
+    Wealth, happiness and productivity live in one float array each, indexed
+    by citizen, which is also the citizen's node in the trade network.
+    Income, tax, UBI, disaster and education phases are whole-array
+    operations. Trading keeps the sequential random-order semantics of
+    ``PersonAgent.step`` unless the synchronous trade schedule is selected,
+    in which case it is a single scatter-add. The reporter columns match
+    ``BasicEconomyModel``, and so does the phase pipeline, with the
+    vectorized implementations.
+    """
+
+    phases = ECONOMY_PHASES
+    phase_kind = "vectorized"
+    wealth_index_type = WealthIndex
+
+    def __init__(self, params: EconomyParams | None = None) -> None:
+        self.economy_params = params or EconomyParams()
+        super().__init__(params=self.economy_params)  # type: ignore[arg-type]
+
+        self.tax_revenue = 0.0
+        self.ubi_amount = 0.0
+        self.total_income = 0.0
+        self.mean_wealth = 0.0
+        self.disaster_occurred = False
+        self.disaster_damage = 0.0
+        self.education_investment = 0.0
+        self.mean_productivity = 0.0
+
+        self.wealth, self.productivity = draw_initial_population(
+            self.economy_params, self.rngs.stream("population")
+        )
+        self.network: CSRGraph | None = self.economy_params.trade.network.build(
+            self.population, self.rngs.stream("network")
+        )
+        self.happiness = np.full(self.population, 0.5, dtype=float)
+
+        self.setup_datacollector(
+            fused_reporters=[
+                FusedReporter(
+                    population_reporter_names(self.economy_params),
+                    self._population_summary,
+                ),
+            ],
+            model_reporters={
+                "Tax Revenue": lambda m: m.tax_revenue,
+                "UBI Amount": lambda m: m.ubi_amount,
+                "Total Income": lambda m: m.total_income,
+                "Disaster Damage": lambda m: m.disaster_damage,
+            },
+            agent_reporters={
+                "Wealth": lambda m: m.wealth,
+                "Happiness": lambda m: m.happiness,
+            },
+        )
+        self.compile_phases()
+
+    @property
+    def population(self) -> int:
+        """Number of citizens in the model."""
+        return len(self.wealth)
+
+    def compile_phases(self) -> None:
+        """Compile the tax schedule and the phase pipeline from the current params."""
+        self.tax_schedule = TaxSchedule.from_params(self.economy_params.tax)
+        super().compile_phases()
+
+    def step(self) -> None:
+        """Execute one step of the model."""
+        self.pipeline.run()
+        self.mean_productivity = float(np.mean(self.productivity))
+
+        super().step()
+
+    def _trade(self) -> None:
+        """Let every citizen, in random order, give one unit to a random other."""
+        self.mean_wealth = float(np.mean(self.wealth))
+        n = self.population
+        if n < 2:
+            return
+
+        order = self.rngs.stream("trade").permutation(n)
+        partners = self._draw_partners()
+        wealth = self.wealth.tolist()
+        turn_wealth = np.empty(n, dtype=float)
+
+        for i, j in zip(order.tolist(), partners[order].tolist()):
+            w = wealth[i]
+            if w > 0:
+                transfer = min(1.0, w)
+                wealth[i] = w - transfer
+                wealth[j] += transfer
+            turn_wealth[i] = wealth[i]
+
+        self.wealth[:] = wealth
+        # Happiness is evaluated at each citizen's own turn, as in PersonAgent,
+        # which skips it for people without a partner.
+        happiness = compute_happiness(turn_wealth, self.mean_wealth)
+        traded = partners != np.arange(n)
+        self.happiness[traded] = happiness[traded]
+
+    def _trade_synchronously(self) -> None:
+        """Apply every citizen's trade at once from the start-of-step state."""
+        self.mean_wealth = float(np.mean(self.wealth))
+        n = self.population
+        if n < 2:
+            return
+
+        self.wealth = exchange_synchronously(self.wealth, self._draw_partners())
+        self.happiness = compute_happiness(self.wealth, self.mean_wealth)
+
+    def _draw_partners(self) -> np.ndarray:
+        """Draw a partner per citizen; without a network partner, oneself."""
+        if self.network is None:
+            return draw_partners(self.rngs.stream("trade"), self.population)
+        return draw_network_partners(
+            self.network, self.rngs.stream("trade"), np.arange(self.population)
+        )
+
+    def _collect_taxes(self) -> None:
+        """Collect taxes from all citizens based on progressive brackets."""
+        tax = self.tax_schedule.compute(self.wealth)
+        self.wealth -= tax
+        self.tax_revenue = float(tax.sum())
+
+    def _distribute_ubi(self) -> None:
+        """Distribute collected taxes equally as UBI."""
+        if self.population == 0:
+            self.ubi_amount = 0.0
+            return
+
+        self.ubi_amount = self.tax_revenue / self.population
+        self.wealth += self.ubi_amount
+
+    def _distribute_income(self) -> None:
+        """Distribute labor income based on productivity."""
+        income = self.economy_params.income.base_income * self.productivity
+        self.wealth += income
+        self.total_income = float(income.sum())
+
+    def _check_disaster(self) -> None:
+        """Check for and apply natural disaster damage."""
+        disaster_params = self.economy_params.disaster
+        if self.rngs.stream("disaster").random() < disaster_params.probability:
+            self.disaster_occurred = True
+            self.disaster_damage = self.apply_wealth_shock(disaster_params.damage_rate)
+        else:
+            self.disaster_occurred = False
+            self.disaster_damage = 0.0
+
+    def _process_education(self) -> None:
+        """Process education investment for all citizens."""
+        education_params = self.economy_params.education
+        investment = invest_in_education(
+            self.wealth,
+            self.productivity,
+            education_params.investment_rate,
+            education_params.max_productivity,
+        )
+        self.education_investment = float(investment.sum())
+
+    def agent_arrays(self, attributes: Sequence[str]) -> dict[str, np.ndarray]:
+        """Return the per-citizen arrays by name, without copying."""
+        return {name: getattr(self, name) for name in attributes}
+
+    def get_wealth(self) -> np.ndarray:
+        """Return the wealth of every citizen as an array."""
+        return self.wealth
+
+    def get_happiness(self) -> np.ndarray:
+        """Return the happiness of every citizen as an array."""
+        return self.happiness
+
+    def get_productivity(self) -> np.ndarray:
+        """Return the productivity of every citizen as an array."""
+        return self.productivity
+
+    def scale_productivity(self, factor: float) -> None:
+        """Multiply every citizen's productivity by a factor."""
+        self.productivity *= factor
+
+    def apply_wealth_shock(self, damage_rate: float) -> float:
+        """Destroy a share of every citizen's wealth and return the total loss."""
+        damage = self.wealth * damage_rate
+        self.wealth -= damage
+        self.invalidate_wealth_index()
+        return float(damage.sum())
+
+    def add_citizens(
+        self,
+        wealth: Sequence[float] | np.ndarray,
+        productivity: Sequence[float] | np.ndarray,
+    ) -> None:
+        """Append new citizens with the given initial wealth and productivity."""
+        self.wealth = np.concatenate([self.wealth, np.asarray(wealth, dtype=float)])
+        self.productivity = np.concatenate(
+            [self.productivity, np.asarray(productivity, dtype=float)]
+        )
+        self.happiness = np.concatenate([self.happiness, np.full(len(wealth), 0.5)])
+        self.invalidate_wealth_index()
+
+    @staticmethod
+    def _population_summary(model: ArrayEconomyModel) -> dict[str, float]:
+        """Compute the population reporters from the citizen arrays."""
+        return summarize_population(
+            model.wealth,
+            mean_happiness=float(np.mean(model.happiness)) if model.population else 0.0,
+            mean_productivity=float(np.mean(model.productivity)) if model.population else 0.0,
+            inequality=model.economy_params.inequality_reporters,
+        )
+
+    @staticmethod
+    def _compute_gini(model: ArrayEconomyModel) -> float:
+        """Compute Gini coefficient for wealth distribution."""
+        return compute_gini(model.wealth)
+
+
+def invest_in_education(
+    wealth: np.ndarray,
+    productivity: np.ndarray,
+    rate: float,
+    max_productivity: float,
+) -> np.ndarray:
+    """Apply one round of education investment in place; return each citizen's spend."""
+    if rate <= 0:
+        return np.zeros(len(wealth))
+
+    investing = wealth > 0
+    investment = np.where(investing, wealth * rate, 0.0)
+    wealth -= investment
+
+    # Diminishing returns: productivity gain decreases as approaching max
+    room_for_growth = np.maximum(0.0, max_productivity - productivity)
+    growth_factor = room_for_growth / max_productivity
+    productivity_gain = 0.1 * growth_factor * (investment / 10.0)
+    improved = np.minimum(max_productivity, productivity + productivity_gain)
+    np.copyto(productivity, improved, where=investing)
+    return investment
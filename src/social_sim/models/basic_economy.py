@@ -2,11 +2,56 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from typing import Literal
+
 import numpy as np
+from mesa import Agent
 from pydantic import BaseModel as PydanticModel, Field
 
 from social_sim.agents.person import PersonAgent
+from social_sim.analysis.inequality import (
+    INEQUALITY_REPORTERS,
+    WealthDistribution,
+    WealthIndex,
+)
 from social_sim.core.model import BaseModel
+from social_sim.core.pipeline import Phase, PhaseRegistry
+from social_sim.core.reporters import FusedReporter
+from social_sim.models.distributions import Distribution
+from social_sim.models.network import CSRGraph, NetworkParams
+from social_sim.models.tax import TaxMode, TaxSchedule
+from social_sim.models.trade import (
+    draw_network_partners,
+    draw_partners,
+    exchange_synchronously,
+)
+
+
+Backend = Literal["agent", "array", "parallel"]
+
+POPULATION_REPORTERS = (
+    "Total Wealth",
+    "Mean Wealth",
+    "Gini",
+    "Mean Happiness",
+    "Mean Productivity",
+)
+
+
+class TradeParams(PydanticModel):
+    """Parameters for the random-exchange phase.
+
+    ``sequential`` lets agents trade one after another in random order, each
+    seeing the transfers made before it. ``synchronous`` has every agent pick
+    a partner from the start-of-step state and applies all transfers at once
+    (see ``social_sim.models.trade.exchange_synchronously``). ``network``
+    restricts partners to neighbours in a generated social network; citizens
+    added after the model is built have no ties and do not trade.
+    """
+
+    schedule: Literal["sequential", "synchronous"] = "sequential"
+    network: NetworkParams = Field(default_factory=NetworkParams)
 
 
 class TaxBracket(PydanticModel):
@@ -17,9 +62,14 @@ class TaxBracket(PydanticModel):
 
 
 class TaxParams(PydanticModel):
-    """Parameters for taxation system."""
+    """Parameters for taxation system.
+
+    ``mode`` is ``flat`` to tax all wealth at the rate of the highest bracket
+    reached, or ``marginal`` to tax each bracket's slice at its own rate.
+    """
 
     enabled: bool = False
+    mode: TaxMode = "flat"
     brackets: list[TaxBracket] = Field(default_factory=lambda: [
         TaxBracket(threshold=0, rate=0.0),
         TaxBracket(threshold=10, rate=0.1),
@@ -53,19 +103,95 @@ class EducationParams(PydanticModel):
 
 
 class EconomyParams(PydanticModel):
-    """Parameters for the basic economy model."""
+    """Parameters for the basic economy model.
+
+    Initial wealth is ``initial_wealth`` for everyone unless
+    ``wealth_distribution`` is set; initial productivity is uniform on
+    ``[0.5, 1.5)`` unless ``productivity_distribution`` is set.
+    ``workers`` is the number of processes used by the ``parallel``
+    backend. For large populations use the ``array`` backend, which keeps
+    about 24 bytes per citizen against several hundred per agent object.
+    """
 
     num_agents: int = 100
     initial_wealth: float = 10.0
+    wealth_distribution: Distribution | None = None
+    productivity_distribution: Distribution | None = None
     seed: int | None = None
+    backend: Backend = "agent"
+    workers: int = Field(default=2, ge=1)
+    inequality_reporters: bool = False
+    trade: TradeParams = Field(default_factory=TradeParams)
     tax: TaxParams = Field(default_factory=TaxParams)
     income: IncomeParams = Field(default_factory=IncomeParams)
     disaster: DisasterParams = Field(default_factory=DisasterParams)
     education: EducationParams = Field(default_factory=EducationParams)
 
 
+ECONOMY_PHASES = PhaseRegistry(
+    [
+        Phase(
+            "income",
+            method="_distribute_income",
+            enabled=lambda p: p.income.enabled,
+            resets={"total_income": 0.0},
+        ),
+        Phase(
+            "trade",
+            method="_trade",
+            enabled=lambda p: p.trade.schedule == "sequential",
+        ),
+        Phase(
+            "synchronous_trade",
+            method="_trade_synchronously",
+            enabled=lambda p: p.trade.schedule == "synchronous",
+        ),
+        Phase(
+            "tax",
+            method="_collect_taxes",
+            enabled=lambda p: p.tax.enabled,
+            resets={"tax_revenue": 0.0},
+        ),
+        Phase(
+            "ubi",
+            method="_distribute_ubi",
+            enabled=lambda p: p.tax.enabled and p.tax.ubi_enabled,
+            resets={"ubi_amount": 0.0},
+        ),
+        Phase(
+            "disaster",
+            method="_check_disaster",
+            enabled=lambda p: p.disaster.enabled,
+            resets={"disaster_occurred": False, "disaster_damage": 0.0},
+        ),
+        Phase(
+            "education",
+            method="_process_education",
+            enabled=lambda p: p.education.enabled,
+            resets={"education_investment": 0.0},
+        ),
+    ]
+)
+"""The step phases of the economy models, in order.
+
+Each phase names a method that the agent and array backends implement over
+agents and over arrays; the parallel backend's workers run the same phases
+by name. Register further policy phases here to add them to the agent and
+array backends.
+"""
+
+
 class BasicEconomyModel(BaseModel):
-    """A simple economy model with random wealth transfer."""
+    """A simple economy model with random wealth transfer.
+
+    Each step runs the enabled phases of ``ECONOMY_PHASES``. The pipeline is
+    compiled from ``economy_params`` on construction; call
+    ``compile_phases`` after switching a policy on or off or changing the
+    tax brackets.
+    """
+
+    phases = ECONOMY_PHASES
+    wealth_index_type = WealthIndex
 
     def __init__(self, params: EconomyParams | None = None) -> None:
         self.economy_params = params or EconomyParams()
@@ -80,129 +206,150 @@ class BasicEconomyModel(BaseModel):
         self.education_investment = 0.0
         self.mean_productivity = 0.0
 
-        for _ in range(self.economy_params.num_agents):
-            productivity = self.random.uniform(0.5, 1.5)
-            PersonAgent(
-                self,
-                wealth=self.economy_params.initial_wealth,
-                productivity=productivity,
-            )
+        wealth, productivity = draw_initial_population(
+            self.economy_params, self.rngs.stream("population")
+        )
+        # Node i of the network is the person with unique_id i + 1.
+        self.network: CSRGraph | None = self.economy_params.trade.network.build(
+            len(wealth), self.rngs.stream("network")
+        )
+        self._people_by_node: list[PersonAgent | None] = []
+        self.add_citizens(wealth, productivity)
 
         self.setup_datacollector(
-            model_reporters={
-                "Total Wealth": lambda m: sum(a.wealth for a in m.agents),
-                "Mean Wealth": lambda m: np.mean([a.wealth for a in m.agents]),
-                "Gini": self._compute_gini,
-                "Mean Happiness": lambda m: np.mean(
-                    [a.happiness for a in m.agents if isinstance(a, PersonAgent)]
+            fused_reporters=[
+                FusedReporter(
+                    population_reporter_names(self.economy_params),
+                    self._population_summary,
                 ),
+            ],
+            model_reporters={
                 "Tax Revenue": lambda m: m.tax_revenue,
                 "UBI Amount": lambda m: m.ubi_amount,
                 "Total Income": lambda m: m.total_income,
                 "Disaster Damage": lambda m: m.disaster_damage,
-                "Mean Productivity": lambda m: np.mean(
-                    [a.productivity for a in m.agents if isinstance(a, PersonAgent)]
-                ),
             },
             agent_reporters={
                 "Wealth": "wealth",
                 "Happiness": "happiness",
             },
         )
+        self.compile_phases()
+
+    def compile_phases(self) -> None:
+        """Compile the tax schedule and the phase pipeline from the current params."""
+        self.tax_schedule = TaxSchedule.from_params(self.economy_params.tax)
+        super().compile_phases()
 
     def step(self) -> None:
         """Execute one step of the model."""
-        income_params = self.economy_params.income
-        if income_params.enabled:
-            self._distribute_income()
-        else:
-            self.total_income = 0.0
-
-        self.mean_wealth = float(np.mean([a.wealth for a in self.agents]))
-        self.agents.shuffle_do("step")
-
-        tax_params = self.economy_params.tax
-        if tax_params.enabled:
-            self._collect_taxes()
-            if tax_params.ubi_enabled:
-                self._distribute_ubi()
-            else:
-                self.ubi_amount = 0.0
-        else:
-            self.tax_revenue = 0.0
-            self.ubi_amount = 0.0
+        self.pipeline.run()
+        self.mean_productivity = self.aggregates.mean("productivity")
 
-        disaster_params = self.economy_params.disaster
-        if disaster_params.enabled:
-            self._check_disaster()
-        else:
-            self.disaster_occurred = False
-            self.disaster_damage = 0.0
+        super().step()
 
-        education_params = self.economy_params.education
-        if education_params.enabled:
-            self._process_education()
-        else:
-            self.education_investment = 0.0
+    def resync_aggregates(self) -> None:
+        """Recompute the person aggregates exactly to discard rounding drift."""
+        self.aggregates.resync(
+            self.agents_of_type(PersonAgent),
+            ("wealth", "happiness", "productivity"),
+        )
 
-        self.mean_productivity = float(np.mean(
-            [a.productivity for a in self.agents if isinstance(a, PersonAgent)]
-        ))
+    def deregister_agent(self, agent: Agent) -> None:
+        """Deregister an agent and drop it from the network lookup."""
+        super().deregister_agent(agent)
+        node = agent.unique_id - 1
+        if node < len(self._people_by_node):
+            self._people_by_node[node] = None
+
+    def sample_partner(self, agent: Agent, agent_type: type[Agent] = Agent) -> Agent | None:
+        """Draw a trading partner, restricted to network neighbours if a network is set."""
+        network = self.network
+        if network is None:
+            return super().sample_partner(agent, agent_type)
+        node = agent.unique_id - 1
+        if node >= network.num_nodes:
+            return None
+        neighbor = network.sample_neighbor(self._partner_random, node)
+        return self._people_by_node[neighbor] if neighbor >= 0 else None
+
+    def _trade(self) -> None:
+        """Let every agent, in an order drawn from the trade stream, take its turn."""
+        self.mean_wealth = self.aggregates.mean("wealth")
+        # AgentSet.shuffle_do, with the shuffle drawn from rngs instead of Mesa.
+        refs = list(self.agents._agents.keyrefs())
+        self.rngs.scalar_stream("trade").shuffle(refs)
+        for ref in refs:
+            if (agent := ref()) is not None:
+                agent.step()
+
+    def _trade_synchronously(self) -> None:
+        """Apply every person's trade at once from the start-of-step state."""
+        self.mean_wealth = self.aggregates.mean("wealth")
+        people = self.agents_of_type(PersonAgent)
+        n = len(people)
+        if n < 2:
+            return
 
-        super().step()
+        wealth = np.fromiter((a.wealth for a in people), dtype=float, count=n)
+        wealth = exchange_synchronously(wealth, self._draw_partner_positions(people))
+        happiness = compute_happiness(wealth, self.mean_wealth)
+        for agent, w, h in zip(people, wealth.tolist(), happiness.tolist()):
+            agent.wealth = w
+            agent.happiness = h
+
+    def _draw_partner_positions(self, people: list[PersonAgent]) -> np.ndarray:
+        """Draw a partner for every person, as positions in ``people``."""
+        n = len(people)
+        if self.network is None:
+            return draw_partners(self.rngs.stream("trade"), n)
+
+        nodes = np.fromiter((a.unique_id - 1 for a in people), dtype=np.int64, count=n)
+        positions = np.full(int(nodes.max()) + 1, -1, dtype=np.int64)
+        positions[nodes] = np.arange(n)
+        drawn = draw_network_partners(self.network, self.rngs.stream("trade"), nodes)
+        partners = positions[drawn]
+        # Removed neighbours have no position; those people keep to themselves.
+        return np.where(partners >= 0, partners, np.arange(n))
 
     def _collect_taxes(self) -> None:
         """Collect taxes from all agents based on progressive brackets."""
-        self.tax_revenue = 0.0
-        brackets = self.economy_params.tax.brackets
-
-        for agent in self.agents:
-            if not isinstance(agent, PersonAgent):
-                continue
+        people = self.agents_of_type(PersonAgent)
+        wealth = np.fromiter((a.wealth for a in people), dtype=float, count=len(people))
+        taxes = self.tax_schedule.compute(wealth)
 
-            tax_rate = 0.0
-            for bracket in reversed(brackets):
-                if agent.wealth >= bracket.threshold:
-                    tax_rate = bracket.rate
-                    break
-
-            tax_amount = agent.pay_tax(tax_rate)
-            self.tax_revenue += tax_amount
+        for agent, tax_amount in zip(people, taxes.tolist()):
+            if tax_amount:
+                agent.wealth -= tax_amount
+        self.tax_revenue = float(taxes.sum())
 
     def _distribute_ubi(self) -> None:
         """Distribute collected taxes equally as UBI."""
-        agent_count = len([a for a in self.agents if isinstance(a, PersonAgent)])
+        agent_count = self.count_agents(PersonAgent)
         if agent_count == 0:
             self.ubi_amount = 0.0
             return
 
         self.ubi_amount = self.tax_revenue / agent_count
 
-        for agent in self.agents:
-            if isinstance(agent, PersonAgent):
-                agent.receive_ubi(self.ubi_amount)
+        for agent in self.agents_of_type(PersonAgent):
+            agent.receive_ubi(self.ubi_amount)
 
     def _distribute_income(self) -> None:
         """Distribute labor income based on productivity."""
         self.total_income = 0.0
         base_income = self.economy_params.income.base_income
 
-        for agent in self.agents:
-            if isinstance(agent, PersonAgent):
-                income = agent.earn_income(base_income)
-                self.total_income += income
+        for agent in self.agents_of_type(PersonAgent):
+            income = agent.earn_income(base_income)
+            self.total_income += income
 
     def _check_disaster(self) -> None:
         """Check for and apply natural disaster damage."""
         disaster_params = self.economy_params.disaster
-        if self.random.random() < disaster_params.probability:
+        if self.rngs.stream("disaster").random() < disaster_params.probability:
             self.disaster_occurred = True
-            self.disaster_damage = 0.0
-            for agent in self.agents:
-                if isinstance(agent, PersonAgent):
-                    damage = agent.wealth * disaster_params.damage_rate
-                    agent.wealth -= damage
-                    self.disaster_damage += damage
+            self.disaster_damage = self.apply_wealth_shock(disaster_params.damage_rate)
         else:
             self.disaster_occurred = False
             self.disaster_damage = 0.0
@@ -212,29 +359,133 @@ class BasicEconomyModel(BaseModel):
         self.education_investment = 0.0
         education_params = self.economy_params.education
 
-        for agent in self.agents:
-            if isinstance(agent, PersonAgent):
-                investment = agent.invest_in_education(
-                    education_params.investment_rate,
-                    education_params.max_productivity,
-                )
-                self.education_investment += investment
+        for agent in self.agents_of_type(PersonAgent):
+            investment = agent.invest_in_education(
+                education_params.investment_rate,
+                education_params.max_productivity,
+            )
+            self.education_investment += investment
+
+    def get_wealth(self) -> np.ndarray:
+        """Return the wealth of every person as an array."""
+        people = self.agents_of_type(PersonAgent)
+        return np.fromiter((a.wealth for a in people), dtype=float, count=len(people))
+
+    def get_happiness(self) -> np.ndarray:
+        """Return the happiness of every person as an array."""
+        people = self.agents_of_type(PersonAgent)
+        return np.fromiter((a.happiness for a in people), dtype=float, count=len(people))
+
+    def get_productivity(self) -> np.ndarray:
+        """Return the productivity of every person as an array."""
+        people = self.agents_of_type(PersonAgent)
+        return np.fromiter((a.productivity for a in people), dtype=float, count=len(people))
+
+    def scale_productivity(self, factor: float) -> None:
+        """Multiply every person's productivity by a factor."""
+        for agent in self.agents_of_type(PersonAgent):
+            agent.productivity *= factor
+
+    def apply_wealth_shock(self, damage_rate: float) -> float:
+        """Destroy a share of every person's wealth and return the total loss."""
+        total_damage = 0.0
+        for agent in self.agents_of_type(PersonAgent):
+            damage = agent.wealth * damage_rate
+            agent.wealth -= damage
+            total_damage += damage
+        self.invalidate_wealth_index()
+        return total_damage
+
+    def add_citizens(
+        self,
+        wealth: Sequence[float] | np.ndarray,
+        productivity: Sequence[float] | np.ndarray,
+    ) -> None:
+        """Add new persons with the given initial wealth and productivity in bulk."""
+        people = self.spawn_agents(
+            PersonAgent, len(wealth), wealth=wealth, productivity=productivity
+        )
+        if self.network is not None and people:
+            by_node = self._people_by_node
+            by_node.extend([None] * (people[-1].unique_id - len(by_node)))
+            for person in people:
+                by_node[person.unique_id - 1] = person
+
+    @staticmethod
+    def _population_summary(model: BasicEconomyModel) -> dict[str, float]:
+        """Compute the population reporters from one pass over the persons."""
+        return summarize_population(
+            model.get_wealth(),
+            mean_happiness=model.aggregates.mean("happiness"),
+            mean_productivity=model.aggregates.mean("productivity"),
+            inequality=model.economy_params.inequality_reporters,
+        )
 
     @staticmethod
     def _compute_gini(model: BasicEconomyModel) -> float:
         """Compute Gini coefficient for wealth distribution."""
-        wealth_values = sorted(a.wealth for a in model.agents)
-        n = len(wealth_values)
-        if n == 0:
-            return 0.0
-
-        total = sum(wealth_values)
-        if total == 0:
-            return 0.0
-
-        cumulative = np.cumsum(wealth_values)
-        gini = (n + 1 - 2 * np.sum(cumulative) / total) / n
-        return float(max(0.0, gini))
+        return compute_gini(model.get_wealth())
+
+
+def draw_initial_population(
+    params: EconomyParams,
+    rng: np.random.Generator,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Draw the initial wealth and productivity of every citizen."""
+    n = params.num_agents
+    wealth_distribution = params.wealth_distribution or Distribution(
+        kind="constant", value=params.initial_wealth
+    )
+    productivity_distribution = params.productivity_distribution or Distribution(
+        kind="uniform", low=0.5, high=1.5
+    )
+    return wealth_distribution.sample(rng, n), productivity_distribution.sample(rng, n)
+
+
+def population_reporter_names(params: EconomyParams) -> tuple[str, ...]:
+    """Return the fused population reporter names enabled by ``params``."""
+    if params.inequality_reporters:
+        return POPULATION_REPORTERS + INEQUALITY_REPORTERS
+    return POPULATION_REPORTERS
+
+
+def summarize_population(
+    wealth: np.ndarray,
+    mean_happiness: float,
+    mean_productivity: float,
+    inequality: bool = False,
+) -> dict[str, float]:
+    """Build the population reporter values from a wealth vector.
+
+    The wealth vector is sorted once; the Gini and, when ``inequality`` is
+    set, the ``INEQUALITY_REPORTERS`` all read from that sorted buffer.
+    """
+    distribution = WealthDistribution(wealth)
+    values = {
+        "Total Wealth": distribution.total,
+        "Mean Wealth": distribution.mean,
+        "Gini": distribution.gini(),
+        "Mean Happiness": mean_happiness,
+        "Mean Productivity": mean_productivity,
+    }
+    if inequality:
+        values.update(distribution.summary())
+    return values
+
+
+def compute_gini(wealth: np.ndarray) -> float:
+    """Compute the Gini coefficient of a wealth vector."""
+    return WealthDistribution(wealth).gini()
+
+
+def compute_happiness(wealth: np.ndarray, mean_wealth: float | None = None) -> np.ndarray:
+    """Vectorized counterpart of ``PersonAgent._update_happiness``."""
+    absolute_happiness = np.minimum(1.0, 0.3 + wealth / 50.0)
+
+    if mean_wealth is not None and mean_wealth > 0:
+        relative_happiness = np.minimum(1.0, wealth / mean_wealth)
+        return 0.5 * absolute_happiness + 0.5 * relative_happiness
+    return absolute_happiness
 
 
 if __name__ == "__main__":
@@ -0,0 +1,340 @@
+"""A persistent SQLite catalog of finished runs, for reuse and querying."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import re
+import sqlite3
+import time
+from collections.abc import Iterator, Sequence
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel as PydanticModel
+
+import social_sim
+from social_sim.core.stopping import RunSummary, StoppingCriteria
+from social_sim.models.basic_economy import EconomyParams
+from social_sim.models.scenario import ScenarioResult, run_scenario
+
+# Fields that do not change a run's outcome: the seed is a column of its own
+# and the parallel backend gives identical results for any worker count.
+NON_OUTCOME_FIELDS = {"seed", "workers"}
+
+Condition = str | tuple[str, str, Any]
+
+_OPERATORS = ("<=", ">=", "!=", "=", "<", ">")
+_CONDITION = re.compile(r"^\s*(.+?)\s*(<=|>=|!=|=|<|>)\s*(.+?)\s*$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    run_key TEXT NOT NULL UNIQUE,
+    params_hash TEXT NOT NULL,
+    params TEXT NOT NULL,
+    seed TEXT,
+    steps INTEGER NOT NULL,
+    stopping TEXT,
+    code_version TEXT NOT NULL,
+    stop_reason TEXT NOT NULL,
+    stop_step INTEGER NOT NULL,
+    steps_run INTEGER NOT NULL,
+    seconds REAL NOT NULL,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_params ON runs (params_hash, seed);
+CREATE TABLE IF NOT EXISTS run_params (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value,
+    PRIMARY KEY (run_id, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS run_params_by_value ON run_params (name, value, run_id);
+CREATE TABLE IF NOT EXISTS run_metrics (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (run_id, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS run_metrics_by_value ON run_metrics (name, value, run_id);
+"""
+
+
+@lru_cache(maxsize=None)
+def source_digest(root: Path = Path(social_sim.__file__).parent) -> str:
+    """Digest of every ``.py`` file under ``root``, the ``social_sim`` package by default.
+
+    Any edit to the model code changes it, so runs cached under an older
+    digest are not reused.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(root.rglob("*.py")):
+        digest.update(path.relative_to(root).as_posix().encode() + b"\0")
+        digest.update(path.read_bytes() + b"\0")
+    return f"{social_sim.__version__}+{digest.hexdigest()[:16]}"
+
+
+def canonical_params(params: EconomyParams) -> str:
+    """Return the outcome-relevant params as compact JSON with sorted keys."""
+    data = params.model_dump(mode="json", exclude=NON_OUTCOME_FIELDS)
+    return json.dumps(data, sort_keys=True, separators=(",", ":"))
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _flatten(value: Any, prefix: str = "") -> Iterator[tuple[str, Any]]:
+    """Yield ``(dotted path, scalar)`` for every leaf; list items are numbered."""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from _flatten(item, f"{prefix}{key}.")
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            yield from _flatten(item, f"{prefix}{index}.")
+    else:
+        yield prefix[:-1], value
+
+
+def _parse_condition(condition: Condition) -> tuple[str, str, Any]:
+    if not isinstance(condition, str):
+        name, op, value = condition
+    else:
+        match = _CONDITION.match(condition)
+        if match is None:
+            raise ValueError(f"cannot parse condition {condition!r}")
+        name, op, text = match.groups()
+        try:
+            value = json.loads(text)
+        except json.JSONDecodeError:
+            value = text
+    if op not in _OPERATORS:
+        raise ValueError(f"unknown operator {op!r}")
+    return name, op, value
+
+
+class CatalogRun(PydanticModel):
+    """One catalogued run."""
+
+    id: int
+    params: EconomyParams
+    steps: int
+    stopping: StoppingCriteria | None
+    code_version: str
+    created: float
+    summary: RunSummary
+    metrics: dict[str, float]
+
+    def result(self) -> ScenarioResult:
+        return ScenarioResult(summary=self.summary, metrics=self.metrics)
+
+
+class ExperimentCatalog:
+    """Finished runs in a SQLite file, keyed by everything that fixes the outcome.
+
+    A run is identified by its canonical params (``canonical_params``), seed,
+    step count, stopping criteria and ``code_version`` (by default
+    ``source_digest()``, which changes with any edit to the package);
+    ``lookup`` finds an identical earlier run and ``run`` reuses it instead
+    of computing. Unseeded runs are stored but never reused. Every param
+    leaf (``"tax.ubi_enabled"``, ``"tax.brackets.1.rate"``) and every final
+    reporter value is also stored as an indexed row, so
+    ``query("tax.ubi_enabled = true", "Gini < 0.3")`` filters runs without
+    rerunning anything. Several processes may share one file.
+    """
+
+    def __init__(self, path: str | Path = ":memory:", code_version: str | None = None) -> None:
+        self.path = str(path)
+        self.code_version = code_version or source_digest()
+        self.connection = sqlite3.connect(self.path, timeout=30.0)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        if self.path != ":memory:":
+            self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> ExperimentCatalog:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _run_key(
+        self,
+        params: EconomyParams,
+        steps: int,
+        stopping: StoppingCriteria | None,
+    ) -> str:
+        key = {
+            "params": json.loads(canonical_params(params)),
+            "seed": params.seed,
+            "steps": steps,
+            "stopping": stopping.model_dump(mode="json") if stopping else None,
+            "code_version": self.code_version,
+        }
+        return _digest(json.dumps(key, sort_keys=True, separators=(",", ":")))
+
+    def lookup(
+        self,
+        params: EconomyParams,
+        steps: int,
+        stopping: StoppingCriteria | None = None,
+    ) -> CatalogRun | None:
+        """Return the stored run identical to this one, if any (never for unseeded runs)."""
+        if params.seed is None:
+            return None
+        row = self.connection.execute(
+            "SELECT id FROM runs WHERE run_key = ?", (self._run_key(params, steps, stopping),)
+        ).fetchone()
+        return self.get(row[0]) if row else None
+
+    def record(
+        self,
+        params: EconomyParams,
+        steps: int,
+        result: ScenarioResult,
+        stopping: StoppingCriteria | None = None,
+    ) -> int:
+        """Store a finished run and return its id (the existing id for a duplicate)."""
+        canonical = canonical_params(params)
+        run_key = self._run_key(params, steps, stopping)
+        if params.seed is None:
+            run_key = f"{run_key}:{time.time_ns()}"
+        summary = result.summary
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT OR IGNORE INTO runs (run_key, params_hash, params, seed, steps, stopping,"
+                " code_version, stop_reason, stop_step, steps_run, seconds, created)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    run_key,
+                    _digest(canonical),
+                    canonical,
+                    None if params.seed is None else str(params.seed),
+                    steps,
+                    stopping.model_dump_json() if stopping else None,
+                    self.code_version,
+                    summary.reason,
+                    summary.step,
+                    summary.steps_run,
+                    summary.seconds,
+                    time.time(),
+                ),
+            )
+            if not cursor.rowcount:
+                row = self.connection.execute(
+                    "SELECT id FROM runs WHERE run_key = ?", (run_key,)
+                ).fetchone()
+                return row[0]
+            run_id = cursor.lastrowid
+            self.connection.executemany(
+                "INSERT INTO run_params (run_id, name, value) VALUES (?, ?, ?)",
+                [(run_id, name, value) for name, value in _flatten(json.loads(canonical))],
+            )
+            self.connection.executemany(
+                "INSERT INTO run_metrics (run_id, name, value) VALUES (?, ?, ?)",
+                [
+                    (run_id, name, value if math.isfinite(value) else None)
+                    for name, value in result.metrics.items()
+                ],
+            )
+        return run_id
+
+    def run(
+        self,
+        params: EconomyParams,
+        steps: int,
+        stopping: StoppingCriteria | None = None,
+    ) -> tuple[ScenarioResult, bool]:
+        """Return the result of this run and whether it came from the catalog.
+
+        Computes and records the run only when no identical run is stored.
+        """
+        stored = self.lookup(params, steps, stopping)
+        if stored is not None:
+            return stored.result(), True
+        result = run_scenario(params, steps, stopping)
+        self.record(params, steps, result, stopping)
+        return result, False
+
+    def get(self, run_id: int) -> CatalogRun | None:
+        row = self.connection.execute(
+            "SELECT id, params, seed, steps, stopping, code_version, created,"
+            " stop_reason, stop_step, steps_run, seconds FROM runs WHERE id = ?",
+            (run_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        run_id, params, seed, steps, stopping, code_version, created, *summary = row
+        metrics = self.connection.execute(
+            "SELECT name, value FROM run_metrics WHERE run_id = ?", (run_id,)
+        ).fetchall()
+        reason, step, steps_run, seconds = summary
+        return CatalogRun(
+            id=run_id,
+            params=EconomyParams.model_validate(
+                {**json.loads(params), "seed": None if seed is None else int(seed)}
+            ),
+            steps=steps,
+            stopping=StoppingCriteria.model_validate_json(stopping) if stopping else None,
+            code_version=code_version,
+            created=created,
+            summary=RunSummary(reason=reason, step=step, steps_run=steps_run, seconds=seconds),
+            metrics={name: math.nan if value is None else value for name, value in metrics},
+        )
+
+    def query(
+        self,
+        *conditions: Condition,
+        code_version: str | None = None,
+        limit: int | None = None,
+    ) -> list[CatalogRun]:
+        """Return the runs matching every condition, oldest first.
+
+        A condition is ``"name op value"`` or a ``(name, op, value)`` tuple,
+        with ``op`` one of ``< <= = != >= >``. Names of param leaves
+        (``"income.base_income"``) test the params, any other name a final
+        reporter value (``"Gini"``); values in strings are parsed as JSON
+        (``true``, ``0.3``, ``"flat"``) and fall back to plain text.
+        """
+        clauses = []
+        arguments: list[Any] = []
+        for condition in conditions:
+            name, op, value = _parse_condition(condition)
+            table = "run_params" if self._is_param(name) else "run_metrics"
+            clauses.append(
+                f"id IN (SELECT run_id FROM {table} WHERE name = ? AND value {op} ?)"
+            )
+            arguments += [name, value]
+        if code_version is not None:
+            clauses.append("code_version = ?")
+            arguments.append(code_version)
+        sql = "SELECT id FROM runs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            arguments.append(limit)
+        ids = [row[0] for row in self.connection.execute(sql, arguments)]
+        return [run for run in map(self.get, ids) if run is not None]
+
+    def _is_param(self, name: str) -> bool:
+        return (
+            self.connection.execute(
+                "SELECT 1 FROM run_params WHERE name = ? LIMIT 1", (name,)
+            ).fetchone()
+            is not None
+        )
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    def delete(self, run_ids: Sequence[int]) -> None:
+        with self.connection:
+            self.connection.executemany("DELETE FROM runs WHERE id = ?", [(i,) for i in run_ids])
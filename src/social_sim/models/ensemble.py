@@ -0,0 +1,133 @@
+"""Monte Carlo ensembles: one parameter set run under many seeds."""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import numpy as np
+from pydantic import BaseModel as PydanticModel
+
+from social_sim.analysis.bands import DEFAULT_QUANTILES, EnsembleBands
+from social_sim.core.model import CollectionPolicy
+from social_sim.core.rng import RNGService
+from social_sim.core.stopping import RunSummary, StoppingCriteria
+from social_sim.models.basic_economy import EconomyParams
+from social_sim.models.factory import create_economy_model
+
+
+class EnsembleMember(PydanticModel):
+    """How one member run ended and its final reporter values."""
+
+    member: int
+    seed: int
+    summary: RunSummary
+    final: dict[str, float]
+
+
+def _run_member(
+    params: dict[str, Any],
+    seed: int,
+    steps: int,
+    stopping: dict[str, Any] | None,
+    sample_every: int,
+) -> tuple[np.ndarray, list[str], np.ndarray, dict[str, Any]]:
+    """Run one member and return its collected steps, reporters and summary."""
+    model = create_economy_model(EconomyParams.model_validate({**params, "seed": seed}))
+    model.collection = CollectionPolicy(mode="every", interval=sample_every, agents=False)
+    criteria = StoppingCriteria.model_validate(stopping) if stopping is not None else None
+    try:
+        summary = model.run(steps, stopping=criteria)
+        data = model.get_model_data()
+        names = list(data)
+        values = np.column_stack([data[name] for name in names]) if names else np.empty((0, 0))
+        collected = np.array(model.get_collected_steps())
+    finally:
+        close = getattr(model, "close", None)
+        if close is not None:
+            close()
+    return collected, names, values, summary.model_dump()
+
+
+class EnsembleRunner:
+    """Run one ``EconomyParams`` under ``members`` seeds across a process pool.
+
+    Member seeds come from ``RNGService(params.seed).seeds(members,
+    "ensemble")`` unless ``seeds`` are given, so the same params always give
+    the same ensemble. Each member's history is folded into ``bands``
+    (an ``EnsembleBands``) as soon as it arrives and then dropped, and
+    members are folded in member order, so the bands do not depend on the
+    number of ``workers``. ``stopping`` applies to every member on its own;
+    members that stop early simply drop out of the later steps' counts.
+    With ``workers=1`` the members run in this process.
+    """
+
+    def __init__(
+        self,
+        params: EconomyParams,
+        members: int = 8,
+        steps: int = 100,
+        *,
+        seeds: Sequence[int] | None = None,
+        stopping: StoppingCriteria | None = None,
+        workers: int | None = None,
+        quantiles: Sequence[float] = DEFAULT_QUANTILES,
+        sample_every: int = 1,
+    ) -> None:
+        if seeds is None:
+            rngs = RNGService(params.seed)
+            self.entropy = rngs.entropy
+            seeds = rngs.seeds(members, "ensemble")
+        else:
+            self.entropy = None
+        self.params = params
+        self.seeds = [int(seed) for seed in seeds]
+        if not self.seeds:
+            raise ValueError("an ensemble needs at least one member")
+        self.steps = steps
+        self.stopping = stopping
+        self.workers = min(workers or os.cpu_count() or 1, len(self.seeds))
+        self.quantiles = tuple(quantiles)
+        self.sample_every = max(1, sample_every)
+        self.bands: EnsembleBands | None = None
+        self.members: list[EnsembleMember] = []
+
+    def iter_members(self) -> Iterator[EnsembleMember]:
+        """Run the ensemble, yielding each member once folded into ``bands``."""
+        self.bands = None
+        self.members = []
+        params = self.params.model_dump()
+        stopping = self.stopping.model_dump() if self.stopping is not None else None
+        args = [(params, seed, self.steps, stopping, self.sample_every) for seed in self.seeds]
+        if self.workers <= 1:
+            results: Iterator[Any] = (_run_member(*arg) for arg in args)
+            yield from self._fold(results)
+            return
+        with ProcessPoolExecutor(self.workers, mp_context=mp.get_context()) as pool:
+            yield from self._fold(pool.map(_run_member, *zip(*args)))
+
+    def _fold(self, results: Iterator[Any]) -> Iterator[EnsembleMember]:
+        for member, (steps, names, values, summary) in enumerate(results):
+            if self.bands is None:
+                self.bands = EnsembleBands(names, self.steps, self.quantiles)
+            self.bands.add(steps, values)
+            result = EnsembleMember(
+                member=member,
+                seed=self.seeds[member],
+                summary=RunSummary.model_validate(summary),
+                final={name: float(values[-1, j]) for j, name in enumerate(names)}
+                if len(values)
+                else {},
+            )
+            self.members.append(result)
+            yield result
+
+    def run(self) -> EnsembleBands:
+        """Run every member and return the bands."""
+        for _ in self.iter_members():
+            pass
+        assert self.bands is not None
+        return self.bands
@@ -0,0 +1,27 @@
+"""Backend selection for economy models."""
+
+from __future__ import annotations
+
+from typing import Union
+
+from social_sim.models.array_economy import ArrayEconomyModel
+from social_sim.models.basic_economy import BasicEconomyModel, EconomyParams
+from social_sim.models.parallel_economy import ParallelEconomyModel
+
+EconomyModel = Union[BasicEconomyModel, ArrayEconomyModel, ParallelEconomyModel]
+
+BACKENDS: dict[str, type[EconomyModel]] = {
+    "agent": BasicEconomyModel,
+    "array": ArrayEconomyModel,
+    "parallel": ParallelEconomyModel,
+}
+
+
+def create_economy_model(params: EconomyParams | None = None) -> EconomyModel:
+    """Build an economy model using the backend named in ``params.backend``."""
+    params = params or EconomyParams()
+    try:
+        model_cls = BACKENDS[params.backend]
+    except KeyError:
+        raise ValueError(f"Unknown economy backend: {params.backend}") from None
+    return model_cls(params)
@@ -0,0 +1,215 @@
+"""Sparse social networks that constrain who trades with whom."""
+
+from __future__ import annotations
+
+import random
+from typing import Literal
+
+import networkx as nx
+import numpy as np
+from pydantic import BaseModel as PydanticModel, Field
+
+NetworkKind = Literal["complete", "erdos_renyi", "small_world", "scale_free"]
+
+
+class CSRGraph:
+    """An undirected graph in compressed sparse row form.
+
+    The neighbours of node ``i`` are ``indices[indptr[i]:indptr[i + 1]]``.
+    Two int64 arrays hold the whole graph, about 16 bytes per edge, so a
+    million-node network costs megabytes rather than the gigabytes of a
+    Python object graph. Sampling a random neighbour is O(1).
+    """
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray) -> None:
+        self.indptr = np.ascontiguousarray(indptr, dtype=np.int64)
+        self.indices = np.ascontiguousarray(indices, dtype=np.int64)
+        # Memoryviews index to plain ints, much faster than NumPy scalars.
+        self._indptr_view = memoryview(self.indptr)
+        self._indices_view = memoryview(self.indices)
+
+    def __reduce__(self) -> tuple:
+        return CSRGraph, (self.indptr, self.indices)
+
+    @classmethod
+    def from_edges(cls, n: int, sources: np.ndarray, targets: np.ndarray) -> CSRGraph:
+        """Build a graph from undirected edges, dropping self-loops and duplicates."""
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        keep = sources != targets
+        sources, targets = sources[keep], targets[keep]
+        # Both directions, deduplicated and sorted by source in one pass.
+        keys = _sorted_unique(np.concatenate([sources * n + targets, targets * n + sources]))
+        counts = np.bincount(keys // n, minlength=n)
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return cls(indptr, keys % n)
+
+    @classmethod
+    def from_networkx(cls, graph: nx.Graph) -> CSRGraph:
+        """Convert a networkx graph, numbering its nodes in iteration order."""
+        labels = {node: i for i, node in enumerate(graph.nodes)}
+        edges = np.array(
+            [(labels[u], labels[v]) for u, v in graph.edges], dtype=np.int64
+        ).reshape(-1, 2)
+        return cls.from_edges(len(labels), edges[:, 0], edges[:, 1])
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def num_edges(self) -> int:
+        """Number of undirected edges."""
+        return len(self.indices) // 2
+
+    @property
+    def nbytes(self) -> int:
+        return self.indptr.nbytes + self.indices.nbytes
+
+    def degrees(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def neighbors(self, node: int) -> np.ndarray:
+        """Return the neighbours of a node as a view."""
+        return self.indices[self.indptr[node] : self.indptr[node + 1]]
+
+    def sample_neighbor(self, rand: random.Random, node: int) -> int:
+        """Return a uniformly random neighbour of ``node``, or -1 if it has none."""
+        start = self._indptr_view[node]
+        degree = self._indptr_view[node + 1] - start
+        if degree == 0:
+            return -1
+        return self._indices_view[start + int(rand.random() * degree)]
+
+    def sample_neighbors(self, rng: np.random.Generator, nodes: np.ndarray) -> np.ndarray:
+        """Draw one random neighbour per node at once; -1 where a node has none."""
+        return self.neighbors_at(nodes, rng.random(len(nodes)))
+
+    def neighbors_at(self, nodes: np.ndarray, uniforms: np.ndarray) -> np.ndarray:
+        """Pick the neighbour at relative position ``uniforms`` in each node's list.
+
+        ``uniforms`` are draws in ``[0, 1)``, one per node; -1 where a node has
+        no neighbours.
+        """
+        starts = self.indptr[nodes]
+        degrees = self.indptr[nodes + 1] - starts
+        offsets = np.minimum((uniforms * degrees).astype(np.int64), degrees - 1)
+        has_neighbors = degrees > 0
+        picks = np.full(len(nodes), -1, dtype=np.int64)
+        picks[has_neighbors] = self.indices[(starts + offsets)[has_neighbors]]
+        return picks
+
+
+def _sorted_unique(keys: np.ndarray) -> np.ndarray:
+    """Sorted distinct values; a plain sort beats ``np.unique`` on large int arrays."""
+    keys = np.sort(keys)
+    if len(keys) < 2:
+        return keys
+    distinct = np.empty(len(keys), dtype=bool)
+    distinct[0] = True
+    np.not_equal(keys[1:], keys[:-1], out=distinct[1:])
+    return keys[distinct]
+
+
+def erdos_renyi(n: int, mean_degree: float, rng: np.random.Generator) -> CSRGraph:
+    """Random graph with about ``n * mean_degree / 2`` uniformly drawn edges.
+
+    The edge count is capped at the ``n * (n - 1) / 2`` edges that exist.
+    """
+    wanted = min(int(round(n * mean_degree / 2)), n * (n - 1) // 2)
+    keys = np.empty(0, dtype=np.int64)
+    while len(keys) < wanted and n > 1:
+        draw = wanted - len(keys)
+        u = rng.integers(0, n, size=draw + draw // 10 + 16)
+        v = rng.integers(0, n, size=len(u))
+        u, v = np.minimum(u, v), np.maximum(u, v)
+        keys = _sorted_unique(np.concatenate([keys, (u * n + v)[u != v]]))
+    if len(keys) > wanted:
+        keys = rng.choice(keys, size=wanted, replace=False)
+    return CSRGraph.from_edges(n, keys // n, keys % n)
+
+
+def watts_strogatz(
+    n: int,
+    k: int,
+    rewire_probability: float,
+    rng: np.random.Generator,
+) -> CSRGraph:
+    """Small-world graph: a ring of ``k`` nearest neighbours with random rewiring.
+
+    Each ring edge keeps its source and, with ``rewire_probability``, moves
+    its far end to a uniformly random node. Rewired edges that collide with
+    existing ones are dropped, so the mean degree can fall slightly below ``k``.
+    """
+    nodes = np.arange(n, dtype=np.int64)
+    sources = np.tile(nodes, k // 2)
+    offsets = np.repeat(np.arange(1, k // 2 + 1, dtype=np.int64), n)
+    targets = (sources + offsets) % n
+    rewire = rng.random(len(targets)) < rewire_probability
+    targets[rewire] = rng.integers(0, n, size=int(rewire.sum()))
+    return CSRGraph.from_edges(n, sources, targets)
+
+
+def barabasi_albert(n: int, m: int, rng: np.random.Generator) -> CSRGraph:
+    """Scale-free graph by preferential attachment, each new node adding ``m`` edges.
+
+    Uses the Batagelj-Brandes edge-list formulation: a new edge's target is
+    the node at a uniformly random position among the endpoints of all
+    earlier edges, which is a draw proportional to degree. A position that
+    holds an earlier random target is followed by pointer jumping, so the
+    whole graph is built with array operations. Nodes ``0..m`` start as a
+    clique; multi-edges drawn by one node are merged.
+    """
+    if n <= m + 1:
+        return CSRGraph.from_networkx(nx.complete_graph(n))
+
+    seed_sources, seed_targets = np.triu_indices(m + 1, k=1)
+    num_seed = len(seed_sources)
+    new_nodes = np.repeat(np.arange(m + 1, n, dtype=np.int64), m)
+    num_edges = num_seed + len(new_nodes)
+
+    # endpoints[2e] and endpoints[2e + 1] are the two ends of edge e.
+    endpoints = np.empty(2 * num_edges, dtype=np.int64)
+    endpoints[0 : 2 * num_seed : 2] = seed_sources
+    endpoints[1 : 2 * num_seed : 2] = seed_targets
+    endpoints[2 * num_seed :: 2] = new_nodes
+
+    # A new node draws only among endpoints of edges added before its own.
+    first_edge = num_seed + (new_nodes - (m + 1)) * m
+    draws = (rng.random(len(new_nodes)) * (2 * first_edge)).astype(np.int64)
+
+    pointer = np.arange(2 * num_edges, dtype=np.int64)
+    pointer[2 * num_seed + 1 :: 2] = draws
+    while True:
+        jumped = pointer[pointer]
+        if np.array_equal(jumped, pointer):
+            break
+        pointer = jumped
+    endpoints = endpoints[pointer]
+    return CSRGraph.from_edges(n, endpoints[0::2], endpoints[1::2])
+
+
+class NetworkParams(PydanticModel):
+    """The social network that trading partners are drawn from.
+
+    ``complete`` lets anyone trade with anyone, without building a graph.
+    ``erdos_renyi`` draws edges uniformly at random, ``small_world`` rewires
+    a ring lattice with ``rewire_probability`` and ``scale_free`` grows the
+    graph by preferential attachment. ``mean_degree`` sets the average
+    number of neighbours (rounded down to an even number for the last two).
+    """
+
+    kind: NetworkKind = "complete"
+    mean_degree: int = Field(default=4, ge=2)
+    rewire_probability: float = Field(default=0.1, ge=0, le=1)
+
+    def build(self, n: int, rng: np.random.Generator) -> CSRGraph | None:
+        """Generate the network over ``n`` nodes, or ``None`` for ``complete``."""
+        if self.kind == "erdos_renyi":
+            return erdos_renyi(n, self.mean_degree, rng)
+        if self.kind == "small_world":
+            return watts_strogatz(n, self.mean_degree, self.rewire_probability, rng)
+        if self.kind == "scale_free":
+            return barabasi_albert(n, self.mean_degree // 2, rng)
+        return None
@@ -0,0 +1,640 @@
+"""Shared-memory multi-process backend for the basic economy model."""
+
+from __future__ import annotations
+
+import math
+import multiprocessing as mp
+import traceback
+import weakref
+from collections.abc import Sequence
+from multiprocessing.connection import Connection
+from typing import Any
+
+import numpy as np
+
+from social_sim.analysis.inequality import WealthDistribution, WealthIndex
+from social_sim.core.model import BaseModel
+from social_sim.core.reporters import FusedReporter
+from social_sim.core.rng import RNGService
+from social_sim.core.shared import ArraySpec, SharedArrays
+from social_sim.models.array_economy import invest_in_education
+from social_sim.models.basic_economy import (
+    ECONOMY_PHASES,
+    EconomyParams,
+    TaxParams,
+    compute_happiness,
+    draw_initial_population,
+    population_reporter_names,
+    summarize_population,
+)
+from social_sim.models.network import CSRGraph
+from social_sim.models.tax import TaxSchedule
+from social_sim.models.trade import partners_from_uniforms
+
+# Columns of the per-block partial sums that are combined at step barriers.
+INCOME, START_WEALTH, TAX, DAMAGE, EDUCATION, WEALTH, HAPPINESS, PRODUCTIVITY, RANKED = range(9)
+NUM_PARTIALS = 9
+
+# Citizens are summed in at most this many fixed blocks, whatever the workers.
+MAX_BLOCKS = 1024
+
+
+def block_size(n: int) -> int:
+    """Citizens per partial-sum block; depends on ``n`` only."""
+    return max(1, -(-n // MAX_BLOCKS))
+
+
+def block_bounds(n: int) -> np.ndarray:
+    """Start of every partial-sum block, followed by ``n``."""
+    return np.append(np.arange(0, n, block_size(n), dtype=np.int64), n)
+
+
+def shard_bounds(n: int, workers: int) -> np.ndarray:
+    """Split ``n`` citizens into ``workers`` contiguous shards of whole blocks."""
+    blocks = block_bounds(n)
+    num_blocks = len(blocks) - 1
+    return blocks[(np.arange(workers + 1, dtype=np.int64) * num_blocks) // workers]
+
+
+def combine(partials: np.ndarray, column: int) -> float:
+    """Exactly rounded total of one partial column, independent of block order."""
+    return math.fsum(partials[:, column].tolist())
+
+
+def _shared_specs(n: int, workers: int, network: CSRGraph | None) -> dict[str, ArraySpec]:
+    specs: dict[str, ArraySpec] = {
+        "wealth": ((n,), "f8"),
+        "happiness": ((n,), "f8"),
+        "productivity": ((n,), "f8"),
+        # Each citizen's outgoing transfer, grouped by destination shard.
+        "out_partner": ((n,), "i8"),
+        "out_amount": ((n,), "f8"),
+        "routes": ((workers, workers + 1), "i8"),
+        # Per-shard sorted wealth, quantile samples and the globally sorted
+        # wealth, for the Gini coefficient.
+        "sorted": ((n,), "f8"),
+        "samples": ((workers, workers), "f8"),
+        "ranked": ((n,), "f8"),
+        "partials": ((len(block_bounds(n)) - 1, NUM_PARTIALS), "f8"),
+    }
+    if network is not None:
+        specs["indptr"] = (network.indptr.shape, "i8")
+        specs["indices"] = (network.indices.shape, "i8")
+    return specs
+
+
+class ShardWorker:
+    """Steps one contiguous shard of the shared population inside a worker.
+
+    Every phase works on the shard's slice of the shared arrays. Values that
+    need the whole population are combined from the ``partials`` rows after
+    a barrier. There is one row per fixed block of citizens and the rows
+    are added with ``math.fsum``, so every worker (and the coordinating
+    model) sees the same totals however the blocks are split into shards.
+
+    ``PHASES`` maps the names of ``ECONOMY_PHASES`` to the worker methods
+    that run them. Both trade phases run the synchronous exchange; as in the
+    other backends, ``trade`` leaves the happiness of citizens without a
+    partner alone, while ``synchronous_trade`` updates everyone's.
+    """
+
+    PHASES = {
+        "income": "_income",
+        "trade": "_sequential_trade",
+        "synchronous_trade": "_synchronous_trade",
+        "tax": "_tax",
+        "ubi": "_ubi",
+        "disaster": "_disaster",
+        "education": "_education",
+    }
+
+    def __init__(
+        self,
+        shared: SharedArrays,
+        shard: int,
+        bounds: np.ndarray,
+        rngs: RNGService,
+        barrier: Any,
+    ) -> None:
+        self.shared = shared
+        self.shard = shard
+        self.bounds = bounds
+        self.workers = len(bounds) - 1
+        self.n = int(bounds[-1])
+        self.lo, self.hi = int(bounds[shard]), int(bounds[shard + 1])
+        self.rngs = rngs
+        self.barrier = barrier
+        blocks = block_bounds(self.n)
+        first, last = np.searchsorted(blocks, [self.lo, self.hi])
+        self.block_rows = slice(int(first), int(last))
+        self.block_offsets = blocks[first:last] - self.lo
+        self.wealth = shared["wealth"][self.lo : self.hi]
+        self.happiness = shared["happiness"][self.lo : self.hi]
+        self.productivity = shared["productivity"][self.lo : self.hi]
+        self.partials = shared["partials"]
+        self.graph = (
+            CSRGraph(shared["indptr"], shared["indices"]) if "indptr" in shared.arrays else None
+        )
+        self.params = EconomyParams()
+        self._tax_params: TaxParams | None = None
+        self.tax_schedule: TaxSchedule | None = None
+
+    def total(self, column: int) -> float:
+        """Sum one partial over all blocks (after a barrier)."""
+        return combine(self.partials, column)
+
+    def record(self, column: int, values: np.ndarray) -> None:
+        """Store the per-block sums of a shard-long array in the partials."""
+        if len(values):
+            self.partials[self.block_rows, column] = np.add.reduceat(values, self.block_offsets)
+
+    def step(
+        self, params: EconomyParams, phases: Sequence[str], disaster: bool, step: int
+    ) -> None:
+        """Run model step number ``step`` on this shard, one named phase after another."""
+        self.partials[self.block_rows] = 0.0
+        self.params = params
+        if params.tax != self._tax_params:
+            self._tax_params = params.tax
+            self.tax_schedule = TaxSchedule.from_params(params.tax)
+        for name in phases:
+            getattr(self, self.PHASES[name])(disaster, step)
+        self.record(WEALTH, self.wealth)
+        self.record(HAPPINESS, self.happiness)
+        self.record(PRODUCTIVITY, self.productivity)
+        self._rank_wealth()
+
+    def _income(self, disaster: bool, step: int) -> None:
+        income = self.params.income.base_income * self.productivity
+        self.wealth += income
+        self.record(INCOME, income)
+
+    def _sequential_trade(self, disaster: bool, step: int) -> None:
+        self._trade_phase(step, partnered_only=True)
+
+    def _synchronous_trade(self, disaster: bool, step: int) -> None:
+        self._trade_phase(step, partnered_only=False)
+
+    def _trade_phase(self, step: int, partnered_only: bool) -> None:
+        self.record(START_WEALTH, self.wealth)
+        self.barrier.wait()
+        mean_wealth = self.total(START_WEALTH) / self.n if self.n else 0.0
+        if self.n < 2:
+            return
+        partners = self._trade(step)
+        happiness = compute_happiness(self.wealth, mean_wealth)
+        if partnered_only:
+            traded = partners != np.arange(self.lo, self.hi)
+            self.happiness[traded] = happiness[traded]
+        else:
+            self.happiness[:] = happiness
+
+    def _tax(self, disaster: bool, step: int) -> None:
+        tax = self.tax_schedule.compute(self.wealth)
+        self.wealth -= tax
+        self.record(TAX, tax)
+
+    def _ubi(self, disaster: bool, step: int) -> None:
+        self.barrier.wait()
+        if self.n:
+            self.wealth += self.total(TAX) / self.n
+
+    def _disaster(self, disaster: bool, step: int) -> None:
+        if disaster:
+            damage = self.wealth * self.params.disaster.damage_rate
+            self.wealth -= damage
+            self.record(DAMAGE, damage)
+
+    def _education(self, disaster: bool, step: int) -> None:
+        investment = invest_in_education(
+            self.wealth,
+            self.productivity,
+            self.params.education.investment_rate,
+            self.params.education.max_productivity,
+        )
+        self.record(EDUCATION, investment)
+
+    def _trade(self, step: int) -> np.ndarray:
+        """Synchronous exchange, with cross-shard transfers batched per shard.
+
+        Each citizen's transfer goes to the shared outbox at its own index,
+        sorted by the partner's shard; ``routes`` records where each
+        destination's batch starts. After the barrier every shard reads the
+        batches addressed to it in source order and scatter-adds them in one
+        pass, so each citizen's receipts are added in the same order for any
+        number of shards. Partner draws are keyed by citizen index, for the
+        same reason. Returns each citizen's partner.
+        """
+        lo, hi, n = self.lo, self.hi, self.n
+        local = np.arange(lo, hi, dtype=np.int64)
+        uniforms = self.rngs.random_blocks(lo, hi, "trade", step)
+        partners = partners_from_uniforms(uniforms, local, n, self.graph)
+        transfers = np.clip(self.wealth, 0.0, 1.0)
+        self.wealth -= transfers
+
+        destinations = np.searchsorted(self.bounds, partners, side="right") - 1
+        order = np.argsort(destinations, kind="stable")
+        out_partner = self.shared["out_partner"]
+        out_amount = self.shared["out_amount"]
+        routes = self.shared["routes"]
+        out_partner[lo:hi] = partners[order]
+        out_amount[lo:hi] = transfers[order]
+        routes[self.shard, 0] = 0
+        np.cumsum(np.bincount(destinations, minlength=self.workers), out=routes[self.shard, 1:])
+        self.barrier.wait()
+
+        batches = []
+        for source in range(self.workers):
+            start = self.bounds[source] + routes[source, self.shard]
+            stop = self.bounds[source] + routes[source, self.shard + 1]
+            batches.append(slice(start, stop))
+        received = np.bincount(
+            np.concatenate([out_partner[batch] for batch in batches]) - lo,
+            weights=np.concatenate([out_amount[batch] for batch in batches]),
+            minlength=hi - lo,
+        )
+        self.wealth += received
+        return partners
+
+    def _rank_wealth(self) -> None:
+        """Record this shard's blocks of ``sum(rank * wealth)`` over the global order.
+
+        A parallel sample sort: each shard sorts its own wealth and publishes
+        quantile samples; the samples give every worker the same splitters,
+        and worker ``k`` takes the ``k``-th value range from every sorted
+        shard, merges it and writes it to ``ranked`` after the values below
+        the range. Once all of ``ranked`` is sorted, each worker weights its
+        own index blocks of it by rank.
+        """
+        workers = self.workers
+        local_sorted = np.sort(self.wealth)
+        self.shared["sorted"][self.lo : self.hi] = local_sorted
+        samples = self.shared["samples"]
+        if len(local_sorted):
+            picks = ((np.arange(workers) + 0.5) * len(local_sorted) / workers).astype(np.int64)
+            samples[self.shard] = local_sorted[picks]
+        else:
+            samples[self.shard] = np.nan
+        self.barrier.wait()
+
+        pooled = samples.ravel()
+        pooled = np.sort(pooled[~np.isnan(pooled)])
+        splitters = pooled[(np.arange(1, workers) * len(pooled)) // workers]
+        low = splitters[self.shard - 1] if self.shard > 0 else None
+        high = splitters[self.shard] if self.shard < workers - 1 else None
+
+        below = 0
+        pieces = []
+        everything = self.shared["sorted"]
+        for source in range(workers):
+            segment = everything[self.bounds[source] : self.bounds[source + 1]]
+            start = int(np.searchsorted(segment, low)) if low is not None else 0
+            stop = int(np.searchsorted(segment, high)) if high is not None else len(segment)
+            below += start
+            pieces.append(segment[start:stop])
+        ranked = self.shared["ranked"]
+        merged = np.concatenate(pieces)
+        merged.sort()
+        ranked[below : below + len(merged)] = merged
+        self.barrier.wait()
+
+        ranks = np.arange(self.lo + 1, self.hi + 1, dtype=float)
+        self.record(RANKED, ranks * ranked[self.lo : self.hi])
+
+
+def _run_worker(
+    name: str,
+    specs: dict[str, ArraySpec],
+    shard: int,
+    bounds: np.ndarray,
+    seed: int,
+    barrier: Any,
+    connection: Connection,
+) -> None:
+    """Worker process entry point: step the shard on every command until ``None``."""
+    shared = SharedArrays.attach(name, specs)
+    worker = ShardWorker(shared, shard, bounds, RNGService(seed), barrier)
+    try:
+        while True:
+            try:
+                message = connection.recv()
+            except EOFError:
+                break
+            if message is None:
+                break
+            params_data, phases, disaster, step = message
+            try:
+                worker.step(EconomyParams.model_validate(params_data), phases, disaster, step)
+            except Exception:
+                barrier.abort()
+                connection.send(traceback.format_exc())
+            else:
+                connection.send(None)
+    finally:
+        del worker
+        shared.close()
+
+
+class ShardPool:
+    """The worker processes and shared segment behind one parallel model.
+
+    Workers rebuild the model's ``RNGService`` from its root ``seed``.
+    """
+
+    def __init__(self, shared: SharedArrays, bounds: np.ndarray, seed: int) -> None:
+        context = mp.get_context()
+        workers = len(bounds) - 1
+        self.shared = shared
+        self.barrier = context.Barrier(workers)
+        self.connections: list[Connection] = []
+        self.processes: list[Any] = []
+        for shard in range(workers):
+            parent, child = context.Pipe()
+            process = context.Process(
+                target=_run_worker,
+                args=(shared.name, shared.specs, shard, bounds, seed, self.barrier, child),
+                daemon=True,
+            )
+            process.start()
+            child.close()
+            self.connections.append(parent)
+            self.processes.append(process)
+
+    def step(
+        self, params: EconomyParams, phases: Sequence[str], disaster: bool, step: int
+    ) -> None:
+        """Have every worker run ``phases`` on its shard and wait for all of them."""
+        message = (params.model_dump(), list(phases), disaster, step)
+        for connection in self.connections:
+            connection.send(message)
+        errors = []
+        for connection in self.connections:
+            try:
+                reply = connection.recv()
+            except (EOFError, OSError):
+                self.barrier.abort()
+                reply = "worker process exited"
+            if reply is not None:
+                errors.append(reply)
+        if errors:
+            raise RuntimeError(f"parallel step failed:\n{errors[0]}")
+
+    def close(self) -> None:
+        """Stop the workers, then release and free the shared segment."""
+        for connection in self.connections:
+            try:
+                connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        for connection in self.connections:
+            connection.close()
+        self.connections.clear()
+        self.processes.clear()
+        try:
+            self.shared.close()
+        except BufferError:
+            # Views of the segment are still alive somewhere; unlinking still
+            # frees it once they are garbage collected.
+            pass
+        self.shared.unlink()
+
+
+class _PoolHandle:
+    """Holds the current pool so a finalizer can close it without the model."""
+
+    def __init__(self) -> None:
+        self.pool: ShardPool | None = None
+
+    def close(self) -> None:
+        if self.pool is not None:
+            pool, self.pool = self.pool, None
+            pool.close()
+
+
+class ParallelEconomyModel(BaseModel):
+    """The array economy stepped by worker processes over shared memory.
+
+    Citizens are split into ``params.workers`` contiguous shards of arrays in
+    one shared-memory segment. The phases enabled in ``ECONOMY_PHASES`` run
+    in registry order, each worker on its own shard (see
+    ``ShardWorker.PHASES``); phases the workers cannot run are rejected by
+    ``compile_phases``, and ``pipeline`` timing hooks do not apply. Mean
+    wealth, tax revenue for UBI and the reporter totals are combined from
+    per-shard partial sums at step barriers, and the Gini coefficient comes
+    from a parallel sample sort. Trading always uses the synchronous
+    exchange, since sequential trading is inherently serial; cross-shard
+    transfers travel in one batch per shard pair. The model must be closed
+    (or used as a context manager) to stop the workers; between steps the
+    arrays can be read and modified directly. Random draws are keyed by step and citizen index and totals
+    are summed over fixed blocks, so a seeded run gives bit-identical
+    results for any number of workers.
+    """
+
+    phases = ECONOMY_PHASES
+    phase_kind = "vectorized"
+    wealth_index_type = WealthIndex
+
+    def __init__(self, params: EconomyParams | None = None) -> None:
+        self.economy_params = params or EconomyParams()
+        super().__init__(params=self.economy_params)  # type: ignore[arg-type]
+
+        self.tax_revenue = 0.0
+        self.ubi_amount = 0.0
+        self.total_income = 0.0
+        self.mean_wealth = 0.0
+        self.disaster_occurred = False
+        self.disaster_damage = 0.0
+        self.education_investment = 0.0
+        self.mean_productivity = 0.0
+        self._summary: dict[str, float] | None = None
+
+        wealth, productivity = draw_initial_population(
+            self.economy_params, self.rngs.stream("population")
+        )
+        self.network: CSRGraph | None = self.economy_params.trade.network.build(
+            len(wealth), self.rngs.stream("network")
+        )
+        self.compile_phases()
+        self._handle = _PoolHandle()
+        self._finalizer = weakref.finalize(self, self._handle.close)
+        self._start(wealth, np.full(len(wealth), 0.5), productivity)
+
+        self.setup_datacollector(
+            fused_reporters=[
+                FusedReporter(
+                    population_reporter_names(self.economy_params),
+                    self._population_summary,
+                ),
+            ],
+            model_reporters={
+                "Tax Revenue": lambda m: m.tax_revenue,
+                "UBI Amount": lambda m: m.ubi_amount,
+                "Total Income": lambda m: m.total_income,
+                "Disaster Damage": lambda m: m.disaster_damage,
+            },
+            agent_reporters={
+                "Wealth": lambda m: m.wealth,
+                "Happiness": lambda m: m.happiness,
+            },
+        )
+
+    def compile_phases(self) -> None:
+        """Pick the enabled phases, in order, for the workers to run by name.
+
+        Call again after switching a policy on or off.
+        """
+        phases = self.phases.select(self, self.economy_params)
+        unsupported = [p.name for p in phases if p.name not in ShardWorker.PHASES]
+        if unsupported:
+            raise ValueError(f"the parallel backend cannot run phases {unsupported}")
+        self.phase_names = tuple(phase.name for phase in phases)
+
+    def _start(self, wealth: np.ndarray, happiness: np.ndarray, productivity: np.ndarray) -> None:
+        """Copy the population into a new shared segment and start the workers."""
+        n = len(wealth)
+        workers = self.economy_params.workers
+        shared = SharedArrays(_shared_specs(n, workers, self.network))
+        shared["wealth"][:] = wealth
+        shared["happiness"][:] = happiness
+        shared["productivity"][:] = productivity
+        if self.network is not None:
+            shared["indptr"][:] = self.network.indptr
+            shared["indices"][:] = self.network.indices
+        self.wealth = shared["wealth"]
+        self.happiness = shared["happiness"]
+        self.productivity = shared["productivity"]
+        self._partials = shared["partials"]
+        self._handle.pool = ShardPool(shared, shard_bounds(n, workers), self.rngs.entropy)
+
+    def _detach(self) -> None:
+        """Replace the shared views with private copies and stop the workers."""
+        self.wealth = self.wealth.copy()
+        self.happiness = self.happiness.copy()
+        self.productivity = self.productivity.copy()
+        self._partials = self._partials.copy()
+        self._handle.close()
+
+    def close(self) -> None:
+        """Stop the workers and free shared memory; the data stays readable."""
+        if self._handle.pool is not None:
+            self._detach()
+
+    def __enter__(self) -> ParallelEconomyModel:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def population(self) -> int:
+        """Number of citizens in the model."""
+        return len(self.wealth)
+
+    def step(self) -> None:
+        """Execute one step of the model across all workers."""
+        pool = self._handle.pool
+        if pool is None:
+            raise RuntimeError("the parallel model has been closed")
+
+        params = self.economy_params
+        phases = self.phase_names
+        if "disaster" in phases:
+            self.disaster_occurred = bool(
+                self.rngs.stream("disaster").random() < params.disaster.probability
+            )
+        pool.step(params, phases, self.disaster_occurred, self.step_count)
+
+        def total(column: int) -> float:
+            return combine(self._partials, column)
+
+        n = self.population
+        self.total_income = total(INCOME)
+        self.mean_wealth = total(START_WEALTH) / n if n else 0.0
+        self.tax_revenue = total(TAX)
+        self.ubi_amount = self.tax_revenue / n if "ubi" in phases and n else 0.0
+        self.disaster_damage = total(DAMAGE)
+        self.education_investment = total(EDUCATION)
+        self.mean_productivity = total(PRODUCTIVITY) / n if n else 0.0
+
+        wealth = total(WEALTH)
+        gini = 0.0
+        if n and wealth != 0:
+            gini = max(0.0, (2 * total(RANKED) / wealth - (n + 1)) / n)
+        self._summary = {
+            "Total Wealth": wealth,
+            "Mean Wealth": wealth / n if n else 0.0,
+            "Gini": gini,
+            "Mean Happiness": total(HAPPINESS) / n if n else 0.0,
+            "Mean Productivity": self.mean_productivity,
+        }
+
+        super().step()
+
+    def agent_arrays(self, attributes: Sequence[str]) -> dict[str, np.ndarray]:
+        """Return the per-citizen arrays by name, without copying."""
+        return {name: getattr(self, name) for name in attributes}
+
+    def get_wealth(self) -> np.ndarray:
+        """Return the wealth of every citizen as an array."""
+        return self.wealth
+
+    def get_happiness(self) -> np.ndarray:
+        """Return the happiness of every citizen as an array."""
+        return self.happiness
+
+    def get_productivity(self) -> np.ndarray:
+        """Return the productivity of every citizen as an array."""
+        return self.productivity
+
+    def scale_productivity(self, factor: float) -> None:
+        """Multiply every citizen's productivity by a factor."""
+        self.productivity *= factor
+        self._summary = None
+
+    def apply_wealth_shock(self, damage_rate: float) -> float:
+        """Destroy a share of every citizen's wealth and return the total loss."""
+        damage = self.wealth * damage_rate
+        self.wealth -= damage
+        self._summary = None
+        self.invalidate_wealth_index()
+        return float(damage.sum())
+
+    def add_citizens(
+        self,
+        wealth: Sequence[float] | np.ndarray,
+        productivity: Sequence[float] | np.ndarray,
+    ) -> None:
+        """Append new citizens, re-sharding the population over new workers."""
+        if len(wealth) == 0:
+            return
+        running = self._handle.pool is not None
+        self._detach()
+        wealth = np.concatenate([self.wealth, np.asarray(wealth, dtype=float)])
+        productivity = np.concatenate([self.productivity, np.asarray(productivity, dtype=float)])
+        happiness = np.concatenate([self.happiness, np.full(len(wealth) - self.population, 0.5)])
+        self._summary = None
+        self.invalidate_wealth_index()
+        if running:
+            self._start(wealth, happiness, productivity)
+        else:
+            self.wealth, self.happiness, self.productivity = wealth, happiness, productivity
+
+    @staticmethod
+    def _population_summary(model: ParallelEconomyModel) -> dict[str, float]:
+        """Use the totals combined by the workers, or scan the arrays if stale."""
+        inequality = model.economy_params.inequality_reporters
+        if model._summary is None:
+            return summarize_population(
+                model.wealth,
+                mean_happiness=float(np.mean(model.happiness)) if model.population else 0.0,
+                mean_productivity=float(np.mean(model.productivity)) if model.population else 0.0,
+                inequality=inequality,
+            )
+        values = dict(model._summary)
+        if inequality:
+            values.update(WealthDistribution(model.wealth).summary())
+        return values
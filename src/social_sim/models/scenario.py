@@ -0,0 +1,49 @@
+"""Running one economy scenario to completion and summarizing it."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from pydantic import BaseModel as PydanticModel
+
+from social_sim.core.model import BaseModel, CollectionPolicy
+from social_sim.core.stopping import RunSummary, StoppingCriteria
+from social_sim.models.basic_economy import EconomyParams
+from social_sim.models.factory import create_economy_model
+
+
+class ScenarioResult(PydanticModel):
+    """How one run ended and its last collected value of every reporter."""
+
+    summary: RunSummary
+    metrics: dict[str, float]
+
+
+def run_scenario(
+    params: EconomyParams,
+    steps: int,
+    stopping: StoppingCriteria | None = None,
+    on_step: Callable[[BaseModel], None] | None = None,
+    collect_every: int | None = None,
+) -> ScenarioResult:
+    """Build the model for ``params``, run it and summarize the outcome.
+
+    ``on_step`` is handed to ``BaseModel.run``. Model reporters are collected
+    after the last step, and every ``collect_every`` steps if given; agent
+    reporters are never recorded, since only the final values are kept.
+    """
+    model = create_economy_model(params)
+    if collect_every is None:
+        model.collection = CollectionPolicy(mode="end", agents=False)
+    else:
+        model.collection = CollectionPolicy(mode="every", interval=collect_every, agents=False)
+    try:
+        summary = model.run(steps, stopping=stopping, on_step=on_step)
+        data = model.get_model_data()
+        metrics = {name: float(values[-1]) for name, values in data.items() if len(values)}
+    finally:
+        close = getattr(model, "close", None)
+        if close is not None:
+            close()
+    return ScenarioResult(summary=summary, metrics=metrics)
+
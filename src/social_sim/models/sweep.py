@@ -0,0 +1,308 @@
+"""Parameter sweeps: many ``EconomyParams`` variations run as background jobs."""
+
+from __future__ import annotations
+
+import itertools
+import math
+import multiprocessing as mp
+import os
+import threading
+import time
+import uuid
+from collections.abc import Mapping
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Any, Literal
+
+from pydantic import BaseModel as PydanticModel, Field
+
+from social_sim.core.stopping import RunSummary, StoppingCriteria
+from social_sim.models.basic_economy import EconomyParams
+from social_sim.models.catalog import ExperimentCatalog
+from social_sim.models.scenario import run_scenario
+
+SweepState = Literal["queued", "running", "completed", "cancelled", "failed"]
+
+MAX_SWEEP_POINTS = 10_000
+
+
+def apply_overrides(base: EconomyParams, overrides: Mapping[str, Any]) -> EconomyParams:
+    """Return ``base`` with dotted-path fields replaced, e.g. ``"tax.enabled"``.
+
+    Numbers in a path pick list items, as in ``"tax.brackets.1.rate"``.
+    A dict value is merged into a nested group, so ``{"tax": {"enabled":
+    True}}`` works as well; other values replace the field whole.
+    Raises ``ValueError`` for paths that name no parameter or values that do
+    not validate.
+    """
+    data = base.model_dump()
+    for path, value in overrides.items():
+        target: Any = data
+        *parents, leaf = path.split(".")
+        for key in parents:
+            target = _child(target, key, path)
+            if not isinstance(target, (dict, list)):
+                raise ValueError(f"unknown parameter {path!r}")
+        current = _child(target, leaf, path)
+        target[int(leaf) if isinstance(target, list) else leaf] = _merge(current, value)
+    return EconomyParams.model_validate(data)
+
+
+def _child(target: dict[str, Any] | list[Any], key: str, path: str) -> Any:
+    """Return ``target[key]``, where ``key`` numbers list items."""
+    if isinstance(target, list):
+        if not key.isdigit() or int(key) >= len(target):
+            raise ValueError(f"unknown parameter {path!r}")
+        return target[int(key)]
+    if key not in target:
+        raise ValueError(f"unknown parameter {path!r}")
+    return target[key]
+
+
+def _merge(current: Any, value: Any) -> Any:
+    """Merge a nested override into the current value, key by key."""
+    if not isinstance(current, dict) or not isinstance(value, dict):
+        return value
+    merged = dict(current)
+    for key, item in value.items():
+        if key not in merged:
+            raise ValueError(f"unknown parameter {key!r}")
+        merged[key] = _merge(merged[key], item)
+    return merged
+
+
+class SweepSpec(PydanticModel):
+    """The runs of a sweep: ``base`` params varied by a grid and/or a list.
+
+    ``grid`` maps dotted parameter paths to candidate values and expands to
+    their cartesian product; ``variations`` lists override sets explicitly,
+    each optionally labelled by a ``name`` key. Given both, every variation
+    is combined with every grid point. Each point runs ``replicates`` times,
+    with seeds ``seed``, ``seed + 1``, ... when ``base.seed`` is set.
+    """
+
+    base: EconomyParams = Field(default_factory=EconomyParams)
+    grid: dict[str, list[Any]] = Field(default_factory=dict)
+    variations: list[dict[str, Any]] = Field(default_factory=list)
+    steps: int = Field(default=100, ge=1)
+    replicates: int = Field(default=1, ge=1)
+    stopping: StoppingCriteria | None = None
+
+    def points(self) -> list[dict[str, Any]]:
+        """Return the overrides of every run, in run order."""
+        keys = list(self.grid)
+        grid = [dict(zip(keys, values)) for values in itertools.product(*self.grid.values())]
+        variations = self.variations or [{}]
+        points = [{**variation, **cell} for variation in variations for cell in grid]
+        if self.replicates == 1:
+            return points
+        seed = self.base.seed
+        return [
+            {**point, "seed": None if seed is None else seed + replicate}
+            for point in points
+            for replicate in range(self.replicates)
+        ]
+
+    def configurations(self) -> list[EconomyParams]:
+        """Return the params of every run, validated up front."""
+        points = self.points()
+        if len(points) > MAX_SWEEP_POINTS:
+            raise ValueError(f"a sweep may have at most {MAX_SWEEP_POINTS} runs")
+        return [
+            apply_overrides(self.base, {k: v for k, v in point.items() if k != "name"})
+            for point in points
+        ]
+
+
+def _run_point(
+    params: dict[str, Any],
+    steps: int,
+    stopping: dict[str, Any] | None,
+    catalog: str | None = None,
+) -> dict[str, Any]:
+    """Pool entry point: run one sweep point from plain data.
+
+    With a ``catalog`` path, an identical catalogued run is reused and a
+    new one is recorded.
+    """
+    config = EconomyParams.model_validate(params)
+    criteria = StoppingCriteria.model_validate(stopping) if stopping is not None else None
+    if catalog is None:
+        return {**run_scenario(config, steps, criteria).model_dump(), "cached": False}
+    with ExperimentCatalog(catalog) as experiments:
+        result, cached = experiments.run(config, steps, criteria)
+    return {**result.model_dump(), "cached": cached}
+
+
+class SweepPoint(PydanticModel):
+    """One finished run of a sweep; non-finite metrics are left out."""
+
+    index: int
+    overrides: dict[str, Any]
+    summary: RunSummary
+    metrics: dict[str, float]
+    cached: bool = False
+
+
+class SweepStatus(PydanticModel):
+    """Progress of a sweep job."""
+
+    sweep_id: str
+    state: SweepState
+    total: int
+    completed: int
+    failed: int
+    created: float
+    finished: float | None = None
+    error: str | None = None
+
+
+class SweepJob:
+    """A submitted sweep: its futures, results and progress.
+
+    Results arrive from the executor's callback thread, so every change
+    goes through ``lock``.
+    """
+
+    def __init__(self, spec: SweepSpec) -> None:
+        self.sweep_id = str(uuid.uuid4())
+        self.spec = spec
+        self.overrides = spec.points()
+        self.results: dict[int, SweepPoint] = {}
+        self.failures = 0
+        self.error: str | None = None
+        self.cancelled = False
+        self.created = time.time()
+        self.finished: float | None = None
+        self.futures: list[Future] = []
+        self.lock = threading.Lock()
+
+    @property
+    def total(self) -> int:
+        return len(self.overrides)
+
+    @property
+    def state(self) -> SweepState:
+        with self.lock:
+            done = len(self.results) + self.failures
+            if self.cancelled:
+                return "cancelled"
+            if done == self.total:
+                return "failed" if self.failures and not self.results else "completed"
+            return "running" if any(f.running() or f.done() for f in self.futures) else "queued"
+
+    def status(self) -> SweepStatus:
+        state = self.state
+        with self.lock:
+            return SweepStatus(
+                sweep_id=self.sweep_id,
+                state=state,
+                total=self.total,
+                completed=len(self.results),
+                failed=self.failures,
+                created=self.created,
+                finished=self.finished,
+                error=self.error,
+            )
+
+    def page(self, offset: int = 0, limit: int = 100) -> list[SweepPoint]:
+        """Finished runs in run order, skipping ``offset`` and returning at most ``limit``."""
+        with self.lock:
+            indices = sorted(self.results)[offset : offset + limit]
+            return [self.results[index] for index in indices]
+
+    def _finish(self, index: int, future: Future) -> None:
+        """Record one point's outcome; called once its future is done."""
+        if future.cancelled():
+            return
+        with self.lock:
+            error = future.exception()
+            if error is not None:
+                self.failures += 1
+                self.error = f"run {index}: {error}"
+            else:
+                result = future.result()
+                self.results[index] = SweepPoint(
+                    index=index,
+                    overrides=self.overrides[index],
+                    summary=result["summary"],
+                    cached=result["cached"],
+                    metrics={
+                        name: value
+                        for name, value in result["metrics"].items()
+                        if math.isfinite(value)
+                    },
+                )
+            if len(self.results) + self.failures == self.total:
+                self.finished = time.time()
+
+
+class SweepManager:
+    """Runs sweep jobs on a shared local worker pool.
+
+    The pool (a ``ProcessPoolExecutor`` with ``workers`` processes unless an
+    ``executor`` is given) starts with the first job. Jobs are kept in
+    memory until ``remove``; ``cancel`` drops a job's runs that have not
+    started yet, while runs already in progress finish and are kept. With
+    a ``catalog`` path, runs go through an ``ExperimentCatalog`` there.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        executor: Executor | None = None,
+        catalog: str | None = None,
+    ) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.catalog = catalog
+        self._executor = executor
+        self._jobs: dict[str, SweepJob] = {}
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.workers, mp_context=mp.get_context())
+        return self._executor
+
+    def submit(self, spec: SweepSpec) -> SweepJob:
+        """Validate every run of ``spec`` and queue them all."""
+        configurations = spec.configurations()
+        job = SweepJob(spec)
+        stopping = spec.stopping.model_dump() if spec.stopping is not None else None
+        self._jobs[job.sweep_id] = job
+        for index, params in enumerate(configurations):
+            future = self.executor.submit(
+                _run_point, params.model_dump(), spec.steps, stopping, self.catalog
+            )
+            job.futures.append(future)
+            future.add_done_callback(lambda done, index=index: job._finish(index, done))
+        return job
+
+    def get(self, sweep_id: str) -> SweepJob | None:
+        return self._jobs.get(sweep_id)
+
+    def jobs(self) -> list[SweepJob]:
+        return list(self._jobs.values())
+
+    def cancel(self, sweep_id: str) -> SweepJob | None:
+        job = self._jobs.get(sweep_id)
+        if job is None:
+            return None
+        for future in job.futures:
+            future.cancel()
+        with job.lock:
+            if len(job.results) + job.failures < job.total:
+                job.cancelled = True
+                job.finished = time.time()
+        return job
+
+    def remove(self, sweep_id: str) -> bool:
+        if self.cancel(sweep_id) is None:
+            return False
+        del self._jobs[sweep_id]
+        return True
+
+    def shutdown(self) -> None:
+        """Cancel queued runs and stop the pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,69 @@
+"""Vectorized helpers for the random-exchange (trade) phase."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from social_sim.models.network import CSRGraph
+
+
+def draw_partners(rng: np.random.Generator, n: int) -> np.ndarray:
+    """Draw one uniformly random partner index per trader, never oneself."""
+    # Offsets in [1, n) make the partner uniform over everyone but oneself.
+    offsets = rng.integers(1, n, size=n)
+    return (np.arange(n) + offsets) % n
+
+
+def draw_network_partners(
+    graph: CSRGraph,
+    rng: np.random.Generator,
+    nodes: np.ndarray,
+) -> np.ndarray:
+    """Draw one random graph neighbour per node, or the node itself if it has none.
+
+    Nodes beyond the graph (citizens added after it was built) have no ties.
+    Pairing a node with itself makes its trade a no-op in both trade schedules.
+    """
+    partners = nodes.copy()
+    in_graph = nodes < graph.num_nodes
+    picks = graph.sample_neighbors(rng, nodes[in_graph])
+    partners[in_graph] = np.where(picks >= 0, picks, nodes[in_graph])
+    return partners
+
+
+def partners_from_uniforms(
+    uniforms: np.ndarray,
+    nodes: np.ndarray,
+    n: int,
+    graph: CSRGraph | None = None,
+) -> np.ndarray:
+    """Turn one ``[0, 1)`` draw per node into its partner, like the draws above.
+
+    Without a graph the partner is uniform over everyone else; with one it
+    is a uniform neighbour, or the node itself if it has none. Keeping the
+    randomness in precomputed uniforms lets callers draw them in a way that
+    does not depend on how the nodes are batched.
+    """
+    if graph is None:
+        offsets = np.minimum((uniforms * (n - 1)).astype(np.int64), n - 2)
+        return (nodes + 1 + offsets) % n
+    partners = nodes.copy()
+    in_graph = nodes < graph.num_nodes
+    picks = graph.neighbors_at(nodes[in_graph], uniforms[in_graph])
+    partners[in_graph] = np.where(picks >= 0, picks, nodes[in_graph])
+    return partners
+
+
+def exchange_synchronously(wealth: np.ndarray, partners: np.ndarray) -> np.ndarray:
+    """Apply every trader's transfer at once and return the new wealth.
+
+    Each trader ``i`` gives ``min(1, wealth[i])`` (nothing if broke) to
+    ``partners[i]``, where both amounts are read from the start-of-step
+    ``wealth``. Conflicts resolve with scatter-add semantics: a trader only
+    ever gives out of its own starting balance, so it cannot be overdrawn,
+    and a partner chosen by several traders receives the sum of their
+    transfers. Total wealth is conserved exactly up to float rounding.
+    """
+    transfers = np.clip(wealth, 0.0, 1.0)
+    received = np.bincount(partners, weights=transfers, minlength=len(wealth))
+    return wealth - transfers + received
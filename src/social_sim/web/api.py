@@ -2,23 +2,51 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query, Request
+from pydantic import BaseModel
 
 from social_sim.game.schemas import (
     CreateGameRequest,
     GameResponse,
     PolicySet,
+    PopulationResponse,
     TurnRequest,
     TurnResponse,
 )
 from social_sim.game.store import create_game, delete_game, get_game
+from social_sim.models.sweep import SweepManager, SweepPoint, SweepSpec, SweepStatus
 
 router = APIRouter()
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Give the app a sweep manager and stop its worker pool on shutdown."""
+    app.state.sweeps = SweepManager()
+    try:
+        yield
+    finally:
+        app.state.sweeps.shutdown()
+
+
+def get_sweeps(request: Request) -> SweepManager:
+    return request.app.state.sweeps
+
+
+class SweepPage(BaseModel):
+    sweep_id: str
+    total: int
+    completed: int
+    offset: int
+    results: list[SweepPoint]
+
+
 @router.post("/games", response_model=TurnResponse)
 async def create_new_game(req: CreateGameRequest) -> TurnResponse:
-    engine = create_game(seed=req.seed, difficulty=req.difficulty)
+    engine = create_game(seed=req.seed, difficulty=req.difficulty, backend=req.backend)
     # Run initial turn with default policies so there's data to show
     return engine.advance_turn(engine.policies)
 
@@ -44,6 +72,23 @@ async def get_game_state(game_id: str) -> GameResponse:
     )
 
 
+@router.get("/games/{game_id}/population", response_model=PopulationResponse)
+async def get_population(
+    game_id: str,
+    top: int = Query(default=10, ge=0, le=1000),
+    min_wealth: float | None = None,
+    max_wealth: float | None = None,
+    agent_id: int | None = None,
+) -> PopulationResponse:
+    engine = get_game(game_id)
+    if not engine:
+        raise HTTPException(status_code=404, detail="Game not found")
+    try:
+        return engine.population(top, min_wealth, max_wealth, agent_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Agent not found")
+
+
 @router.post("/games/{game_id}/turn", response_model=TurnResponse)
 async def advance_turn(game_id: str, req: TurnRequest) -> TurnResponse:
     engine = get_game(game_id)
@@ -60,3 +105,64 @@ async def abandon_game(game_id: str) -> dict:
     if not delete_game(game_id):
         raise HTTPException(status_code=404, detail="Game not found")
     return {"status": "deleted"}
+
+
+@router.post("/sweeps", response_model=SweepStatus, status_code=202)
+async def submit_sweep(
+    spec: SweepSpec, sweeps: SweepManager = Depends(get_sweeps)
+) -> SweepStatus:
+    try:
+        job = sweeps.submit(spec)
+    except ValueError as error:
+        raise HTTPException(status_code=422, detail=str(error))
+    return job.status()
+
+
+@router.get("/sweeps", response_model=list[SweepStatus])
+async def list_sweeps(sweeps: SweepManager = Depends(get_sweeps)) -> list[SweepStatus]:
+    return [job.status() for job in sweeps.jobs()]
+
+
+@router.get("/sweeps/{sweep_id}", response_model=SweepStatus)
+async def get_sweep(sweep_id: str, sweeps: SweepManager = Depends(get_sweeps)) -> SweepStatus:
+    job = sweeps.get(sweep_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Sweep not found")
+    return job.status()
+
+
+@router.get("/sweeps/{sweep_id}/results", response_model=SweepPage)
+async def get_sweep_results(
+    sweep_id: str,
+    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=1000),
+    sweeps: SweepManager = Depends(get_sweeps),
+) -> SweepPage:
+    job = sweeps.get(sweep_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Sweep not found")
+    status = job.status()
+    return SweepPage(
+        sweep_id=sweep_id,
+        total=status.total,
+        completed=status.completed,
+        offset=offset,
+        results=job.page(offset, limit),
+    )
+
+
+@router.post("/sweeps/{sweep_id}/cancel", response_model=SweepStatus)
+async def cancel_sweep(
+    sweep_id: str, sweeps: SweepManager = Depends(get_sweeps)
+) -> SweepStatus:
+    job = sweeps.cancel(sweep_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Sweep not found")
+    return job.status()
+
+
+@router.delete("/sweeps/{sweep_id}")
+async def delete_sweep(sweep_id: str, sweeps: SweepManager = Depends(get_sweeps)) -> dict:
+    if not sweeps.remove(sweep_id):
+        raise HTTPException(status_code=404, detail="Sweep not found")
+    return {"status": "deleted"}
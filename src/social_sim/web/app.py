@@ -8,9 +8,13 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from starlette.concurrency import run_in_threadpool
 
+from social_sim.analysis.bands import EnsembleBands
+from social_sim.core.model import CollectionPolicy
+from social_sim.core.stopping import StoppingCriteria
 from social_sim.models.basic_economy import (
-    BasicEconomyModel,
+    Backend,
     DisasterParams,
     EducationParams,
     EconomyParams,
@@ -18,9 +22,12 @@ from social_sim.models.basic_economy import (
     TaxBracket,
     TaxParams,
 )
-from social_sim.web.api import router as api_router
+from social_sim.models.ensemble import EnsembleRunner
+from social_sim.models.factory import EconomyModel, create_economy_model
+from social_sim.models.tax import TaxMode
+from social_sim.web.api import lifespan, router as api_router
 
-app = FastAPI(title="Nation Builder")
+app = FastAPI(title="Nation Builder", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -36,11 +43,20 @@ BASE_DIR = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=BASE_DIR / "static"), name="static")
 templates = Jinja2Templates(directory=BASE_DIR / "templates")
 
-current_model: BasicEconomyModel | None = None
+current_model: EconomyModel | None = None
 current_params: EconomyParams = EconomyParams()
 
 
-def create_wealth_distribution_chart(model: BasicEconomyModel) -> str:
+def _close_current_model() -> None:
+    """Release the current model's workers and shared memory, if it holds any."""
+    global current_model
+    close = getattr(current_model, "close", None)
+    if close is not None:
+        close()
+    current_model = None
+
+
+def create_wealth_distribution_chart(model: EconomyModel) -> str:
     """Create a Plotly chart showing wealth distribution over time."""
     data = model.get_model_data()
     if not data:
@@ -48,6 +64,7 @@ def create_wealth_distribution_chart(model: BasicEconomyModel) -> str:
 
     fig = go.Figure()
     fig.add_trace(go.Scatter(
+        x=model.get_collected_steps(),
         y=data.get("Gini", []),
         mode="lines",
         name="Gini Coefficient",
@@ -66,7 +83,70 @@ def create_wealth_distribution_chart(model: BasicEconomyModel) -> str:
     return fig.to_json()
 
 
-def create_metrics_chart(model: BasicEconomyModel) -> str:
+def _add_band_traces(
+    fig: go.Figure,
+    bands: EnsembleBands,
+    reporter: str,
+    name: str,
+    rgb: tuple[int, int, int],
+    scale: float = 1.0,
+) -> None:
+    """Add the 5–95% and 25–75% bands and the mean line of one reporter."""
+    summary = bands.summary(reporter)
+    steps = summary["step"].tolist()
+    color = "rgb({}, {}, {})".format(*rgb)
+    for low, high, alpha in (("q5", "q95", 0.15), ("q25", "q75", 0.3)):
+        fig.add_trace(go.Scatter(
+            x=steps + steps[::-1],
+            y=(summary[high] * scale).tolist() + (summary[low] * scale)[::-1].tolist(),
+            fill="toself",
+            fillcolor="rgba({}, {}, {}, {})".format(*rgb, alpha),
+            line={"width": 0},
+            hoverinfo="skip",
+            name=f"{name} {low[1:]}–{high[1:]}%",
+        ))
+    fig.add_trace(go.Scatter(
+        x=steps,
+        y=(summary["mean"] * scale).tolist(),
+        mode="lines",
+        name=f"{name} (mean of {bands.runs})",
+        line={"color": color},
+    ))
+
+
+def create_gini_band_chart(bands: EnsembleBands) -> str:
+    """Create the Gini chart from an ensemble's bands instead of one run."""
+    fig = go.Figure()
+    _add_band_traces(fig, bands, "Gini", "Gini Coefficient", (231, 76, 60))
+    fig.update_layout(
+        title="Wealth Inequality (Gini Coefficient)",
+        xaxis_title="Step",
+        yaxis_title="Gini",
+        yaxis_range=[0, 1],
+        template="plotly_white",
+        height=300,
+        margin={"l": 50, "r": 20, "t": 50, "b": 50},
+    )
+    return fig.to_json()
+
+
+def create_metrics_band_chart(bands: EnsembleBands) -> str:
+    """Create the wealth and happiness chart from an ensemble's bands."""
+    fig = go.Figure()
+    _add_band_traces(fig, bands, "Mean Wealth", "Mean Wealth", (52, 152, 219))
+    _add_band_traces(fig, bands, "Mean Happiness", "Mean Happiness (×20)", (46, 204, 113), 20)
+    fig.update_layout(
+        title="Economic Metrics",
+        xaxis_title="Step",
+        yaxis_title="Value",
+        template="plotly_white",
+        height=300,
+        margin={"l": 50, "r": 20, "t": 50, "b": 50},
+    )
+    return fig.to_json()
+
+
+def create_metrics_chart(model: EconomyModel) -> str:
     """Create a Plotly chart showing mean wealth and happiness."""
     data = model.get_model_data()
     if not data:
@@ -74,13 +154,15 @@ def create_metrics_chart(model: BasicEconomyModel) -> str:
 
     fig = go.Figure()
     fig.add_trace(go.Scatter(
+        x=model.get_collected_steps(),
         y=data.get("Mean Wealth", []),
         mode="lines",
         name="Mean Wealth",
         line={"color": "#3498db"},
     ))
     fig.add_trace(go.Scatter(
-        y=[h * 20 for h in data.get("Mean Happiness", [])],
+        x=model.get_collected_steps(),
+        y=data["Mean Happiness"] * 20,
         mode="lines",
         name="Mean Happiness (×20)",
         line={"color": "#2ecc71"},
@@ -97,9 +179,9 @@ def create_metrics_chart(model: BasicEconomyModel) -> str:
     return fig.to_json()
 
 
-def create_final_distribution_chart(model: BasicEconomyModel) -> str:
+def create_final_distribution_chart(model: EconomyModel) -> str:
     """Create a histogram of final wealth distribution."""
-    wealth_values = [a.wealth for a in model.agents]
+    wealth_values = model.get_wealth().tolist()
 
     fig = go.Figure()
     fig.add_trace(go.Histogram(
@@ -119,7 +201,7 @@ def create_final_distribution_chart(model: BasicEconomyModel) -> str:
     return fig.to_json()
 
 
-def create_tax_chart(model: BasicEconomyModel) -> str:
+def create_tax_chart(model: EconomyModel) -> str:
     """Create a chart showing tax revenue and UBI amount over time."""
     data = model.get_model_data()
     if not data:
@@ -127,12 +209,14 @@ def create_tax_chart(model: BasicEconomyModel) -> str:
 
     fig = go.Figure()
     fig.add_trace(go.Scatter(
+        x=model.get_collected_steps(),
         y=data.get("Tax Revenue", []),
         mode="lines",
         name="Tax Revenue",
         line={"color": "#e67e22"},
     ))
     fig.add_trace(go.Scatter(
+        x=model.get_collected_steps(),
         y=data.get("UBI Amount", []),
         mode="lines",
         name="UBI per Person",
@@ -150,26 +234,15 @@ def create_tax_chart(model: BasicEconomyModel) -> str:
     return fig.to_json()
 
 
-def create_lorenz_chart(model: BasicEconomyModel) -> str:
+def create_lorenz_chart(model: EconomyModel) -> str:
     """Create a Lorenz curve showing wealth inequality."""
-    import numpy as np
-
-    wealth_values = sorted(a.wealth for a in model.agents)
-    n = len(wealth_values)
-    if n == 0:
+    distribution = model.wealth_index
+    if distribution.n == 0:
         return "{}"
 
-    total_wealth = sum(wealth_values)
-    if total_wealth == 0:
-        cumulative_wealth = [0.0] * n
-    else:
-        cumulative_wealth = list(np.cumsum(wealth_values) / total_wealth)
-
-    population_pct = [(i + 1) / n * 100 for i in range(n)]
-    wealth_pct = [w * 100 for w in cumulative_wealth]
-
-    population_pct = [0] + population_pct
-    wealth_pct = [0] + wealth_pct
+    population_share, wealth_share = distribution.lorenz()
+    population_pct = population_share * 100
+    wealth_pct = wealth_share * 100
 
     fig = go.Figure()
 
@@ -223,7 +296,11 @@ async def run_simulation(
     num_agents: int = Form(100),
     initial_wealth: float = Form(10.0),
     steps: int = Form(100),
+    sample_every: int = Form(1),
     seed: int = Form(None),
+    backend: Backend = Form("agent"),
+    stop_on_convergence: str | None = Form(None),
+    ensemble_members: int = Form(1),
     enable_income: str | None = Form(None),
     base_income: float = Form(1.0),
     enable_tax: str | None = Form(None),
@@ -231,6 +308,7 @@ async def run_simulation(
     tax_rate_2: float = Form(0.1),
     tax_rate_3: float = Form(0.2),
     tax_rate_4: float = Form(0.3),
+    tax_mode: TaxMode = Form("flat"),
     enable_ubi: str | None = Form(None),
     enable_disaster: str | None = Form(None),
     disaster_probability: float = Form(1.0),
@@ -255,6 +333,7 @@ async def run_simulation(
 
     tax_params = TaxParams(
         enabled=tax_enabled,
+        mode=tax_mode,
         brackets=[
             TaxBracket(threshold=0, rate=tax_rate_1 / 100),
             TaxBracket(threshold=10, rate=tax_rate_2 / 100),
@@ -280,34 +359,54 @@ async def run_simulation(
         num_agents=num_agents,
         initial_wealth=initial_wealth,
         seed=seed if seed else None,
+        backend=backend,
         income=income_params,
         tax=tax_params,
         disaster=disaster_params,
         education=education_params,
     )
 
-    current_model = BasicEconomyModel(current_params)
-    current_model.run(steps=steps)
+    _close_current_model()
+    current_model = create_economy_model(current_params)
+    current_model.collection = CollectionPolicy(mode="every", interval=max(1, sample_every))
+    stopping = StoppingCriteria() if stop_on_convergence == "true" else None
+    # Runs are blocking; keep them off the event loop so the API stays responsive.
+    summary = await run_in_threadpool(current_model.run, steps=steps, stopping=stopping)
+
+    members = min(max(ensemble_members, 1), 64)
+    bands = None
+    if members > 1:
+        runner = EnsembleRunner(
+            current_params,
+            members,
+            steps,
+            stopping=stopping,
+            sample_every=sample_every,
+        )
+        bands = await run_in_threadpool(runner.run)
 
     data = current_model.get_model_data()
     disaster_count = sum(1 for d in data.get("Disaster Damage", []) if d > 0) if disaster_enabled else 0
     total_disaster_damage = sum(data.get("Disaster Damage", [])) if disaster_enabled else 0
     final_stats = {
-        "steps": steps,
-        "final_gini": f"{data['Gini'][-1]:.3f}" if data.get("Gini") else "N/A",
-        "mean_wealth": f"{data['Mean Wealth'][-1]:.2f}" if data.get("Mean Wealth") else "N/A",
-        "mean_happiness": f"{data['Mean Happiness'][-1]:.3f}" if data.get("Mean Happiness") else "N/A",
-        "total_income": f"{data['Total Income'][-1]:.2f}" if data.get("Total Income") and income_enabled else None,
+        "steps": summary.steps_run,
+        "stop_reason": summary.reason.replace("_", " "),
+        "stop_step": summary.step,
+        "ensemble_members": members,
+        "final_gini": f"{data['Gini'][-1]:.3f}" if len(data.get("Gini", ())) else "N/A",
+        "mean_wealth": f"{data['Mean Wealth'][-1]:.2f}" if len(data.get("Mean Wealth", ())) else "N/A",
+        "mean_happiness": f"{data['Mean Happiness'][-1]:.3f}" if len(data.get("Mean Happiness", ())) else "N/A",
+        "total_income": f"{data['Total Income'][-1]:.2f}" if len(data.get("Total Income", ())) and income_enabled else None,
         "income_enabled": income_enabled,
-        "tax_revenue": f"{data['Tax Revenue'][-1]:.2f}" if data.get("Tax Revenue") and tax_enabled else None,
-        "ubi_amount": f"{data['UBI Amount'][-1]:.2f}" if data.get("UBI Amount") and ubi_enabled else None,
+        "tax_revenue": f"{data['Tax Revenue'][-1]:.2f}" if len(data.get("Tax Revenue", ())) and tax_enabled else None,
+        "ubi_amount": f"{data['UBI Amount'][-1]:.2f}" if len(data.get("UBI Amount", ())) and ubi_enabled else None,
         "tax_enabled": tax_enabled,
         "ubi_enabled": ubi_enabled,
         "disaster_enabled": disaster_enabled,
         "disaster_count": disaster_count,
         "total_disaster_damage": f"{total_disaster_damage:.2f}" if disaster_enabled else None,
         "education_enabled": education_enabled,
-        "mean_productivity": f"{data['Mean Productivity'][-1]:.2f}" if data.get("Mean Productivity") else None,
+        "mean_productivity": f"{data['Mean Productivity'][-1]:.2f}" if len(data.get("Mean Productivity", ())) else None,
     }
 
     return templates.TemplateResponse(
@@ -315,8 +414,14 @@ async def run_simulation(
         {
             "request": request,
             "stats": final_stats,
-            "gini_chart": create_wealth_distribution_chart(current_model),
-            "metrics_chart": create_metrics_chart(current_model),
+            "gini_chart": (
+                create_gini_band_chart(bands) if bands is not None
+                else create_wealth_distribution_chart(current_model)
+            ),
+            "metrics_chart": (
+                create_metrics_band_chart(bands) if bands is not None
+                else create_metrics_chart(current_model)
+            ),
             "distribution_chart": create_final_distribution_chart(current_model),
             "tax_chart": create_tax_chart(current_model) if tax_enabled else None,
             "lorenz_chart": create_lorenz_chart(current_model),
@@ -327,8 +432,8 @@ async def run_simulation(
 @app.post("/reset", response_class=HTMLResponse)
 async def reset_simulation(request: Request):
     """Reset the simulation."""
-    global current_model, current_params
-    current_model = None
+    global current_params
+    _close_current_model()
     current_params = EconomyParams()
 
     return templates.TemplateResponse(
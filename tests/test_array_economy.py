@@ -0,0 +1,119 @@
+"""Tests for the NumPy array backend."""
+
+import numpy as np
+
+from social_sim.game.engine import GameEngine
+from social_sim.game.schemas import PolicySet
+from social_sim.models.array_economy import ArrayEconomyModel
+from social_sim.models.basic_economy import (
+    BasicEconomyModel,
+    DisasterParams,
+    EconomyParams,
+    EducationParams,
+    IncomeParams,
+    TaxBracket,
+    TaxParams,
+)
+from social_sim.models.factory import create_economy_model
+
+
+def _copy_state(source: BasicEconomyModel, target: ArrayEconomyModel) -> None:
+    target.wealth[:] = source.get_wealth()
+    target.productivity[:] = source.get_productivity()
+
+
+class TestBackendSelection:
+    def test_factory_picks_backend(self):
+        assert isinstance(create_economy_model(EconomyParams(num_agents=5)), BasicEconomyModel)
+        model = create_economy_model(EconomyParams(num_agents=5, backend="array"))
+        assert isinstance(model, ArrayEconomyModel)
+        assert model.population == 5
+
+    def test_same_reporter_columns(self):
+        agent_model = BasicEconomyModel(EconomyParams(num_agents=10, seed=42))
+        array_model = ArrayEconomyModel(EconomyParams(num_agents=10, seed=42))
+        agent_model.run(steps=3)
+        array_model.run(steps=3)
+
+        assert agent_model.get_model_data().keys() == array_model.get_model_data().keys()
+        assert agent_model.get_agent_data().keys() == array_model.get_agent_data().keys()
+        assert len(array_model.get_agent_data()["Wealth"]) == 30
+
+    def test_seed_reproducibility(self):
+        m1 = ArrayEconomyModel(EconomyParams(num_agents=50, seed=7))
+        m2 = ArrayEconomyModel(EconomyParams(num_agents=50, seed=7))
+        m1.run(steps=20)
+        m2.run(steps=20)
+        assert np.array_equal(m1.wealth, m2.wealth)
+
+
+class TestArrayPhases:
+    def test_trade_conserves_wealth(self):
+        model = ArrayEconomyModel(EconomyParams(num_agents=100, seed=42))
+        model.run(steps=50)
+        assert abs(model.wealth.sum() - 1000.0) < 1e-6
+        assert model.wealth.min() >= 0
+
+    def test_gini_increases(self):
+        model = ArrayEconomyModel(EconomyParams(num_agents=50, seed=42))
+        model.run(steps=100)
+        data = model.get_model_data()
+        assert data["Gini"][-1] > data["Gini"][0]
+
+    def test_tax_matches_agent_backend(self):
+        tax_params = TaxParams(
+            enabled=True,
+            brackets=[
+                TaxBracket(threshold=0, rate=0.0),
+                TaxBracket(threshold=10, rate=0.1),
+                TaxBracket(threshold=50, rate=0.3),
+            ],
+        )
+        params = EconomyParams(num_agents=4, seed=42, tax=tax_params)
+        agent_model = BasicEconomyModel(params)
+        array_model = ArrayEconomyModel(params)
+        for agent, wealth in zip(agent_model.agents, [5.0, 20.0, 60.0, 0.0]):
+            agent.wealth = wealth
+        _copy_state(agent_model, array_model)
+
+        agent_model._collect_taxes()
+        array_model._collect_taxes()
+
+        assert np.allclose(agent_model.get_wealth(), array_model.wealth)
+        assert abs(agent_model.tax_revenue - array_model.tax_revenue) < 1e-9
+
+    def test_income_and_education_match_agent_backend(self):
+        params = EconomyParams(
+            num_agents=10,
+            seed=42,
+            income=IncomeParams(enabled=True, base_income=2.0),
+            education=EducationParams(enabled=True, investment_rate=0.2),
+        )
+        agent_model = BasicEconomyModel(params)
+        array_model = ArrayEconomyModel(params)
+        _copy_state(agent_model, array_model)
+
+        for model in (agent_model, array_model):
+            model._distribute_income()
+            model._process_education()
+
+        assert np.allclose(agent_model.get_wealth(), array_model.wealth)
+        assert np.allclose(agent_model.get_productivity(), array_model.productivity)
+        assert abs(agent_model.education_investment - array_model.education_investment) < 1e-9
+
+    def test_disaster_reduces_wealth(self):
+        disaster_params = DisasterParams(enabled=True, probability=1.0, damage_rate=0.2)
+        model = ArrayEconomyModel(EconomyParams(num_agents=10, seed=42, disaster=disaster_params))
+        model.step()
+        assert abs(model.disaster_damage - 20.0) < 1e-9
+        assert abs(model.wealth.sum() - 80.0) < 1e-9
+
+
+class TestArrayGame:
+    def test_game_runs_on_array_backend(self):
+        engine = GameEngine(seed=42, backend="array", max_turns=3, steps_per_turn=2)
+        for _ in range(3):
+            result = engine.advance_turn(PolicySet(income_enabled=True))
+        assert result.is_finished
+        assert result.state.population >= 100
+        assert sum(result.state.wealth_distribution) == result.state.population
@@ -1,6 +1,11 @@
 """Basic tests for the simulation."""
 
+import numpy as np
+
 from social_sim.agents.person import PersonAgent
+from social_sim.core.agent import BaseAgent
+from social_sim.core.model import BaseModel, CollectionPolicy
+from social_sim.core.reporters import FusedReporter
 from social_sim.models.basic_economy import (
     BasicEconomyModel,
     DisasterParams,
@@ -10,6 +15,7 @@ from social_sim.models.basic_economy import (
     TaxBracket,
     TaxParams,
 )
+from social_sim.models.scenario import run_scenario
 
 
 class TestPersonAgent:
@@ -30,6 +36,26 @@ class TestPersonAgent:
 
         assert abs(final_total - initial_total) < 0.001
 
+    def test_sample_partner_excludes_self(self):
+        model = BasicEconomyModel(EconomyParams(num_agents=5, seed=42))
+        for agent in model.agents:
+            for _ in range(20):
+                partner = model.sample_partner(agent)
+                assert partner is not None
+                assert partner is not agent
+
+    def test_sample_partner_single_agent(self):
+        model = BasicEconomyModel(EconomyParams(num_agents=1, seed=42))
+        agent = list(model.agents)[0]
+        assert model.sample_partner(agent) is None
+
+    def test_sample_partner_after_removal(self):
+        model = BasicEconomyModel(EconomyParams(num_agents=3, seed=42))
+        first, second, third = list(model.agents)
+        first.remove()
+        for _ in range(20):
+            assert model.sample_partner(second) is third
+
 
 class TestBasicEconomyModel:
     def test_model_creation(self):
@@ -44,6 +70,15 @@ class TestBasicEconomyModel:
         assert len(data["Gini"]) == 10
         assert len(data["Mean Wealth"]) == 10
 
+    def test_seed_reproducibility(self):
+        m1 = BasicEconomyModel(EconomyParams(num_agents=20, seed=42))
+        m2 = BasicEconomyModel(EconomyParams(num_agents=20, seed=42))
+        m1.run(steps=10)
+        m2.run(steps=10)
+        d1, d2 = m1.get_model_data(), m2.get_model_data()
+        assert d1.keys() == d2.keys()
+        assert all(np.array_equal(d1[k], d2[k]) for k in d1)
+
     def test_gini_increases(self):
         model = BasicEconomyModel(EconomyParams(num_agents=50, seed=42))
         model.run(steps=100)
@@ -290,3 +325,209 @@ class TestEducationInvestment:
         final_productivities = [a.productivity for a in model.agents]
 
         assert sum(final_productivities) > sum(initial_productivities)
+
+
+class TestAggregateTracking:
+    def _full_params(self):
+        return EconomyParams(
+            num_agents=30,
+            seed=42,
+            income=IncomeParams(enabled=True),
+            tax=TaxParams(enabled=True, ubi_enabled=True),
+            education=EducationParams(enabled=True),
+        )
+
+    def test_running_sums_match_exact(self):
+        model = BasicEconomyModel(self._full_params())
+        model.run(steps=25)
+
+        agents = list(model.agents)
+        assert model.aggregates.count == len(agents)
+        assert abs(model.aggregates.total("wealth") - sum(a.wealth for a in agents)) < 1e-9
+        assert abs(model.aggregates.mean("happiness") - sum(a.happiness for a in agents) / 30) < 1e-9
+        assert abs(model.aggregates.mean("productivity") - sum(a.productivity for a in agents) / 30) < 1e-9
+
+    def test_direct_assignment_is_tracked(self):
+        model = BasicEconomyModel(EconomyParams(num_agents=2, seed=42))
+        agent = list(model.agents)[0]
+        agent.wealth = 100.0
+        assert model.aggregates.total("wealth") == 110.0
+
+    def test_removal_is_tracked(self):
+        model = BasicEconomyModel(EconomyParams(num_agents=3, seed=42))
+        agent = list(model.agents)[0]
+        agent.remove()
+        agent.remove()
+        assert model.aggregates.count == 2
+        assert model.aggregates.total("wealth") == 20.0
+
+    def test_periodic_resync(self):
+        model = BasicEconomyModel(EconomyParams(num_agents=5, seed=42))
+        model.aggregates.resync_interval = 2
+        model.aggregates.sums["wealth"] += 1.0
+        model.run(steps=2)
+        assert abs(model.aggregates.total("wealth") - 50.0) < 1e-9
+
+
+class TestFusedReporters:
+    def test_reporter_names_kept(self):
+        model = BasicEconomyModel(EconomyParams(num_agents=10, seed=42))
+        model.run(steps=2)
+        data = model.get_model_data()
+        for name in (
+            "Total Wealth", "Mean Wealth", "Gini", "Mean Happiness", "Mean Productivity",
+            "Tax Revenue", "UBI Amount", "Total Income", "Disaster Damage",
+        ):
+            assert len(data[name]) == 2
+        assert abs(data["Total Wealth"][-1] - 100.0) < 1e-9
+        assert abs(data["Mean Wealth"][-1] - 10.0) < 1e-9
+
+    def test_computed_once_per_collect(self):
+        calls = []
+
+        def compute(model):
+            calls.append(model.step_count)
+            return {"A": 1.0, "B": 2.0}
+
+        model = BaseModel()
+        model.setup_datacollector(fused_reporters=[FusedReporter(["A", "B"], compute)])
+        model.run(steps=3)
+
+        assert calls == [1, 2, 3]
+        data = model.get_model_data()
+        assert data["A"].tolist() == [1.0, 1.0, 1.0]
+        assert data["B"].tolist() == [2.0, 2.0, 2.0]
+
+
+class TestCollectionPolicy:
+    def test_sparse_sampling_keeps_last_step(self):
+        model = BasicEconomyModel(EconomyParams(num_agents=10, seed=42))
+        model.collection = CollectionPolicy(mode="every", interval=4)
+        model.run(steps=10)
+        assert model.get_collected_steps().tolist() == [4, 8, 10]
+        assert len(model.get_model_data()["Gini"]) == 3
+
+    def test_end_only(self):
+        model = BasicEconomyModel(EconomyParams(num_agents=10, seed=42))
+        model.collection = CollectionPolicy(mode="end")
+        model.run(steps=10)
+        assert model.get_collected_steps().tolist() == [10]
+
+    def test_model_reporters_only(self):
+        model = BasicEconomyModel(EconomyParams(num_agents=10, seed=42))
+        model.collection = CollectionPolicy(mode="end", agents=False)
+        model.run(steps=5)
+        assert len(model.get_model_data()["Gini"]) == 1
+        assert model.get_agent_matrix("Wealth").shape == (1, 0)
+
+    def test_scenario_keeps_final_values(self):
+        params = EconomyParams(num_agents=10, seed=42, income=IncomeParams(enabled=True))
+        model = BasicEconomyModel(params)
+        model.run(steps=5)
+        final = {name: values[-1] for name, values in model.get_model_data().items()}
+        assert run_scenario(params, 5).metrics == final
+
+    def test_manual(self):
+        model = BasicEconomyModel(EconomyParams(num_agents=10, seed=42))
+        model.collection = CollectionPolicy(mode="manual")
+        model.run(steps=5)
+        assert len(model.get_collected_steps()) == 0
+        model.collect()
+        assert model.get_collected_steps().tolist() == [5]
+
+
+class TestTypeIndex:
+    def test_counts_and_iteration(self):
+        model = BasicEconomyModel(EconomyParams(num_agents=5, seed=42))
+        assert model.count_agents(PersonAgent) == 5
+        assert model.count_agents() == 5
+        assert all(isinstance(a, PersonAgent) for a in model.agents_of_type(PersonAgent))
+
+    def test_other_types_are_separate(self):
+        model = BasicEconomyModel(EconomyParams(num_agents=5, seed=42))
+        firm = BaseAgent(model, wealth=100.0)
+        assert model.count_agents(PersonAgent) == 5
+        assert model.count_agents(BaseAgent) == 6
+        assert firm not in model.agents_of_type(PersonAgent)
+        assert len(model.get_wealth()) == 5
+
+    def test_mixed_population_is_collected(self):
+        model = BasicEconomyModel(EconomyParams(num_agents=5, seed=42))
+        BaseAgent(model, wealth=100.0)
+        model.run(steps=3)
+        wealth = model.get_agent_matrix("Wealth")[-1]
+        happiness = model.get_agent_matrix("Happiness")[-1]
+        assert wealth[5] == 100.0 and np.isnan(happiness[5])
+        assert not np.isnan(happiness[:5]).any()
+
+    def test_removal_updates_index(self):
+        model = BasicEconomyModel(EconomyParams(num_agents=4, seed=42))
+        agent = model.agents_of_type(PersonAgent)[0]
+        agent.remove()
+        assert model.count_agents(PersonAgent) == 3
+        assert agent not in model.agents_of_type(PersonAgent)
+
+    def test_sample_partner_by_type(self):
+        model = BasicEconomyModel(EconomyParams(num_agents=3, seed=42))
+        firm = BaseAgent(model)
+        person = model.agents_of_type(PersonAgent)[0]
+        for _ in range(20):
+            partner = model.sample_partner(person, PersonAgent)
+            assert isinstance(partner, PersonAgent) and partner is not person
+        assert isinstance(model.sample_partner(firm, PersonAgent), PersonAgent)
+
+
+class TestBulkSpawn:
+    def test_spawned_agents_are_registered(self):
+        model = BaseModel()
+        people = model.spawn_agents(PersonAgent, 3, wealth=[1.0, 2.0, 3.0])
+        assert [p.unique_id for p in people] == [1, 2, 3]
+        assert len(model.agents) == 3
+        assert len(model.agents_by_type[PersonAgent]) == 3
+        assert model.count_agents(BaseAgent) == 3
+        assert [p.happiness for p in people] == [0.5, 0.5, 0.5]
+        assert not people[0].has_connections
+
+    def test_spawn_matches_constructor(self):
+        model = BaseModel()
+        single = PersonAgent(model, wealth=4.0, productivity=1.2)
+        spawned = model.spawn_agents(PersonAgent, 1, wealth=[4.0], productivity=[1.2])[0]
+        assert spawned.unique_id == single.unique_id + 1
+        assert not hasattr(spawned, "__dict__") or not vars(spawned)
+        assert (spawned.wealth, spawned.productivity) == (single.wealth, single.productivity)
+        assert model.aggregates.total("wealth") == 8.0
+        assert model.aggregates.count == 2
+
+    def test_spawned_agents_step_and_remove(self):
+        model = BasicEconomyModel(EconomyParams(num_agents=10, seed=42))
+        model.add_citizens(np.full(5, 2.0), np.ones(5))
+        model.run(steps=5)
+        assert abs(model.aggregates.total("wealth") - 110.0) < 1e-9
+        model.agents_of_type(PersonAgent)[-1].remove()
+        assert model.count_agents(PersonAgent) == 14
+
+    def test_column_length_is_checked(self):
+        model = BaseModel()
+        try:
+            model.spawn_agents(PersonAgent, 2, wealth=[1.0])
+            assert False, "Should have raised"
+        except ValueError:
+            pass
+        assert len(model.agents) == 0
+
+
+class TestAgentMemory:
+    def test_connections_are_lazy(self):
+        model = BaseModel()
+        agent = BaseAgent(model)
+        assert agent._connections is None and not agent.has_connections
+        agent.connections.add(3)
+        assert agent.has_connections
+
+    def test_memory_report(self):
+        model = BasicEconomyModel(EconomyParams(num_agents=500, seed=1))
+        report = model.memory_report()
+        assert report["agents"] == 500
+        assert report["objects"] > 0
+        assert abs(report["per_agent"] - report["objects"] - report["registry"]) < 1e-6
+        assert abs(report["total"] - 500 * report["per_agent"]) < 1e-6
@@ -0,0 +1,79 @@
+"""Tests for the SQLite experiment catalog."""
+
+from social_sim.models.basic_economy import EconomyParams, TaxParams
+from social_sim.models.catalog import ExperimentCatalog, canonical_params, source_digest
+
+
+def small(**kwargs):
+    return EconomyParams(num_agents=20, seed=1, backend="array", **kwargs)
+
+
+class TestCanonicalParams:
+    def test_ignores_seed_and_workers(self):
+        assert canonical_params(small()) == canonical_params(small(workers=4).model_copy(
+            update={"seed": 9}
+        ))
+        assert canonical_params(small()) != canonical_params(small(initial_wealth=11.0))
+
+
+class TestExperimentCatalog:
+    def test_reuses_identical_runs(self):
+        catalog = ExperimentCatalog()
+        first, cached = catalog.run(small(), 5)
+        assert not cached
+        again, cached = catalog.run(small(workers=3), 5)
+        assert cached
+        assert again.metrics == first.metrics
+        assert again.summary == first.summary
+        assert not catalog.run(small(), 6)[1]
+        assert not catalog.run(small().model_copy(update={"seed": 2}), 5)[1]
+        assert len(catalog) == 3
+
+    def test_code_version_and_unseeded_runs(self, tmp_path):
+        path = tmp_path / "runs.sqlite"
+        with ExperimentCatalog(path, code_version="a") as catalog:
+            catalog.run(small(), 5)
+            catalog.run(small().model_copy(update={"seed": None}), 5)
+            assert not catalog.run(small().model_copy(update={"seed": None}), 5)[1]
+        with ExperimentCatalog(path, code_version="a") as catalog:
+            assert catalog.run(small(), 5)[1]
+            assert len(catalog) == 3
+        with ExperimentCatalog(path, code_version="b") as catalog:
+            assert not catalog.run(small(), 5)[1]
+
+    def test_default_code_version_tracks_source(self, tmp_path):
+        package = tmp_path / "pkg"
+        package.mkdir()
+        (package / "model.py").write_text("RATE = 0.1\n")
+        before = source_digest(package)
+        (package / "model.py").write_text("RATE = 0.2\n")
+        source_digest.cache_clear()
+        assert source_digest(package) != before
+
+        path = tmp_path / "runs.sqlite"
+        with ExperimentCatalog(path) as catalog:
+            assert catalog.code_version == source_digest()
+            catalog.run(small(), 5)
+            assert catalog.run(small(), 5)[1]
+        with ExperimentCatalog(path, code_version=before) as catalog:
+            assert not catalog.run(small(), 5)[1]
+
+    def test_query(self):
+        catalog = ExperimentCatalog()
+        for ubi in (False, True):
+            for rate in (0.1, 0.5):
+                tax = TaxParams(enabled=True, ubi_enabled=ubi)
+                tax.brackets[1].rate = rate
+                catalog.run(small(tax=tax), 10)
+        ubi_runs = catalog.query("tax.ubi_enabled = true")
+        assert [run.params.tax.ubi_enabled for run in ubi_runs] == [True, True]
+        gini = max(run.metrics["Gini"] for run in ubi_runs)
+        matched = catalog.query("tax.ubi_enabled = true", ("Gini", "<=", gini))
+        assert matched == ubi_runs
+        assert len(catalog.query("tax.brackets.1.rate > 0.2")) == 2
+        assert catalog.query("Gini < -1") == []
+        try:
+            catalog.query("Gini ~ 1")
+            assert False, "Should have raised"
+        except ValueError:
+            pass
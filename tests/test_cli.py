@@ -0,0 +1,92 @@
+"""Tests for the headless batch runner."""
+
+import io
+import json
+import subprocess
+import sys
+
+from social_sim import cli
+from social_sim.cli import load_scenarios, main
+from social_sim.models.catalog import ExperimentCatalog
+
+SCENARIOS = {
+    "base": {"num_agents": 30, "seed": 3, "backend": "array"},
+    "steps": 6,
+    "scenarios": [{"name": "free"}, {"name": "ubi", "tax": {"enabled": True, "ubi_enabled": True}}],
+}
+
+
+def write_scenarios(tmp_path, data=SCENARIOS):
+    path = tmp_path / "scenarios.json"
+    path.write_text(json.dumps(data))
+    return str(path)
+
+
+def read_records(output):
+    return [json.loads(line) for line in output.splitlines()]
+
+
+class TestLoadScenarios:
+    def test_list_and_object_forms(self):
+        spec = load_scenarios(io.StringIO(json.dumps([{"income": {"enabled": True}}, {}])))
+        assert [params.income.enabled for params in spec.configurations()] == [True, False]
+        spec = load_scenarios(io.StringIO(json.dumps(SCENARIOS)))
+        assert spec.steps == 6
+        assert spec.configurations()[1].tax.ubi_enabled
+
+
+class TestMain:
+    def test_scenario_records(self, tmp_path, capsys):
+        assert main([write_scenarios(tmp_path)]) == 0
+        records = read_records(capsys.readouterr().out)
+        assert [(r["type"], r["index"], r["name"]) for r in records] == [
+            ("scenario", 0, "free"),
+            ("scenario", 1, "ubi"),
+        ]
+        assert records[0]["summary"]["steps_run"] == 6
+        assert 0 <= records[1]["metrics"]["Gini"] <= 1
+
+    def test_per_step_records(self, tmp_path, capsys):
+        assert main([write_scenarios(tmp_path), "--per-step", "--every", "2"]) == 0
+        records = read_records(capsys.readouterr().out)
+        steps = [r["step"] for r in records if r["type"] == "step" and r["index"] == 0]
+        assert steps == [2, 4, 6]
+
+    def test_parallel_jobs(self, tmp_path, capsys):
+        assert main([write_scenarios(tmp_path), "-j", "2"]) == 0
+        records = read_records(capsys.readouterr().out)
+        assert sorted(r["index"] for r in records) == [0, 1]
+
+    def test_catalog_reuses_runs(self, tmp_path, capsys):
+        catalog = str(tmp_path / "runs.sqlite")
+        for cached in (False, True):
+            assert main([write_scenarios(tmp_path), "--catalog", catalog]) == 0
+            records = read_records(capsys.readouterr().out)
+            assert [r["cached"] for r in records] == [cached, cached]
+
+    def test_catalog_closed_when_a_run_fails(self, tmp_path, capsys, monkeypatch):
+        closed = []
+        close = ExperimentCatalog.close
+
+        def tracking_close(catalog):
+            closed.append(catalog.path)
+            close(catalog)
+
+        def failing_run(*args, **kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(ExperimentCatalog, "close", tracking_close)
+        monkeypatch.setattr(cli, "run_scenario", failing_run)
+        catalog = str(tmp_path / "runs.sqlite")
+        assert main([write_scenarios(tmp_path), "--catalog", catalog]) == 1
+        records = read_records(capsys.readouterr().out)
+        assert [r["error"] for r in records] == ["RuntimeError: boom"] * 2
+        assert closed == [catalog, catalog]
+
+    def test_invalid_file(self, tmp_path, capsys):
+        assert main([write_scenarios(tmp_path, [{"tax": {"nope": 1}}])]) == 2
+        assert "unknown parameter" in capsys.readouterr().err
+
+    def test_does_not_import_web_stack(self):
+        code = "import sys, social_sim.cli; sys.exit('fastapi' in sys.modules)"
+        assert subprocess.run([sys.executable, "-c", code]).returncode == 0
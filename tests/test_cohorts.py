@@ -0,0 +1,75 @@
+"""Tests for cohort-aggregated reporters."""
+
+import numpy as np
+
+from social_sim.core.cohorts import CohortReporter, grouped_stats
+from social_sim.models.array_economy import ArrayEconomyModel
+from social_sim.models.basic_economy import BasicEconomyModel, EconomyParams
+from social_sim.models.distributions import Distribution
+
+
+def _params(**kwargs) -> EconomyParams:
+    return EconomyParams(
+        num_agents=200,
+        seed=4,
+        wealth_distribution=Distribution(kind="lognormal", mu=2.0, sigma=1.0),
+        **kwargs,
+    )
+
+
+class TestGroupedStats:
+    def test_matches_numpy_per_group(self):
+        rng = np.random.default_rng(0)
+        labels = rng.integers(0, 4, size=500)
+        labels[labels == 2] = 1  # leave group 2 empty
+        values = rng.random(500)
+        stats = grouped_stats(labels, values, 4, quantiles=(0.1, 0.5, 1.0))
+        for group in (0, 1, 3):
+            members = values[labels == group]
+            assert stats["count"][group] == len(members)
+            assert abs(stats["mean"][group] - members.mean()) < 1e-12
+            for q in (0.1, 0.5, 1.0):
+                assert abs(stats[f"q{100 * q:g}"][group] - np.quantile(members, q)) < 1e-12
+        assert stats["count"][2] == 0 and np.isnan(stats["q50"][2])
+
+
+class TestCohortReporter:
+    def test_wealth_deciles_on_both_backends(self):
+        for model_class in (BasicEconomyModel, ArrayEconomyModel):
+            model = model_class(_params())
+            model.run(steps=1)
+            deciles = CohortReporter("decile", quantiles=(0.5,))
+            model.add_cohort_reporter(deciles)
+            model.run(steps=3)
+            counts = deciles.table(model, "wealth", "count")
+            assert counts.shape[1] == 10
+            assert (counts[-1] == 20).all()
+            means = deciles.table(model, "wealth")[-1]
+            assert np.all(np.diff(means) >= 0)
+            wealth = np.sort(model.get_wealth())
+            assert abs(means[0] - wealth[:20].mean()) < 1e-9
+            # Rows collected before the reporter was added hold NaN.
+            assert np.isnan(counts[0]).all()
+
+    def test_productivity_bands_sample_and_custom_key(self):
+        model = ArrayEconomyModel(_params())
+        bands = CohortReporter("band", by="initial_productivity", groups=4, sample=5)
+        parity = CohortReporter(
+            "parity", by=lambda m, values: np.arange(m.population) % 2, groups=2
+        )
+        model.setup_datacollector(cohort_reporters=[bands, parity])
+        initial = model.productivity.copy()
+        model.run(steps=2)
+        assert (bands.table(model, "wealth", "count")[-1] == 50).all()
+        assert bands.sample_table(model, "productivity").shape == (2, 5)
+        lowest_band = initial <= np.quantile(initial, 0.25)
+        assert abs(bands.table(model, "productivity")[0, 0] - initial[lowest_band].mean()) < 1e-9
+        assert (parity.table(model, "wealth", "count")[-1] == 100).all()
+
+    def test_invalid_arguments(self):
+        for kwargs in ({"groups": 0}, {"by": "height"}, {"quantiles": (1.5,)}):
+            try:
+                CohortReporter(**kwargs)
+                assert False, "Should have raised"
+            except ValueError:
+                pass
@@ -0,0 +1,98 @@
+"""Tests for streaming ensemble bands and the ensemble runner."""
+
+import numpy as np
+
+from social_sim.analysis.bands import EnsembleBands, StreamingQuantile
+from social_sim.core.stopping import StoppingCriteria
+from social_sim.models.basic_economy import EconomyParams
+from social_sim.models.ensemble import EnsembleRunner
+from social_sim.models.parallel_economy import ParallelEconomyModel
+
+
+class TestEnsembleBands:
+    def test_matches_numpy(self):
+        data = np.random.default_rng(0).normal(size=(5, 4, 2))
+        bands = EnsembleBands(["a", "b"], 3, quantiles=(0.1, 0.5, 0.9))
+        for run in data:
+            bands.add(np.arange(4), run)
+        assert np.allclose(bands.mean("b"), data[:, :, 1].mean(axis=0))
+        assert np.allclose(bands.std("a"), data[:, :, 0].std(axis=0, ddof=1))
+        for q in (0.1, 0.5, 0.9):
+            assert np.allclose(bands.quantile("a", q), np.quantile(data[:, :, 0], q, axis=0))
+
+    def test_runs_of_different_length(self):
+        bands = EnsembleBands(["x"], 4)
+        bands.add(np.array([1, 2, 3]), np.array([[1.0], [2.0], [3.0]]))
+        bands.add(np.array([1, 2]), np.array([[3.0], [np.nan]]))
+        summary = bands.summary("x")
+        assert summary["step"].tolist() == [1, 2, 3]
+        assert summary["runs"].tolist() == [2, 1, 1]
+        assert summary["mean"].tolist() == [2.0, 2.0, 3.0]
+
+    def test_streaming_quantile_converges(self):
+        values = np.random.default_rng(1).uniform(size=(2000, 3))
+        estimator = StreamingQuantile(3, 0.9)
+        for row in values:
+            estimator.update(row, np.ones(3, dtype=bool))
+        assert np.all(np.abs(estimator.estimate() - 0.9) < 0.02)
+
+
+class TestEnsembleRunner:
+    def test_reproducible_and_seeded_per_member(self):
+        params = EconomyParams(num_agents=30, seed=7, backend="array")
+        first = EnsembleRunner(params, 3, 10, workers=1)
+        bands = first.run()
+        again = EnsembleRunner(params, 3, 10, workers=1).run()
+        assert bands.runs == 3
+        assert len(set(first.seeds)) == 3
+        assert np.array_equal(bands.mean("Gini"), again.mean("Gini"))
+        assert np.all(bands.std("Gini") > 0)
+
+    def test_pool_matches_in_process(self):
+        params = EconomyParams(num_agents=30, seed=7, backend="array")
+        serial = EnsembleRunner(params, 3, 10, workers=1).run()
+        pooled = EnsembleRunner(params, 3, 10, workers=2).run()
+        for q in serial.quantiles:
+            assert np.array_equal(serial.quantile("Gini", q), pooled.quantile("Gini", q))
+
+    def test_members_stop_on_their_own(self):
+        runner = EnsembleRunner(
+            EconomyParams(num_agents=30, seed=2, backend="array"),
+            2,
+            500,
+            stopping=StoppingCriteria(max_steps=5),
+            workers=1,
+        )
+        bands = runner.run()
+        assert [member.summary.reason for member in runner.members] == ["step_budget"] * 2
+        assert bands.recorded_steps().tolist() == [1, 2, 3, 4, 5]
+
+    def test_needs_members(self):
+        try:
+            EnsembleRunner(EconomyParams(), seeds=[])
+            assert False, "Should have raised"
+        except ValueError:
+            pass
+
+    def test_failed_member_closes_its_model(self, monkeypatch):
+        closed = []
+        close = ParallelEconomyModel.close
+
+        def tracking_close(model):
+            closed.append(model)
+            close(model)
+
+        monkeypatch.setattr(ParallelEconomyModel, "close", tracking_close)
+        runner = EnsembleRunner(
+            EconomyParams(num_agents=30, seed=2, backend="parallel"),
+            1,
+            5,
+            stopping=StoppingCriteria(metrics=["Nope"]),
+            workers=1,
+        )
+        try:
+            runner.run()
+            assert False, "Should have raised"
+        except ValueError:
+            pass
+        assert len(closed) == 1 and closed[0]._handle.pool is None
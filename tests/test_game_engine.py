@@ -143,3 +143,42 @@ class TestEvents:
                 easy_events += len([e for e in r_easy.events if e.category == "disaster"])
                 hard_events += len([e for e in r_hard.events if e.category == "disaster"])
         assert hard_events > easy_events
+
+
+class TestCollection:
+    def test_collects_at_turn_boundaries(self):
+        engine = GameEngine(seed=42, steps_per_turn=5)
+        engine.advance_turn(PolicySet())
+        engine.advance_turn(PolicySet())
+        assert engine.model.get_collected_steps().tolist() == [5, 10]
+
+    def test_collection_off(self):
+        engine = GameEngine(seed=42, collection="off")
+        engine.advance_turn(PolicySet())
+        assert len(engine.model.get_collected_steps()) == 0
+
+    def test_collection_every_step(self):
+        engine = GameEngine(seed=42, steps_per_turn=3, collection="step")
+        engine.advance_turn(PolicySet())
+        assert engine.model.get_collected_steps().tolist() == [1, 2, 3]
+
+
+class TestPopulation:
+    def test_population_queries(self):
+        engine = GameEngine(seed=42)
+        engine.advance_turn(PolicySet())
+        wealth = sorted(engine.model.get_wealth().tolist(), reverse=True)
+        report = engine.population(top=3, max_wealth=1.0, agent_id=1)
+        assert report.population == len(wealth)
+        assert [agent.wealth for agent in report.richest] == wealth[:3]
+        assert report.agents_in_band == engine._take_snapshot().agents_in_poverty
+        assert report.agent.agent_id == 1
+
+    def test_unknown_agent(self):
+        engine = GameEngine(seed=42)
+        engine.advance_turn(PolicySet())
+        try:
+            engine.population(agent_id=10_000)
+            assert False, "Should have raised"
+        except ValueError:
+            pass
@@ -0,0 +1,126 @@
+"""Tests for the sort-once inequality metrics."""
+
+import numpy as np
+
+from social_sim.analysis.inequality import (
+    INEQUALITY_REPORTERS,
+    WealthDistribution,
+    WealthIndex,
+)
+from social_sim.core.model import BaseModel
+from social_sim.game.engine import GameEngine
+from social_sim.game.schemas import PolicySet
+from social_sim.models.array_economy import ArrayEconomyModel
+from social_sim.models.basic_economy import BasicEconomyModel, EconomyParams
+
+
+class TestWealthDistribution:
+    def test_equal_distribution(self):
+        dist = WealthDistribution([5.0] * 10)
+        assert dist.gini() == 0.0
+        assert abs(dist.theil()) < 1e-12
+        assert abs(dist.atkinson()) < 1e-12
+        assert abs(dist.top_share(0.1) - 0.1) < 1e-12
+        assert abs(dist.palma() - 0.25) < 1e-12
+
+    def test_single_owner(self):
+        dist = WealthDistribution([0.0] * 9 + [10.0])
+        assert abs(dist.gini() - 0.9) < 1e-12
+        assert abs(dist.theil() - np.log(10)) < 1e-12
+        assert dist.atkinson(1.0) == 1.0
+        assert abs(dist.top_share(0.1) - 1.0) < 1e-12
+
+    def test_percentiles_match_numpy(self):
+        wealth = np.random.default_rng(0).lognormal(size=501)
+        dist = WealthDistribution(wealth)
+        assert np.allclose(dist.percentiles([10, 50, 90]), np.percentile(wealth, [10, 50, 90]))
+
+    def test_lorenz_endpoints(self):
+        pop, share = WealthDistribution([1.0, 2.0, 3.0]).lorenz()
+        assert pop[0] == 0.0 and share[0] == 0.0
+        assert pop[-1] == 1.0 and abs(share[-1] - 1.0) < 1e-12
+        assert np.all(np.diff(share) >= 0)
+
+    def test_counts_and_histogram(self):
+        dist = WealthDistribution([0.0, 0.5, 1.0, 3.0, 60.0])
+        assert dist.count_below(1.0) == 2
+        assert dist.count_at_most(0.0) == 1
+        assert dist.histogram([0, 2, 5, 10, 20, 35, 50, float("inf")]) == [3, 1, 0, 0, 0, 0, 1]
+
+    def test_empty(self):
+        dist = WealthDistribution([])
+        assert dist.gini() == 0.0
+        assert dist.theil() == 0.0
+        assert dist.top_share(0.1) == 0.0
+
+
+class TestWealthIndex:
+    def test_queries(self):
+        index = WealthIndex([3.0, np.nan, 1.0, 7.0, 3.0])
+        assert index.n == 4
+        slots, wealth = index.top(2)
+        assert slots.tolist() == [3, 4] and wealth.tolist() == [7.0, 3.0]
+        assert index.top(10)[0].tolist() == [3, 4, 0, 2]
+        assert index.count_between(1.0, 3.0) == 1
+        assert index.count_between(1.0, 3.5) == 3
+        assert index.rank(2) == 0
+        assert index.rank(0) == index.rank(4) == 1
+        assert index.percentile_rank(3) == 75.0
+        assert abs(index.gini() - WealthDistribution([3.0, 1.0, 7.0, 3.0]).gini()) < 1e-12
+
+    def test_empty_slot(self):
+        index = WealthIndex([1.0, np.nan])
+        for slot in (1, 2, -1):
+            try:
+                index.rank(slot)
+                assert False, "Should have raised"
+            except ValueError:
+                pass
+
+    def test_model_rebuilds_lazily(self):
+        model = ArrayEconomyModel(EconomyParams(num_agents=50, seed=3))
+        index = model.wealth_index
+        assert model.wealth_index is index
+        model.step()
+        index = model.wealth_index
+        assert np.array_equal(index.sorted, np.sort(model.wealth))
+        model.apply_wealth_shock(0.5)
+        assert model.wealth_index is not index
+        assert np.array_equal(model.wealth_index.sorted, np.sort(model.wealth))
+
+    def test_agent_model_slots(self):
+        model = BasicEconomyModel(EconomyParams(num_agents=30, seed=4))
+        model.step()
+        by_slot = {agent.unique_id - 1: agent for agent in model.agents}
+        slots, values = model.wealth_index.top(1)
+        assert by_slot[slots[0]].wealth == values[0] == max(a.wealth for a in model.agents)
+        model.add_citizens([0.0], [1.0])
+        assert model.wealth_index.n == 31
+
+    def test_base_model_needs_index_type(self):
+        try:
+            BaseModel().wealth_index
+            assert False, "Should have raised"
+        except NotImplementedError:
+            pass
+
+
+class TestInequalityReporting:
+    def test_optional_reporters(self):
+        model = BasicEconomyModel(EconomyParams(num_agents=20, seed=42))
+        model.step()
+        assert "Theil" not in model.get_model_data()
+
+        model = BasicEconomyModel(
+            EconomyParams(num_agents=20, seed=42, inequality_reporters=True)
+        )
+        model.run(steps=3)
+        data = model.get_model_data()
+        for name in INEQUALITY_REPORTERS:
+            assert len(data[name]) == 3
+
+    def test_turn_state_fields(self):
+        state = GameEngine(seed=42).advance_turn(PolicySet()).state
+        assert 0 <= state.top_10_share <= 1
+        assert state.theil >= 0
+        assert set(state.wealth_percentiles) == {"p10", "p25", "p50", "p75", "p90"}
@@ -0,0 +1,115 @@
+"""Tests for sparse trade networks."""
+
+import random
+
+import networkx as nx
+import numpy as np
+
+from social_sim.agents.person import PersonAgent
+from social_sim.models.array_economy import ArrayEconomyModel
+from social_sim.models.basic_economy import BasicEconomyModel, EconomyParams, TradeParams
+from social_sim.models.network import (
+    CSRGraph,
+    NetworkParams,
+    barabasi_albert,
+    erdos_renyi,
+    watts_strogatz,
+)
+
+
+def _network_params(kind: str, **kwargs) -> EconomyParams:
+    return EconomyParams(
+        num_agents=200,
+        seed=42,
+        trade=TradeParams(network=NetworkParams(kind=kind), **kwargs),
+    )
+
+
+class TestCSRGraph:
+    def test_from_edges_is_symmetric_and_deduplicated(self):
+        graph = CSRGraph.from_edges(4, np.array([0, 1, 0, 2, 3]), np.array([1, 0, 2, 2, 0]))
+        assert graph.num_edges == 3
+        assert graph.neighbors(0).tolist() == [1, 2, 3]
+        assert graph.neighbors(2).tolist() == [0]
+        assert graph.degrees().tolist() == [3, 1, 1, 1]
+
+    def test_matches_networkx(self):
+        source = nx.karate_club_graph()
+        graph = CSRGraph.from_networkx(source)
+        assert graph.num_edges == source.number_of_edges()
+        for node in source.nodes:
+            assert set(graph.neighbors(node).tolist()) == set(source.neighbors(node))
+
+    def test_sampling_stays_on_neighbors(self):
+        graph = CSRGraph.from_networkx(nx.path_graph(5))
+        rand = random.Random(0)
+        assert {graph.sample_neighbor(rand, 2) for _ in range(50)} == {1, 3}
+        isolated = CSRGraph.from_edges(3, np.array([0]), np.array([1]))
+        assert isolated.sample_neighbor(rand, 2) == -1
+        picks = isolated.sample_neighbors(np.random.default_rng(0), np.arange(3))
+        assert picks.tolist() == [1, 0, -1]
+
+
+class TestGenerators:
+    def test_erdos_renyi_edge_count(self):
+        graph = erdos_renyi(10_000, 6, np.random.default_rng(0))
+        assert graph.num_edges == 30_000
+        assert graph.degrees().mean() == 6.0
+
+    def test_erdos_renyi_small_population_is_complete(self):
+        for n in (3, 4):
+            graph = erdos_renyi(n, 4, np.random.default_rng(0))
+            assert graph.num_edges == n * (n - 1) // 2
+        trade = TradeParams(network=NetworkParams(kind="erdos_renyi"))
+        model = BasicEconomyModel(EconomyParams(num_agents=3, seed=1, trade=trade))
+        assert model.network.num_edges == 3
+
+    def test_small_world_keeps_ring_degree(self):
+        ring = watts_strogatz(1_000, 4, 0.0, np.random.default_rng(0))
+        assert set(ring.degrees().tolist()) == {4}
+        rewired = watts_strogatz(1_000, 4, 0.2, np.random.default_rng(0))
+        assert 3.9 < rewired.degrees().mean() <= 4.0
+
+    def test_scale_free_has_hubs(self):
+        graph = barabasi_albert(20_000, 2, np.random.default_rng(0))
+        degrees = graph.degrees()
+        assert degrees.min() >= 1
+        assert degrees.max() > 20 * degrees.mean()
+        for node in (100, 5_000, 19_999):
+            assert node not in graph.neighbors(node)
+
+
+class TestNetworkTrade:
+    def test_partners_are_neighbors(self):
+        model = BasicEconomyModel(_network_params("small_world"))
+        person = model.agents_of_type(PersonAgent)[0]
+        neighbors = set(model.network.neighbors(person.unique_id - 1).tolist())
+        for _ in range(30):
+            partner = model.sample_partner(person)
+            assert partner.unique_id - 1 in neighbors
+
+    def test_complete_network_builds_no_graph(self):
+        assert BasicEconomyModel(EconomyParams(num_agents=10, seed=1)).network is None
+
+    def test_backends_share_the_network(self):
+        agent_model = BasicEconomyModel(_network_params("scale_free"))
+        array_model = ArrayEconomyModel(_network_params("scale_free"))
+        assert np.array_equal(agent_model.network.indices, array_model.network.indices)
+
+    def test_trade_conserves_wealth(self):
+        for schedule in ("sequential", "synchronous"):
+            model = BasicEconomyModel(_network_params("erdos_renyi", schedule=schedule))
+            array_model = ArrayEconomyModel(_network_params("erdos_renyi", schedule=schedule))
+            model.run(steps=20)
+            array_model.run(steps=20)
+            assert abs(model.get_wealth().sum() - 2000.0) < 1e-6
+            assert abs(array_model.wealth.sum() - 2000.0) < 1e-6
+
+    def test_newcomers_and_removed_people_do_not_trade(self):
+        model = BasicEconomyModel(_network_params("small_world", schedule="synchronous"))
+        model.add_citizens([5.0], [1.0])
+        newcomer = model.agents_of_type(PersonAgent)[-1]
+        assert model.sample_partner(newcomer) is None
+        model.agents_of_type(PersonAgent)[0].remove()
+        model.run(steps=5)
+        assert newcomer.wealth == 5.0
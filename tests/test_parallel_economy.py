@@ -0,0 +1,164 @@
+"""Tests for the shared-memory multi-process backend."""
+
+import numpy as np
+
+from social_sim.analysis.inequality import WealthDistribution
+from social_sim.models.array_economy import ArrayEconomyModel
+from social_sim.core.pipeline import Phase
+from social_sim.models.basic_economy import (
+    ECONOMY_PHASES,
+    DisasterParams,
+    EconomyParams,
+    EducationParams,
+    IncomeParams,
+    TaxParams,
+    TradeParams,
+)
+from social_sim.models.distributions import Distribution
+from social_sim.models.factory import create_economy_model
+from social_sim.models.network import NetworkParams
+from social_sim.models.parallel_economy import (
+    ParallelEconomyModel,
+    block_size,
+    shard_bounds,
+)
+
+
+def _params(**kwargs) -> EconomyParams:
+    defaults = dict(
+        num_agents=301,
+        seed=7,
+        backend="parallel",
+        workers=2,
+        wealth_distribution=Distribution(kind="lognormal", mu=2.0, sigma=1.0),
+    )
+    defaults.update(kwargs)
+    return EconomyParams(**defaults)
+
+
+class TestShardBounds:
+    def test_bounds_cover_population(self):
+        assert shard_bounds(10, 3).tolist() == [0, 3, 6, 10]
+        assert shard_bounds(2, 4).tolist() == [0, 0, 1, 1, 2]
+
+    def test_bounds_align_to_blocks(self):
+        bounds = shard_bounds(5000, 3)
+        assert bounds[0] == 0 and bounds[-1] == 5000
+        assert all(bound % block_size(5000) == 0 for bound in bounds[:-1])
+
+
+class TestParallelEconomy:
+    def test_reductions_match_full_arrays(self):
+        params = _params(
+            income=IncomeParams(enabled=True),
+            tax=TaxParams(enabled=True, ubi_enabled=True),
+        )
+        with ParallelEconomyModel(params) as model:
+            start = model.wealth.sum()
+            model.run(steps=5)
+            data = model.get_model_data()
+            distribution = WealthDistribution(model.wealth)
+            assert abs(data["Gini"][-1] - distribution.gini()) < 1e-12
+            assert abs(data["Total Wealth"][-1] - model.wealth.sum()) < 1e-6
+            assert abs(data["Mean Happiness"][-1] - model.happiness.mean()) < 1e-12
+            # Trade and UBI conserve wealth; only income adds to it.
+            income = data["Total Income"].sum()
+            assert abs(model.wealth.sum() - start - income) < 1e-6
+            assert abs(model.ubi_amount * model.population - model.tax_revenue) < 1e-9
+
+    def test_same_columns_and_seed_reproducibility(self):
+        params = _params(trade=TradeParams(network=NetworkParams(kind="small_world")))
+        with create_economy_model(params) as first, ParallelEconomyModel(params) as second:
+            assert isinstance(first, ParallelEconomyModel)
+            first.run(steps=4)
+            second.run(steps=4)
+            assert np.array_equal(first.wealth, second.wealth)
+        array_model = ArrayEconomyModel(_params(backend="array"))
+        array_model.run(steps=1)
+        assert first.get_model_data().keys() == array_model.get_model_data().keys()
+
+    def test_results_independent_of_worker_count(self):
+        results = []
+        for workers in (1, 3):
+            params = _params(
+                workers=workers,
+                income=IncomeParams(enabled=True),
+                tax=TaxParams(enabled=True, ubi_enabled=True),
+                disaster=DisasterParams(enabled=True, probability=0.5),
+                education=EducationParams(enabled=True),
+                trade=TradeParams(network=NetworkParams(kind="erdos_renyi")),
+            )
+            with ParallelEconomyModel(params) as model:
+                model.run(steps=4)
+                results.append((model.wealth.copy(), model.get_model_data()))
+        (wealth_one, data_one), (wealth_three, data_three) = results
+        assert np.array_equal(wealth_one, wealth_three)
+        for name in data_one:
+            assert np.array_equal(data_one[name], data_three[name]), name
+
+    def test_add_citizens_and_close(self):
+        model = ParallelEconomyModel(_params())
+        model.run(steps=2)
+        model.add_citizens([5.0, 6.0], [1.0, 1.0])
+        assert model.population == 303
+        total = model.wealth.sum()
+        model.step()
+        assert abs(model.wealth.sum() - total) < 1e-6
+        model.close()
+        assert model.population == 303
+        try:
+            model.step()
+            assert False, "Should have raised"
+        except RuntimeError:
+            pass
+
+    def test_phases_follow_the_registry(self):
+        params = _params(tax=TaxParams(enabled=True, ubi_enabled=True))
+        with ParallelEconomyModel(params) as model:
+            assert model.phase_names == tuple(ArrayEconomyModel(params).pipeline.names)
+            model.step()
+            assert model.tax_revenue > 0 and model.ubi_amount > 0
+            params.tax.enabled = False
+            model.compile_phases()
+            assert model.phase_names == ("trade",)
+            assert model.tax_revenue == 0.0
+            total = model.wealth.sum()
+            model.step()
+            assert model.ubi_amount == 0.0
+            assert abs(model.wealth.sum() - total) < 1e-6
+
+    def test_rejects_phases_workers_cannot_run(self):
+        class StimulusModel(ParallelEconomyModel):
+            phases = ECONOMY_PHASES.copy()
+
+        StimulusModel.phases.register(Phase("stimulus", vectorized=lambda m: None))
+        try:
+            StimulusModel(_params()).close()
+            assert False, "Should have raised"
+        except ValueError:
+            pass
+
+    def test_happiness_rule_matches_other_backends(self):
+        for schedule in ("sequential", "synchronous"):
+            trade = TradeParams(
+                schedule=schedule, network=NetworkParams(kind="erdos_renyi", mean_degree=2)
+            )
+            for backend in ("agent", "array", "parallel"):
+                model = create_economy_model(_params(backend=backend, trade=trade))
+                isolated = model.network.degrees() == 0
+                assert isolated.any()
+                model.run(steps=3)
+                happiness = np.asarray(model.get_happiness())[isolated]
+                close = getattr(model, "close", None)
+                if close is not None:
+                    close()
+                assert np.all(happiness == 0.5) == (schedule == "sequential"), backend
+
+    def test_web_app_closes_the_model_it_drops(self):
+        from social_sim.web import app
+
+        model = ParallelEconomyModel(_params())
+        app.current_model = model
+        app._close_current_model()
+        assert app.current_model is None
+        assert model._handle.pool is None
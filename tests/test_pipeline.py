@@ -0,0 +1,87 @@
+"""Tests for the step-phase pipeline."""
+
+from social_sim.core.pipeline import Phase, PhaseRegistry, PhaseTimings
+from social_sim.models.array_economy import ArrayEconomyModel
+from social_sim.models.basic_economy import (
+    ECONOMY_PHASES,
+    BasicEconomyModel,
+    EconomyParams,
+    TaxParams,
+    TradeParams,
+)
+
+
+class TestPhaseRegistry:
+    def test_register_positions(self):
+        registry = PhaseRegistry([Phase("a", scalar="a"), Phase("c", scalar="c")])
+        registry.register(Phase("b", scalar="b"), before="c")
+        registry.register(Phase("d", scalar="d"), after="c")
+        assert registry.names == ["a", "b", "c", "d"]
+        registry.unregister("b")
+        assert registry.names == ["a", "c", "d"]
+
+    def test_invalid_registration(self):
+        registry = PhaseRegistry([Phase("a", scalar="a")])
+        for phase, anchor in [(Phase("a", scalar="a"), None), (Phase("b", scalar="b"), "x")]:
+            try:
+                registry.register(phase, after=anchor)
+                assert False, "Should have raised"
+            except ValueError:
+                pass
+        try:
+            Phase("empty")
+            assert False, "Should have raised"
+        except ValueError:
+            pass
+
+
+class TestEconomyPipeline:
+    def test_disabled_phases_are_not_compiled(self):
+        model = BasicEconomyModel(EconomyParams(num_agents=10, seed=1))
+        assert model.pipeline.names == ["trade"]
+        params = EconomyParams(
+            num_agents=10,
+            seed=1,
+            tax=TaxParams(enabled=True, ubi_enabled=True),
+            trade=TradeParams(schedule="synchronous"),
+        )
+        assert ArrayEconomyModel(params).pipeline.names == ["synchronous_trade", "tax", "ubi"]
+
+    def test_recompile_rebuilds_tax_schedule(self):
+        params = EconomyParams(num_agents=20, seed=1, tax=TaxParams(enabled=True))
+        model = BasicEconomyModel(params)
+        schedule = model.tax_schedule
+        model.step()
+        assert model.tax_schedule is schedule
+        params.tax.brackets[1].rate = 0.4
+        model.compile_phases()
+        assert model.tax_schedule.rates.tolist() == [0.0, 0.4, 0.2, 0.3]
+
+    def test_recompile_resets_disabled_outputs(self):
+        params = EconomyParams(num_agents=20, seed=1, tax=TaxParams(enabled=True))
+        model = ArrayEconomyModel(params)
+        model.step()
+        assert model.tax_revenue > 0
+        params.tax.enabled = False
+        model.compile_phases()
+        assert model.tax_revenue == 0.0
+        model.step()
+        assert model.tax_revenue == 0.0
+
+    def test_custom_phase_and_timing_hook(self):
+        class StimulusModel(ArrayEconomyModel):
+            phases = ECONOMY_PHASES.copy()
+
+        def stimulus(model):
+            model.wealth += 1.0
+
+        StimulusModel.phases.register(Phase("stimulus", vectorized=stimulus), before="trade")
+        model = StimulusModel(EconomyParams(num_agents=10, seed=1))
+        timings = PhaseTimings()
+        model.pipeline.on_phase = timings
+        model.compile_phases()
+        start = model.wealth.sum()
+        model.run(steps=3)
+        assert abs(model.wealth.sum() - start - 30.0) < 1e-9
+        assert timings.calls == {"stimulus": 3, "trade": 3}
+        assert "stimulus" not in ECONOMY_PHASES.names
@@ -0,0 +1,66 @@
+"""Tests for the columnar time-series recorder."""
+
+import numpy as np
+
+from social_sim.core.recorder import ColumnarRecorder
+from social_sim.models.array_economy import ArrayEconomyModel
+from social_sim.models.basic_economy import BasicEconomyModel, EconomyParams
+
+
+class TestColumnarRecorder:
+    def test_grows_by_doubling(self):
+        recorder = ColumnarRecorder(["A"], capacity=2)
+        for step in range(5):
+            recorder.append(step, [float(step)])
+        assert recorder.capacity == 8
+        assert recorder.model_column("A").tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert recorder.steps.tolist() == [0, 1, 2, 3, 4]
+
+    def test_reserve_preallocates(self):
+        recorder = ColumnarRecorder(["A"], ["W"], capacity=1)
+        recorder.reserve(100, agents=50)
+        assert recorder.capacity == 100
+        assert recorder.agent_capacity == 50
+
+    def test_agent_rows_widen_with_nan_fill(self):
+        recorder = ColumnarRecorder([], ["W"])
+        recorder.append(1, [], {"W": np.array([1.0, 2.0])})
+        recorder.append(2, [], {"W": np.array([3.0, 4.0, 5.0])})
+        matrix = recorder.agent_matrix("W")
+        assert matrix.shape == (2, 3)
+        assert np.isnan(matrix[0, 2])
+        assert matrix[1].tolist() == [3.0, 4.0, 5.0]
+
+    def test_accessors_are_views(self):
+        model = BasicEconomyModel(EconomyParams(num_agents=10, seed=42))
+        model.run(steps=5)
+        gini = model.get_model_data()["Gini"]
+        wealth = model.get_agent_matrix("Wealth")
+        assert np.shares_memory(gini, model.recorder._model)
+        assert np.shares_memory(wealth, model.recorder._agents["Wealth"])
+        assert wealth.shape == (5, 10)
+
+
+class TestModelRecording:
+    def test_agent_data_long_form(self):
+        model = BasicEconomyModel(EconomyParams(num_agents=3, seed=1))
+        model.run(steps=2)
+        data = model.get_agent_data()
+        assert data["Step"].tolist() == [1, 1, 1, 2, 2, 2]
+        assert data["AgentID"].tolist() == [1, 2, 3, 1, 2, 3]
+        assert abs(data["Wealth"][:3].sum() - 30.0) < 1e-9
+
+    def test_added_agents_appear_later(self):
+        model = ArrayEconomyModel(EconomyParams(num_agents=3, seed=1))
+        model.step()
+        model.add_citizens([5.0], [1.0])
+        model.step()
+        data = model.get_agent_data()
+        assert data["Step"].tolist() == [1, 1, 1, 2, 2, 2, 2]
+        assert data["AgentID"].tolist() == [1, 2, 3, 1, 2, 3, 4]
+
+    def test_agent_dtype_configurable(self):
+        model = BasicEconomyModel(EconomyParams(num_agents=3, seed=1))
+        model.setup_datacollector(agent_reporters={"Wealth": "wealth"}, agent_dtype=np.float32)
+        model.step()
+        assert model.get_agent_matrix("Wealth").dtype == np.float32
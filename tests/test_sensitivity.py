@@ -0,0 +1,74 @@
+"""Tests for Morris screening, Sobol' indices and the sensitivity driver."""
+
+import numpy as np
+
+from social_sim.analysis.sensitivity import (
+    morris_design,
+    morris_indices,
+    saltelli_design,
+    sobol_indices,
+)
+from social_sim.models.sensitivity import ParameterRange, SensitivityAnalysis, default_base
+
+
+def ishigami(unit):
+    x = -np.pi + 2 * np.pi * unit
+    return np.sin(x[:, 0]) + 7 * np.sin(x[:, 1]) ** 2 + 0.1 * x[:, 2] ** 4 * np.sin(x[:, 0])
+
+
+class TestIndices:
+    def test_morris_linear_effects(self):
+        design = morris_design(3, 20, rng=np.random.default_rng(0))
+        assert design.points.shape == (80, 3)
+        assert design.points.min() >= 0 and design.points.max() <= 1
+        outputs = 3 * design.points[:, 0] - design.points[:, 2]
+        indices = morris_indices(design, outputs, ["a", "b", "c"], resamples=100)
+        assert np.allclose(indices.mu, [3.0, 0.0, -1.0])
+        assert np.allclose(indices.mu_star, [3.0, 0.0, 1.0])
+        assert np.allclose(indices.sigma, 0.0)
+
+    def test_sobol_ishigami(self):
+        rng = np.random.default_rng(0)
+        design = saltelli_design(3, 4096, rng)
+        assert design.shape == (4096 * 5, 3)
+        indices = sobol_indices(ishigami(design), ["x1", "x2", "x3"], rng=rng)
+        assert np.allclose(indices.first_order, [0.314, 0.442, 0.0], atol=0.05)
+        assert np.allclose(indices.total, [0.558, 0.442, 0.244], atol=0.05)
+        low, high = indices.first_order_ci[1]
+        assert low < 0.442 < high
+
+    def test_invalid_design(self):
+        try:
+            morris_design(3, 10, levels=3)
+            assert False, "Should have raised"
+        except ValueError:
+            pass
+
+
+class TestSensitivityAnalysis:
+    def test_morris_ranks_income_first(self):
+        analysis = SensitivityAnalysis(steps=20, workers=1, resamples=100)
+        result = analysis.morris(trajectories=4)
+        assert result.evaluations == 4 * (len(analysis.ranges) + 1)
+        assert result.ranking("Gini")[0] == "income.base_income"
+        again = SensitivityAnalysis(steps=20, workers=1, resamples=100).morris(trajectories=4)
+        assert again.morris["Gini"].mu_star == result.morris["Gini"].mu_star
+
+    def test_sobol_with_replicates(self):
+        ranges = [
+            ParameterRange(name="income.base_income", low=0.0, high=3.0),
+            ParameterRange(name="disaster.damage_rate", low=0.0, high=0.5),
+        ]
+        analysis = SensitivityAnalysis(
+            default_base(), ranges, steps=10, replicates=2, workers=1, resamples=100
+        )
+        result = analysis.sobol(samples=8)
+        assert result.evaluations == 8 * 4 * 2
+        assert len(result.sobol["Mean Happiness"].total_ci) == 2
+
+    def test_unknown_parameter(self):
+        try:
+            SensitivityAnalysis(ranges=[ParameterRange(name="tax.nope", low=0, high=1)])
+            assert False, "Should have raised"
+        except ValueError:
+            pass
@@ -0,0 +1,56 @@
+"""Tests for early stopping of model runs."""
+
+from social_sim.core.stopping import ConvergenceMonitor, StoppingCriteria
+from social_sim.models.array_economy import ArrayEconomyModel
+from social_sim.models.basic_economy import BasicEconomyModel, EconomyParams, IncomeParams
+
+
+class TestConvergenceMonitor:
+    def test_needs_full_window_within_tolerance(self):
+        monitor = ConvergenceMonitor(StoppingCriteria(metrics=["x"], window=3, tolerance=0.01))
+        assert not monitor.observe([1.0])
+        assert not monitor.observe([1.5])
+        assert not monitor.observe([1.505])
+        assert monitor.observe([1.5])
+        # Large values use a relative tolerance.
+        monitor = ConvergenceMonitor(StoppingCriteria(metrics=["x"], window=2, tolerance=0.01))
+        monitor.observe([1000.0])
+        assert monitor.observe([1009.0])
+
+
+class TestRunStopping:
+    def test_completed_without_criteria(self):
+        model = ArrayEconomyModel(EconomyParams(num_agents=20, seed=1))
+        summary = model.run(steps=5)
+        assert (summary.reason, summary.step, summary.steps_run) == ("completed", 5, 5)
+        assert model.last_run == summary
+
+    def test_converges_on_steady_state(self):
+        # Nobody has wealth to trade, so every metric is constant.
+        params = EconomyParams(num_agents=20, seed=1, initial_wealth=0.0)
+        model = ArrayEconomyModel(params)
+        summary = model.run(steps=100, stopping=StoppingCriteria(window=5, min_steps=8))
+        assert (summary.reason, summary.step) == ("converged", 8)
+        # The final state is still collected.
+        assert model.get_collected_steps()[-1] == 8
+
+    def test_growth_does_not_converge_and_budgets_apply(self):
+        params = EconomyParams(num_agents=20, seed=1, income=IncomeParams(enabled=True))
+        model = BasicEconomyModel(params)
+        model.stopping = StoppingCriteria(window=3, max_steps=7)
+        summary = model.run(steps=50)
+        assert (summary.reason, summary.steps_run) == ("step_budget", 7)
+
+        summary = model.run(steps=50, stopping=StoppingCriteria(metrics=[], max_seconds=1e-9))
+        assert (summary.reason, summary.steps_run, summary.step) == ("time_budget", 0, 7)
+
+        model.running = False
+        assert model.run(steps=3).reason == "stopped"
+
+    def test_unknown_metric(self):
+        model = ArrayEconomyModel(EconomyParams(num_agents=5, seed=1))
+        try:
+            model.run(steps=1, stopping=StoppingCriteria(metrics=["Nope"]))
+            assert False, "Should have raised"
+        except ValueError:
+            pass
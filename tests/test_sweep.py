@@ -0,0 +1,96 @@
+"""Tests for parameter sweeps and the sweep job manager."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from social_sim.models.basic_economy import EconomyParams
+from social_sim.models.sweep import SweepManager, SweepSpec, apply_overrides
+
+
+class TestSweepSpec:
+    def test_overrides(self):
+        params = apply_overrides(
+            EconomyParams(),
+            {"tax.enabled": True, "tax.brackets": [{"threshold": 0, "rate": 0.5}]},
+        )
+        assert params.tax.enabled
+        assert params.tax.brackets[0].rate == 0.5
+        params = apply_overrides(EconomyParams(), {"tax.brackets.2.rate": 0.4})
+        assert params.tax.brackets[2].rate == 0.4
+        bad_overrides = (
+            {"tax.nope": 1},
+            {"tax.brackets.9.rate": 0.1},
+            {"num_agents.x": 1},
+            {"income.base_income": "lots"},
+        )
+        for bad in bad_overrides:
+            try:
+                apply_overrides(EconomyParams(), bad)
+                assert False, "Should have raised"
+            except ValueError:
+                pass
+
+    def test_grid_variations_and_replicates(self):
+        spec = SweepSpec(
+            base=EconomyParams(seed=10),
+            grid={"income.base_income": [1.0, 2.0], "disaster.probability": [0.0, 0.1]},
+            variations=[{"tax.enabled": False}, {"tax.enabled": True}],
+            replicates=2,
+        )
+        configurations = spec.configurations()
+        assert len(configurations) == 16
+        assert configurations[0].seed == 10 and configurations[1].seed == 11
+        assert sum(params.tax.enabled for params in configurations) == 8
+
+
+class TestSweepManager:
+    def test_runs_and_pages(self):
+        manager = SweepManager(executor=ThreadPoolExecutor(2))
+        spec = SweepSpec(
+            base=EconomyParams(num_agents=20, seed=1, backend="array"),
+            grid={"income.enabled": [True], "income.base_income": [0.5, 1.0, 2.0]},
+            steps=5,
+        )
+        job = manager.submit(spec)
+        for future in job.futures:
+            future.result()
+        status = job.status()
+        assert status.state == "completed"
+        assert status.completed == 3 and status.finished is not None
+        page = job.page(offset=1, limit=5)
+        assert [point.index for point in page] == [1, 2]
+        assert page[0].overrides["income.base_income"] == 1.0
+        assert page[0].summary.steps_run == 5
+        assert "Gini" in page[0].metrics
+
+    def test_cancel_drops_queued_runs(self):
+        gate = threading.Event()
+        executor = ThreadPoolExecutor(1)
+        executor.submit(gate.wait)
+        manager = SweepManager(executor=executor)
+        job = manager.submit(SweepSpec(grid={"income.base_income": [1.0, 2.0]}, steps=2))
+        assert job.status().state == "queued"
+        manager.cancel(job.sweep_id)
+        gate.set()
+        executor.shutdown(wait=True)
+        status = job.status()
+        assert status.state == "cancelled" and status.completed == 0
+        assert manager.remove(job.sweep_id)
+        assert manager.get(job.sweep_id) is None
+
+    def test_app_lifespan_stops_the_pool(self):
+        from fastapi.testclient import TestClient
+
+        from social_sim.web.app import app
+
+        spec = {"base": {"num_agents": 10, "seed": 1}, "steps": 2}
+        with TestClient(app) as client:
+            response = client.post("/api/v1/sweeps", json=spec)
+            assert response.status_code == 202
+            manager = app.state.sweeps
+            job = manager.get(response.json()["sweep_id"])
+            for future in job.futures:
+                future.result()
+            sweep = client.get(f"/api/v1/sweeps/{job.sweep_id}").json()
+            assert sweep["state"] == "completed"
+        assert manager._executor is None
@@ -0,0 +1,64 @@
+"""Tests for the vectorized tax engine."""
+
+import numpy as np
+
+from social_sim.game.engine import GameEngine
+from social_sim.game.schemas import PolicySet, TaxBracketInput
+from social_sim.models.basic_economy import TaxBracket
+from social_sim.models.tax import TaxSchedule
+
+BRACKETS = [
+    TaxBracket(threshold=0, rate=0.0),
+    TaxBracket(threshold=10, rate=0.1),
+    TaxBracket(threshold=30, rate=0.2),
+    TaxBracket(threshold=50, rate=0.3),
+]
+
+
+class TestFlatMode:
+    def test_matches_bracket_walk(self):
+        wealth = np.array([-1.0, 0.0, 5.0, 10.0, 29.9, 30.0, 49.0, 50.0, 200.0])
+        taxes = TaxSchedule(BRACKETS).compute(wealth)
+
+        expected = []
+        for w in wealth:
+            rate = 0.0
+            for bracket in reversed(BRACKETS):
+                if w >= bracket.threshold:
+                    rate = bracket.rate
+                    break
+            expected.append(w * rate if rate > 0 and w > 0 else 0.0)
+        assert np.allclose(taxes, expected)
+
+    def test_unsorted_brackets(self):
+        schedule = TaxSchedule(list(reversed(BRACKETS)))
+        assert np.allclose(schedule.compute(np.array([40.0])), [8.0])
+
+    def test_below_lowest_threshold(self):
+        schedule = TaxSchedule([TaxBracket(threshold=10, rate=0.5)])
+        assert np.allclose(schedule.compute(np.array([5.0, 20.0])), [0.0, 10.0])
+
+
+class TestMarginalMode:
+    def test_marginal_amounts(self):
+        schedule = TaxSchedule(BRACKETS, mode="marginal")
+        taxes = schedule.compute(np.array([5.0, 20.0, 40.0, 100.0]))
+        # 20: 10 * 0.1; 40: 20 * 0.1 + 10 * 0.2; 100: 2 + 4 + 50 * 0.3
+        assert np.allclose(taxes, [0.0, 1.0, 4.0, 21.0])
+
+    def test_marginal_never_exceeds_flat(self):
+        wealth = np.linspace(0, 500, 1001)
+        flat = TaxSchedule(BRACKETS).compute(wealth)
+        marginal = TaxSchedule(BRACKETS, mode="marginal").compute(wealth)
+        assert np.all(marginal <= flat + 1e-12)
+
+    def test_game_policy_selects_mode(self):
+        brackets = [TaxBracketInput(threshold=0, rate=0.1), TaxBracketInput(threshold=10, rate=0.5)]
+        flat = GameEngine(seed=42).advance_turn(
+            PolicySet(tax_enabled=True, tax_brackets=brackets)
+        )
+        marginal = GameEngine(seed=42).advance_turn(
+            PolicySet(tax_enabled=True, tax_brackets=brackets, tax_mode="marginal")
+        )
+        assert marginal.state.tax_revenue > 0
+        assert marginal.state.mean_wealth > flat.state.mean_wealth
@@ -0,0 +1,54 @@
+"""Tests for the trade phase schedules."""
+
+import numpy as np
+
+from social_sim.models.array_economy import ArrayEconomyModel
+from social_sim.models.basic_economy import BasicEconomyModel, EconomyParams, TradeParams
+from social_sim.models.trade import draw_partners, exchange_synchronously
+
+
+class TestTradeHelpers:
+    def test_partners_never_self(self):
+        rng = np.random.default_rng(0)
+        partners = draw_partners(rng, 1000)
+        assert not np.any(partners == np.arange(1000))
+        assert partners.min() >= 0
+        assert partners.max() < 1000
+
+    def test_exchange_uses_start_of_step_wealth(self):
+        wealth = np.array([0.5, 3.0, 0.0])
+        partners = np.array([1, 0, 0])
+        new_wealth = exchange_synchronously(wealth, partners)
+        assert np.allclose(new_wealth, [1.0, 2.5, 0.0])
+
+    def test_exchange_scatter_adds_conflicts(self):
+        wealth = np.array([5.0, 5.0, 5.0, 5.0])
+        partners = np.array([3, 3, 3, 0])
+        new_wealth = exchange_synchronously(wealth, partners)
+        assert np.allclose(new_wealth, [5.0, 4.0, 4.0, 7.0])
+        assert abs(new_wealth.sum() - wealth.sum()) < 1e-12
+
+
+class TestSynchronousSchedule:
+    def test_agent_backend_conserves_wealth(self):
+        params = EconomyParams(
+            num_agents=50, seed=42, trade=TradeParams(schedule="synchronous")
+        )
+        model = BasicEconomyModel(params)
+        model.run(steps=50)
+        wealth = model.get_wealth()
+        assert abs(wealth.sum() - 500.0) < 1e-6
+        assert wealth.min() >= 0
+
+    def test_array_backend_increases_gini(self):
+        params = EconomyParams(
+            num_agents=200, seed=42, trade=TradeParams(schedule="synchronous")
+        )
+        model = ArrayEconomyModel(params)
+        model.run(steps=100)
+        data = model.get_model_data()
+        assert data["Gini"][-1] > data["Gini"][0]
+        assert abs(model.wealth.sum() - 2000.0) < 1e-6
+
+    def test_sequential_is_default(self):
+        assert EconomyParams().trade.schedule == "sequential"
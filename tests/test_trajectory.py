@@ -0,0 +1,66 @@
+"""Tests for memory-mapped agent trajectories."""
+
+import numpy as np
+
+from social_sim.core.trajectory import MemmapTrajectory, read_archive
+from social_sim.models.array_economy import ArrayEconomyModel
+from social_sim.models.basic_economy import BasicEconomyModel, EconomyParams
+
+
+class TestMemmapTrajectory:
+    def test_append_grows_rows_and_agents(self, tmp_path):
+        trajectory = MemmapTrajectory(tmp_path, ["x"], capacity=1, agents=2)
+        trajectory.append(0, {"x": np.array([1.0, 2.0])})
+        trajectory.append(1, {"x": np.array([3.0, 4.0, 5.0])})
+        trajectory.append(2, {})
+        matrix = trajectory.matrix("x")
+        assert matrix.dtype == np.float32 and matrix.shape == (3, 3)
+        assert np.isnan(matrix[0, 2]) and np.isnan(matrix[2]).all()
+        assert matrix[1].tolist() == [3.0, 4.0, 5.0]
+        assert trajectory.steps.tolist() == [0, 1, 2]
+
+    def test_reopen_and_archive(self, tmp_path):
+        trajectory = MemmapTrajectory(tmp_path / "run", ["a", "b"])
+        for step in range(10):
+            trajectory.append(step, {"a": np.full(4, step), "b": np.arange(4) * step})
+        trajectory.flush()
+
+        reopened = MemmapTrajectory.open(tmp_path / "run")
+        assert isinstance(reopened.matrix("a"), np.memmap)
+        assert np.array_equal(reopened.matrix("b"), trajectory.matrix("b"))
+
+        archive = tmp_path / "run.npz"
+        trajectory.archive(archive, chunk_rows=3)
+        assert np.array_equal(read_archive(archive, "a"), trajectory.matrix("a"))
+        assert np.array_equal(read_archive(archive, "b", 2, 7), trajectory.matrix("b")[2:7])
+
+
+class TestModelTrajectories:
+    def test_array_model_history_on_disk(self, tmp_path):
+        model = ArrayEconomyModel(EconomyParams(num_agents=30, seed=2))
+        model.run(steps=2)
+        in_memory = model.get_agent_matrix("Wealth").copy()
+        model.record_trajectories(tmp_path)
+        model.run(steps=5)
+        wealth = model.get_agent_matrix("Wealth")
+        assert wealth.shape == (7, 30)
+        assert np.array_equal(wealth[:2], in_memory.astype(np.float32))
+        assert np.allclose(wealth[-1], model.wealth, rtol=1e-6)
+        assert MemmapTrajectory.open(tmp_path).rows == 7
+
+    def test_agent_data_reads_trajectory(self, tmp_path):
+        model = BasicEconomyModel(EconomyParams(num_agents=10, seed=2))
+        model.record_trajectories(tmp_path)
+        model.run(steps=3)
+        data = model.get_agent_data()
+        assert len(data["Step"]) == 30
+        assert set(data) == {"Step", "AgentID", "Wealth", "Happiness"}
+
+    def test_requires_agent_reporters(self, tmp_path):
+        model = ArrayEconomyModel(EconomyParams(num_agents=5, seed=2))
+        model.setup_datacollector(model_reporters={"Mean Wealth": "mean_wealth"})
+        try:
+            model.record_trajectories(tmp_path)
+            assert False, "Should have raised"
+        except ValueError:
+            pass